@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+# Find which verb, tense, person and form a conjugated word comes from
+#
+# Every form of every verb given is generated with the normal rules and stored in a map from the form
+# back to the verb and cell it came from. Analytic forms are also stored without their pronoun, so
+# "ní léimeann" finds all the persons "ní léimeann ..." could be.
+
+import reimnigh
+from reimnigh import Taifead
+
+
+# tidy up a form so it can be looked up
+def normalaigh(foirm: str) -> str:
+	return " ".join(foirm.casefold().split())
+
+
+class Anailíseoir:
+	def __init__(self, briathra=()):
+		self.briathra = []  # every verb added, in order
+		self._uimhreacha_briathra = {}
+		# each form maps to one analysis or a tuple of them
+		# an analysis is stored as a single int: verb number * reimnigh.líon_ceall + cell number
+		self._innéacs = {}
+		self.cuir_le(briathra)
+
+	def __len__(self):
+		return len(self._innéacs)
+
+	# add more verbs to the index
+	def cuir_le(self, briathra):
+		briathra = [b for b in dict.fromkeys(briathra) if b not in self._uimhreacha_briathra]
+		for briathar in briathra:
+			self._uimhreacha_briathra[briathar] = len(self.briathra)
+			self.briathra.append(briathar)
+		for mumhan in False, True:
+			for taifid in reimnigh.taifid_iomlána(briathra, mumhan=mumhan):
+				for t in taifid:
+					anailís = (self._uimhreacha_briathra[t.briathar] * reimnigh.líon_ceall
+					           + reimnigh.uimhir_cille(t.aimsir, t.pearsa, t.foirm, mumhan))
+					for foirm in self._leaganacha(t):
+						self._cuir(normalaigh(foirm), anailís)
+
+	# the ways a form can be written: as it is, and without its pronoun if it has one
+	@staticmethod
+	def _leaganacha(t: Taifead):
+		yield t.leagan
+		forainm = t.pearsa.forainm
+		if forainm and t.leagan.endswith(' ' + forainm):
+			gan_forainm = t.leagan[:-len(forainm) - 1]
+			yield gan_forainm
+			if '/' in forainm:
+				for rogha in forainm.split('/'):
+					yield f"{gan_forainm} {rogha}"
+
+	def _cuir(self, foirm: str, anailís: int):
+		reatha = self._innéacs.get(foirm)
+		if reatha is None:
+			self._innéacs[foirm] = anailís
+		elif isinstance(reatha, int):
+			if reatha != anailís:
+				self._innéacs[foirm] = (reatha, anailís)
+		elif anailís not in reatha:
+			self._innéacs[foirm] = reatha + (anailís,)
+
+	# every analysis of a form, as records with the form as it was given
+	def anailísigh(self, foirm: str) -> list:
+		anailísí = self._innéacs.get(normalaigh(foirm), ())
+		if isinstance(anailísí, int):
+			anailísí = (anailísí,)
+		torthaí = []
+		for anailís in anailísí:
+			uimhir_briathair, uimhir_cille = divmod(anailís, reimnigh.líon_ceall)
+			aimsir, pearsa, foirm_bhriathair, mumhan = reimnigh.cill(uimhir_cille)
+			torthaí.append(Taifead(self.briathra[uimhir_briathair], aimsir, pearsa, foirm_bhriathair, mumhan, foirm))
+		return torthaí
+
+
+if __name__ == '__main__':
+	from argparse import ArgumentParser
+
+	parser = ArgumentParser()
+	parser.add_argument('briathra', help='comhad le briathar amháin ar gach líne')
+	parser.add_argument('foirmeacha', nargs='+', help='na foirmeacha le hanailísiú')
+	args = parser.parse_args()
+
+	with open(args.briathra, encoding='utf-8') as comhad:
+		anailíseoir = Anailíseoir(reimnigh.léigh_briathra(comhad))
+	for foirm in args.foirmeacha:
+		print(foirm)
+		for t in anailíseoir.anailísigh(foirm):
+			print(f"    {t.briathar} {t.aimsir.name} {t.pearsa.name} {t.foirm.name}{t.mumhan and ' mumhan' or ''}")
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+# Conjugation daemon
+#
+# Keeps the rule tables and caches loaded and answers requests over a Unix domain socket or a TCP port
+# on localhost, so tools that conjugate a verb at a time don't have to set everything up every time.
+#
+# The protocol is one JSON object per line each way. A request looks like
+#   {"briathar": "bris", "aimsirí": ["chaite"], "pearsana": ["céad_uatha"], "foirmeacha": ["dhearfach"],
+#    "mumhan": false, "aibhsigh": false}
+# where everything but "briathar" is optional and leaving out a list means all of them. The answer is
+#   {"toradh": [{"ainm": "an aimsir chaite", "pearsana": [["bhris mé"]]}]}
+# in the same shape as réimnigh() returns, or {"earráid": "..."} if something went wrong. With "aibhsigh"
+# the forms have ANSI highlights in them. With "míreanna" each form is instead an object giving the
+# parts of the form as in reimnigh.LeaganRoinnte
+#   {"leagan": "bhris mé", "míreanna": [["réimír", 0, 0], ["céad_litir", 0, 1], ["séimhiú", 1, 2], ...]}
+#
+#   python deamhan.py freastail [--soicéad COSÁN | --tcp PORT]
+#   python deamhan.py cliant [roghanna reimnigh.py]
+#
+# The client takes the same options as reimnigh.py and prints the same thing. It finds the daemon through
+# the REIMNIGH_DEAMHAN environment variable (a socket path or a port number, the default socket otherwise)
+# and does the work itself if no daemon is running, or if any option other than those in roghanna_deamhain
+# is given.
+
+import json
+from os import environ, getuid, path, unlink
+import socket
+import socketserver
+from tempfile import gettempdir
+import reimnigh
+from reimnigh import FoghaAimsire, FoghaPearsan, FoghaFoirme
+
+
+# where the daemon listens unless told otherwise
+def seoladh_réamhshocraithe():
+	luach = environ.get('REIMNIGH_DEAMHAN')
+	if luach and luach.isdigit():
+		return ('127.0.0.1', int(luach))
+	return luach or path.join(environ.get('XDG_RUNTIME_DIR') or gettempdir(), f"reimnigh-{getuid()}.sock")
+
+
+# answer one request
+def freagair(iarratas: dict) -> dict:
+	try:
+		briathar = iarratas['briathar']
+		if not isinstance(briathar, str) or not briathar:
+			raise ValueError("briathar must be a non-empty string")
+		aimsirí = [FoghaAimsire[a] for a in iarratas.get('aimsirí') or FoghaAimsire.__members__]
+		pearsana = [FoghaPearsan[p] for p in iarratas.get('pearsana') or FoghaPearsan.__members__]
+		foirmeacha = [FoghaFoirme[f] for f in iarratas.get('foirmeacha') or FoghaFoirme.__members__]
+		mumhan = bool(iarratas.get('mumhan'))
+		míreanna = bool(iarratas.get('míreanna'))
+		aibhsigh = míreanna or bool(iarratas.get('aibhsigh'))
+	except KeyError as e:
+		return {'earráid': f"unknown or missing option: {e}"}
+	except (TypeError, ValueError) as e:
+		return {'earráid': str(e)}
+	# some strings can't be conjugated at all, e.g. "b" or "igh"
+	try:
+		if len(aimsirí) == len(pearsana) == len(foirmeacha) == 1:
+			leagan = reimnigh.réimnigh_cill(briathar, aimsirí[0], pearsana[0], foirmeacha[0], mumhan, aibhsigh)
+			toradh = [{'ainm': aimsirí[0].ainm, 'pearsana': [leagan and [leagan] or []]}]
+		else:
+			toradh = reimnigh.réimnigh(briathar, aimsirí, pearsana, foirmeacha, mumhan, aibhsigh)
+	except Exception as e:
+		return {'earráid': f"cannot conjugate {briathar!r}: {type(e).__name__}: {e}"}
+	if aibhsigh:
+		def formáid(leagan):
+			if míreanna:
+				return {'leagan': str(leagan), 'míreanna': leagan.míreanna}
+			return reimnigh.rindreáil_ansi(leagan)
+
+		toradh = [{'ainm': a['ainm'], 'pearsana': [[formáid(l) for l in ró] for ró in a['pearsana']]} for a in toradh]
+	return {'toradh': toradh}
+
+
+class _Láimhseálaí(socketserver.StreamRequestHandler):
+	def handle(self):
+		for líne in self.rfile:
+			if not líne.strip():
+				continue
+			try:
+				iarratas = json.loads(líne)
+				if not isinstance(iarratas, dict):
+					raise ValueError("request must be a JSON object")
+			except ValueError as e:
+				freagra = {'earráid': f"bad request: {e}"}
+			else:
+				freagra = freagair(iarratas)
+			self.wfile.write(json.dumps(freagra, ensure_ascii=False).encode('utf-8') + b"\n")
+			self.wfile.flush()
+
+
+class _FreastalaíUnix(socketserver.ThreadingUnixStreamServer):
+	daemon_threads = True
+
+
+class _FreastalaíTCP(socketserver.ThreadingTCPServer):
+	daemon_threads = True
+	allow_reuse_address = True
+
+
+# make a server listening on a socket path or a (host, port) pair
+def freastalaí(seoladh):
+	reimnigh.faigh_rialacha()  # build the rules now rather than on the first request
+	if isinstance(seoladh, tuple):
+		return _FreastalaíTCP(seoladh, _Láimhseálaí)
+	if path.exists(seoladh):
+		# only clear away the socket if nothing's listening on it any more
+		try:
+			with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+				s.connect(seoladh)
+		except OSError:
+			unlink(seoladh)
+		else:
+			raise OSError(f"a daemon is already listening on {seoladh}")
+	return _FreastalaíUnix(seoladh, _Láimhseálaí)
+
+
+# A connection to a running daemon
+class Cliant:
+	def __init__(self, seoladh=None, teorainn_ama: float = 10):
+		seoladh = seoladh or seoladh_réamhshocraithe()
+		if isinstance(seoladh, tuple):
+			self._soicéad = socket.create_connection(seoladh, timeout=teorainn_ama)
+		else:
+			self._soicéad = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+			try:
+				self._soicéad.settimeout(teorainn_ama)
+				self._soicéad.connect(seoladh)
+			except OSError:
+				self._soicéad.close()
+				raise
+		self._comhad = self._soicéad.makefile('rwb')
+
+	def close(self):
+		self._comhad.close()
+		self._soicéad.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *_):
+		self.close()
+
+	# send a request and wait for the answer
+	def iarr(self, **iarratas) -> dict:
+		self._comhad.write(json.dumps(iarratas, ensure_ascii=False).encode('utf-8') + b"\n")
+		self._comhad.flush()
+		líne = self._comhad.readline()
+		if not líne:
+			raise ConnectionError("the daemon closed the connection")
+		return json.loads(líne)
+
+	# conjugate a verb with the same arguments as reimnigh.réimnigh()
+	def réimnigh(self, briathar: str, aimsirí: list = FoghaAimsire, pearsana: list = FoghaPearsan,
+	             foirmeacha: list = FoghaFoirme, mumhan: bool = False, aibhsigh: bool = False):
+		freagra = self.iarr(briathar=briathar, aimsirí=[a.name for a in aimsirí], pearsana=[p.name for p in pearsana],
+		                    foirmeacha=[f.name for f in foirmeacha], mumhan=mumhan, aibhsigh=aibhsigh)
+		if 'earráid' in freagra:
+			raise ValueError(freagra['earráid'])
+		return freagra['toradh']
+
+
+# the options of reimnigh.py that the daemon can deal with: which forms to give, Munster forms and highlighting
+roghanna_deamhain = frozenset(['briathar', 'c', 'g', 'l', 'f', 'F', 'o', 'O', '1', '2', '3', '0', 'u', 'i', 'd', 'D',
+                               'C', 'm', 'a'])
+
+
+# behave like reimnigh.py, but get the conjugation from the daemon if one is running
+def cliant(argv: list = None):
+	parsálaí = reimnigh.déan_parsálaí()
+	args = parsálaí.parse_args(argv)
+	# only single verbs with no other options go through the daemon, everything else is done here
+	# so that no option, including any added to reimnigh.py later, is silently ignored
+	eile = [ainm for ainm, luach in vars(args).items()
+	        if ainm not in roghanna_deamhain and luach != parsálaí.get_default(ainm)]
+	if args.briathar is None or eile:
+		return reimnigh.príomh(argv)
+	aimsirí, pearsana, foirmeacha = reimnigh.roghanna(args)
+	try:
+		with Cliant() as c:
+			toradh = c.réimnigh(args.briathar, aimsirí, pearsana, foirmeacha, args.m, args.a)
+	except OSError:
+		return reimnigh.príomh(argv)
+	reimnigh.priontáil_toradh(toradh, args.a)
+
+
+if __name__ == '__main__':
+	import sys
+
+	if sys.argv[1:2] == ['cliant']:
+		cliant(sys.argv[2:])
+		sys.exit()
+
+	from argparse import ArgumentParser
+
+	parser = ArgumentParser()
+	fochoimirc = parser.add_subparsers(dest='ordú', required=True)
+	freastal = fochoimirc.add_parser('freastail', help='tosaítear an deamhan')
+	freastal.add_argument('--soicéad', metavar='COSÁN', help='éistear ar an soicéad Unix seo')
+	freastal.add_argument('--tcp', metavar='PORT', type=int, help='éistear ar an bport TCP seo ar localhost')
+	fochoimirc.add_parser('cliant', help='réimnítear briathar leis an deamhan, leis na roghanna céanna le reimnigh.py')
+	args = parser.parse_args()
+
+	import signal
+	signal.signal(signal.SIGTERM, lambda *_: sys.exit())  # clean up on kill as well as ctrl-c
+
+	seoladh = args.tcp and ('127.0.0.1', args.tcp) or args.soicéad or seoladh_réamhshocraithe()
+	with freastalaí(seoladh) as f:
+		try:
+			f.serve_forever()
+		except KeyboardInterrupt:
+			pass
+		finally:
+			if not isinstance(seoladh, tuple):
+				unlink(seoladh)
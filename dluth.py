@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+# Compact storage for many full paradigms
+#
+# réimnigh() gives a list of dicts of lists of lists of strings, which is handy for one verb but costs a
+# lot of memory per form when many paradigms are kept around. A Stór keeps every form as UTF-8 in one
+# shared buffer, with each distinct form stored once, and each paradigm is a fixed run of cells in one
+# shared array of string numbers, in the same order as reimnigh.uimhir_cille() without the dialect.
+#
+#   stór = Stór()
+#   bris, glan = stór.cuir_le(["bris", "glan"])
+#   bris[FoghaAimsire.chaite, FoghaPearsan.céad_uatha, FoghaFoirme.dhearfach] -> "bhris mé"
+#   bris.mar_liosta() -> the same as reimnigh.réimnigh("bris")
+
+from array import array
+import reimnigh
+from reimnigh import FoghaAimsire, FoghaPearsan, FoghaFoirme
+
+folamh = 0xFFFFFFFF  # no form in this cell, e.g. interrogative subjunctive
+cealla_in_aghaidh_paraidíme = reimnigh.líon_ceall // 2
+
+
+# cell number of a form within a paradigm
+def uimhir_cille(aimsir: FoghaAimsire, pearsa: FoghaPearsan, foirm: FoghaFoirme) -> int:
+	return reimnigh.uimhir_cille(aimsir, pearsa, foirm, False) >> 1
+
+
+class Stór:
+	def __init__(self):
+		self._maolán = bytearray()  # every distinct form, UTF-8 encoded, one after the other
+		self._fritháirimh = array('I', [0])  # start of each form in the buffer, plus the end of the last one
+		self._cealla = array('I')  # string number of each cell of each paradigm
+		self._uimhreacha = {}  # each form and its number, only kept until the store is frozen
+
+	def __len__(self):
+		return len(self._cealla) // cealla_in_aghaidh_paraidíme
+
+	# number of a form in the buffer, adding it if it isn't there already
+	def _uimhir(self, teaghrán: str) -> int:
+		uimhir = self._uimhreacha.get(teaghrán)
+		if uimhir is None:
+			self._maolán += teaghrán.encode('utf-8')
+			self._fritháirimh.append(len(self._maolán))
+			uimhir = self._uimhreacha[teaghrán] = len(self._fritháirimh) - 2
+		return uimhir
+
+	def teaghrán(self, uimhir: int) -> str:
+		return self._maolán[self._fritháirimh[uimhir]:self._fritháirimh[uimhir + 1]].decode('utf-8')
+
+	# conjugate every form of some verbs and store them, returning a paradigm for each verb
+	def cuir_le(self, briathra, mumhan: bool = False) -> list:
+		if self._uimhreacha is None:
+			raise AttributeError("cannot add to a frozen Stór")
+		paraidímí = []
+		for taifid in reimnigh.taifid_iomlána(briathra, mumhan=mumhan):
+			tús = len(self._cealla)
+			self._cealla.extend(array('I', [folamh]) * cealla_in_aghaidh_paraidíme)
+			for t in taifid:
+				self._cealla[tús + uimhir_cille(t.aimsir, t.pearsa, t.foirm)] = self._uimhir(t.leagan)
+			paraidímí.append(ParaidímDhlúth(self, taifid[0].briathar, mumhan, tús))
+		return paraidímí
+
+	# stop adding verbs and let go of what was needed to find forms that are already stored
+	def reoigh(self):
+		self._uimhreacha = None
+		return self
+
+
+# One verb's paradigm in a Stór
+class ParaidímDhlúth:
+	__slots__ = ('briathar', 'mumhan', '_stór', '_tús')
+
+	def __init__(self, stór: Stór, briathar: str, mumhan: bool, tús: int):
+		self.briathar = briathar
+		self.mumhan = mumhan
+		self._stór = stór
+		self._tús = tús
+
+	# one form, or None if there's no such form
+	def __getitem__(self, eochair: tuple):
+		aimsir, pearsa, foirm = eochair
+		uimhir = self._stór._cealla[self._tús + uimhir_cille(aimsir, pearsa, foirm)]
+		if uimhir != folamh:
+			return self._stór.teaghrán(uimhir)
+
+	# the forms in the same nested lists that reimnigh.réimnigh() gives
+	def mar_liosta(self, aimsirí: list = FoghaAimsire, pearsana: list = FoghaPearsan,
+	               foirmeacha: list = FoghaFoirme) -> list:
+		aschur = []
+		for a in aimsirí:
+			ró = []
+			for p in pearsana:
+				leaganacha = (self[a, p, f] for f in foirmeacha)
+				ró.append([leagan for leagan in leaganacha if leagan is not None])
+			aschur.append({'ainm': a.ainm, 'pearsana': ró})
+		return aschur
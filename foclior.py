@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+# Precompiled lexicon of fully conjugated verbs
+#
+# A lexicon file is built from a list of verbs with every tense, person and form in both dialects,
+# and can then be looked up without conjugating anything or reading the forms into memory.
+#
+# File layout, all integers little-endian:
+#   header      magic, version, number of verbs, number of strings, offsets of the sections below
+#   strings     every distinct verb and form, UTF-8 encoded, one after the other
+#   offsets     uint32 start of each string in the strings section, plus the end of the last one
+#   index       uint32 string number of each verb, sorted by the verb's UTF-8 bytes
+#   cells       uint32 string number of each form, in reimnigh.uimhir_cille() order, for each verb in the index
+
+from array import array
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+from sys import byteorder
+import reimnigh
+from reimnigh import FoghaAimsire, FoghaPearsan, FoghaFoirme
+
+draíocht = b"REIMNIGH"
+leagan_formáide = 1
+ceanntásc = Struct("<8sHHIIIIII")
+uimh = Struct("<I")
+folamh = 0xFFFFFFFF  # no form in this cell, e.g. interrogative subjunctive
+cealla_in_aghaidh_briathair = reimnigh.líon_ceall
+
+
+# conjugate a list of verbs and write them to a lexicon file
+def tóg(briathra, cosán: str):
+	briathra = sorted(set(briathra), key=lambda b: b.encode('utf-8'))
+	teaghráin = {}  # each distinct string and its number
+
+	def uimhir_teaghráin(teaghrán: str) -> int:
+		uimhir = teaghráin.get(teaghrán)
+		if uimhir is None:
+			uimhir = teaghráin[teaghrán] = len(teaghráin)
+		return uimhir
+
+	innéacs = [uimhir_teaghráin(b) for b in briathra]
+	cealla = [[folamh] * cealla_in_aghaidh_briathair for _ in briathra]
+	for mumhan in False, True:
+		for taifid, cealla_bhriathair in zip(reimnigh.taifid_iomlána(briathra, mumhan=mumhan), cealla):
+			for t in taifid:
+				cealla_bhriathair[reimnigh.uimhir_cille(t.aimsir, t.pearsa, t.foirm, mumhan)] = uimhir_teaghráin(t.leagan)
+
+	ionchódaithe = [t.encode('utf-8') for t in teaghráin]
+	fritháirimh = [0]
+	for t in ionchódaithe:
+		fritháirimh.append(fritháirimh[-1] + len(t))
+
+	tús_teaghrán = ceanntásc.size
+	tús_fritháireamh = tús_teaghrán + fritháirimh[-1]
+	tús_innéacs = tús_fritháireamh + uimh.size * len(fritháirimh)
+	tús_ceall = tús_innéacs + uimh.size * len(innéacs)
+	with open(cosán, 'wb') as comhad:
+		comhad.write(ceanntásc.pack(draíocht, leagan_formáide, 0, len(briathra), len(teaghráin),
+		                            tús_teaghrán, tús_fritháireamh, tús_innéacs, tús_ceall))
+		comhad.write(b"".join(ionchódaithe))
+		comhad.write(Struct(f"<{len(fritháirimh)}I").pack(*fritháirimh))
+		comhad.write(Struct(f"<{len(innéacs)}I").pack(*innéacs))
+		líne = Struct(f"<{cealla_in_aghaidh_briathair}I")
+		for cealla_bhriathair in cealla:
+			comhad.write(líne.pack(*cealla_bhriathair))
+
+
+# a section of uint32s in a lexicon file as a sequence of ints
+# read where it is in the file on little-endian machines, otherwise copied and byte-swapped
+def _uimhreacha(amharc: memoryview):
+	if byteorder == 'little':
+		return amharc.cast('I')
+	uimhreacha = array('I', amharc)
+	uimhreacha.byteswap()
+	return uimhreacha
+
+
+# A lexicon file opened for lookups
+# The file is memory-mapped, so only the forms that are looked up get read from disk. The verbs are read
+# once when it's opened, into a dict from each verb to its row of cells.
+# Verbs that aren't in the file are conjugated as usual.
+class Foclóir:
+	def __init__(self, cosán: str):
+		with open(cosán, 'rb') as comhad:
+			self._mm = mmap(comhad.fileno(), 0, access=ACCESS_READ)
+		(ainm, leagan, _, self.líon_briathra, self.líon_teaghrán,
+		 tús_teaghrán, tús_fritháireamh, tús_innéacs, tús_ceall) = ceanntásc.unpack_from(self._mm)
+		if ainm != draíocht or leagan != leagan_formáide:
+			self._mm.close()
+			raise ValueError(f"{cosán} is not a version {leagan_formáide} reimnigh lexicon")
+		amharc = memoryview(self._mm)
+		self._amharcanna = [amharc]  # every view of the file, which have to be let go of before closing it
+		self._téacs = amharc[tús_teaghrán:tús_fritháireamh]
+		self._fritháirimh = _uimhreacha(amharc[tús_fritháireamh:tús_innéacs])
+		self._cealla = _uimhreacha(amharc[tús_ceall:])
+		self._amharcanna += [self._téacs, self._fritháirimh, self._cealla]
+		self._sraitheanna = {self._teaghrán(uimhir): i
+		                     for i, uimhir in enumerate(_uimhreacha(amharc[tús_innéacs:tús_ceall]))}
+
+	def close(self):
+		for amharc in reversed(self._amharcanna):
+			if isinstance(amharc, memoryview):
+				amharc.release()
+		self._mm.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *_):
+		self.close()
+
+	def __len__(self):
+		return self.líon_briathra
+
+	def __contains__(self, briathar: str) -> bool:
+		return briathar in self._sraitheanna
+
+	# string number i
+	def _teaghrán(self, i: int) -> str:
+		return str(self._téacs[self._fritháirimh[i]:self._fritháirimh[i + 1]], 'utf-8')
+
+	# get one form of a verb, or None if there's no such form
+	def leagan(self, briathar: str, aimsir: FoghaAimsire, pearsa: FoghaPearsan, foirm: FoghaFoirme, mumhan: bool = False):
+		i = self._sraitheanna.get(briathar)
+		if i is None:
+			return reimnigh.réimnigh_cill(briathar, aimsir, pearsa, foirm, mumhan)
+		uimhir = self._cealla[i * cealla_in_aghaidh_briathair + reimnigh.uimhir_cille(aimsir, pearsa, foirm, mumhan)]
+		if uimhir != folamh:
+			return self._teaghrán(uimhir)
+
+	# all the verbs in the lexicon, in order
+	def briathra(self):
+		yield from self._sraitheanna
+
+
+if __name__ == '__main__':
+	from argparse import ArgumentParser
+
+	parser = ArgumentParser()
+	fochoimirc = parser.add_subparsers(dest='ordú', required=True)
+
+	tógáil = fochoimirc.add_parser('tóg', help='déantar foclóir as liosta briathra')
+	tógáil.add_argument('briathra', help='comhad le briathar amháin ar gach líne')
+	tógáil.add_argument('foclóir', help='an comhad foclóra le scríobh')
+
+	ceist = fochoimirc.add_parser('ceist', help='faightear foirm amháin de bhriathar')
+	ceist.add_argument('foclóir')
+	ceist.add_argument('briathar')
+	ceist.add_argument('aimsir', choices=[a.name for a in FoghaAimsire])
+	ceist.add_argument('pearsa', choices=[p.name for p in FoghaPearsan])
+	ceist.add_argument('foirm', choices=[f.name for f in FoghaFoirme])
+	ceist.add_argument('-m', help='úsáidtear an chanúint na Mumhan', action='store_true')
+
+	args = parser.parse_args()
+
+	if args.ordú == 'tóg':
+		with open(args.briathra, encoding='utf-8') as comhad:
+			tóg(reimnigh.léigh_briathra(comhad), args.foclóir)
+	else:
+		with Foclóir(args.foclóir) as foclóir:
+			print(foclóir.leagan(args.briathar, FoghaAimsire[args.aimsir], FoghaPearsan[args.pearsa],
+			                     FoghaFoirme[args.foirm], args.m) or '')
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+# HTTP/JSON conjugation server using only asyncio
+#
+#   GET  /reimnigh?briathar=bris&aimsir=chaite&pearsa=céad_uatha&foirm=dhearfach&mumhan=1
+#   POST /reimnigh  with a JSON body as in deamhan.py
+#
+# aimsir, pearsa and foirm can be given more than once or left out to get all of them. The answer is the
+# same JSON as deamhan.py gives. Identical requests that arrive while one is already being worked on wait
+# for that one rather than being conjugated again, and requests for more than a handful of forms are sent
+# to a pool of worker processes so the server keeps answering while they're conjugated.
+#
+#   python freastalai.py [--port 8080] [--próisis N]
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+import json
+from urllib.parse import urlsplit, parse_qs
+import deamhan
+import reimnigh
+from reimnigh import FoghaAimsire, FoghaPearsan, FoghaFoirme
+
+# requests for more forms than this go to the worker processes
+uasmhéid_inlíne = 21
+
+cóid = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+        500: "Internal Server Error"}
+
+
+# how many forms a request asks for
+def líon_foirmeacha(iarratas: dict) -> int:
+	líon = 1
+	for eochair, fogha in ('aimsirí', FoghaAimsire), ('pearsana', FoghaPearsan), ('foirmeacha', FoghaFoirme):
+		try:
+			líon *= len(iarratas.get(eochair) or fogha)
+		except TypeError:
+			return 0  # not a list, deamhan.freagair() will say what's wrong with it
+	return líon
+
+
+# turn GET parameters into a request like deamhan.py takes
+def iarratas_ó_cheist(ceist: str) -> dict:
+	paraiméadair = parse_qs(ceist)
+	iarratas = {}
+	if 'briathar' in paraiméadair:
+		iarratas['briathar'] = paraiméadair['briathar'][0]
+	for ainm, eochair in ('aimsir', 'aimsirí'), ('pearsa', 'pearsana'), ('foirm', 'foirmeacha'):
+		if ainm in paraiméadair:
+			iarratas[eochair] = [luach for luachanna in paraiméadair[ainm] for luach in luachanna.split(',')]
+	for ainm in 'mumhan', 'aibhsigh', 'míreanna':
+		if ainm in paraiméadair:
+			iarratas[ainm] = paraiméadair[ainm][0] not in ('', '0', 'false')
+	return iarratas
+
+
+class Freastalaí:
+	def __init__(self, próisis: int = None):
+		self._linn = ProcessPoolExecutor(próisis, initializer=reimnigh.faigh_rialacha)
+		self._ar_siúl = {}  # requests being worked on, so identical ones can share the answer
+		self.staitisticí = {'iarratais': 0, 'comhcheangailte': 0, 'linn': 0}
+
+	def close(self):
+		self._linn.shutdown()
+
+	# answer a request, sharing the work with any identical request that's already in progress
+	async def freagair(self, iarratas: dict) -> dict:
+		self.staitisticí['iarratais'] += 1
+		eochair = json.dumps(iarratas, sort_keys=True, ensure_ascii=False)
+		tasc = self._ar_siúl.get(eochair)
+		if tasc is None:
+			tasc = self._ar_siúl[eochair] = asyncio.ensure_future(self._ríomh(iarratas))
+			tasc.add_done_callback(lambda _: self._ar_siúl.pop(eochair, None))
+		else:
+			self.staitisticí['comhcheangailte'] += 1
+		# shielded so one client going away doesn't cancel the work for everyone else waiting on it
+		return await asyncio.shield(tasc)
+
+	async def _ríomh(self, iarratas: dict) -> dict:
+		if líon_foirmeacha(iarratas) > uasmhéid_inlíne:
+			self.staitisticí['linn'] += 1
+			return await asyncio.get_running_loop().run_in_executor(self._linn, deamhan.freagair, iarratas)
+		return deamhan.freagair(iarratas)
+
+	# deal with one connection, answering requests until the client closes it
+	async def ceangal(self, léitheoir: asyncio.StreamReader, scríbhneoir: asyncio.StreamWriter):
+		try:
+			while True:
+				líne = await léitheoir.readline()
+				if not líne.strip():
+					break
+				try:
+					modh, sprioc, leagan = líne.decode('utf-8', 'replace').split()
+				except ValueError:
+					await self._seol(scríbhneoir, 400, {'earráid': "bad request line"}, False)
+					break
+
+				ceanntáisc = {}
+				while True:
+					líne = await léitheoir.readline()
+					if líne in (b"\r\n", b"\n", b""):
+						break
+					ainm, _, luach = líne.decode('latin-1').partition(':')
+					ceanntáisc[ainm.strip().lower()] = luach.strip()
+				coinnigh = (ceanntáisc.get('connection', '').lower() != 'close'
+				            and (leagan == 'HTTP/1.1' or ceanntáisc.get('connection', '').lower() == 'keep-alive'))
+
+				corp = b""
+				try:
+					fad = int(ceanntáisc.get('content-length') or 0)
+				except ValueError:
+					await self._seol(scríbhneoir, 400, {'earráid': "bad Content-Length"}, False)
+					break
+				if fad < 0:
+					await self._seol(scríbhneoir, 400, {'earráid': "bad Content-Length"}, False)
+					break
+				if fad > 65536:
+					await self._seol(scríbhneoir, 413, {'earráid': "request too large"}, False)
+					break
+				if fad:
+					corp = await léitheoir.readexactly(fad)
+
+				try:
+					cód, freagra = await self._láimhseáil(modh, sprioc, corp)
+				except Exception as e:
+					# shared by every request waiting on the same work, which all get this answer
+					cód, freagra = 500, {'earráid': f"internal error: {type(e).__name__}: {e}"}
+				await self._seol(scríbhneoir, cód, freagra, coinnigh)
+				if not coinnigh:
+					break
+		except (ConnectionError, asyncio.IncompleteReadError):
+			pass
+		except ValueError:
+			# readline() gives up on a line longer than the reader's limit
+			with suppress(ConnectionError):
+				await self._seol(scríbhneoir, 400, {'earráid': "line too long"}, False)
+		finally:
+			scríbhneoir.close()
+
+	async def _láimhseáil(self, modh: str, sprioc: str, corp: bytes) -> tuple:
+		url = urlsplit(sprioc)
+		if url.path != '/reimnigh':
+			return 404, {'earráid': "not found"}
+		if modh == 'GET':
+			iarratas = iarratas_ó_cheist(url.query)
+		elif modh == 'POST':
+			try:
+				iarratas = json.loads(corp)
+			except ValueError as e:
+				return 400, {'earráid': f"bad request: {e}"}
+			if not isinstance(iarratas, dict):
+				return 400, {'earráid': "bad request: request must be a JSON object"}
+		else:
+			return 405, {'earráid': "only GET and POST are supported"}
+		freagra = await self.freagair(iarratas)
+		return 'earráid' in freagra and 400 or 200, freagra
+
+	@staticmethod
+	async def _seol(scríbhneoir: asyncio.StreamWriter, cód: int, freagra: dict, coinnigh: bool):
+		corp = json.dumps(freagra, ensure_ascii=False).encode('utf-8')
+		scríbhneoir.write(f"HTTP/1.1 {cód} {cóid[cód]}\r\n"
+		                  f"Content-Type: application/json; charset=utf-8\r\n"
+		                  f"Content-Length: {len(corp)}\r\n"
+		                  f"Connection: {coinnigh and 'keep-alive' or 'close'}\r\n\r\n".encode('latin-1') + corp)
+		await scríbhneoir.drain()
+
+
+async def freastail(óstach: str = '127.0.0.1', port: int = 8080, próisis: int = None):
+	reimnigh.faigh_rialacha()
+	freastalaí = Freastalaí(próisis)
+	try:
+		seirbhís = await asyncio.start_server(freastalaí.ceangal, óstach, port)
+		async with seirbhís:
+			await seirbhís.serve_forever()
+	finally:
+		freastalaí.close()
+
+
+if __name__ == '__main__':
+	from argparse import ArgumentParser
+
+	parser = ArgumentParser()
+	parser.add_argument('--óstach', default='127.0.0.1', help='an seoladh le héisteacht air')
+	parser.add_argument('--port', type=int, default=8080)
+	parser.add_argument('--próisis', type=int, help='líon na bpróiseas oibre (réamhshocrú: ceann do gach LAP)')
+	args = parser.parse_args()
+
+	try:
+		asyncio.run(freastail(args.óstach, args.port, args.próisis))
+	except KeyboardInterrupt:
+		pass
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+# Golden snapshot of every form of a list of verbs
+#
+# Conjugates every verb in both dialects and keeps the forms in a folder, so a later run can say exactly
+# which forms a change to the rules altered. Verbs are split into shards by conjugation and a hash of the
+# verb. Each shard is stored in a gzipped file named after the hash of its contents and remembers the
+# rule fingerprint (reimnigh.méarlorg_rialacha()) of its conjugation. Only shards whose verbs or rules
+# changed are conjugated again, so checking an unchanged snapshot is quick even for a long list.
+#
+#   python grianghraf.py briathra.txt grianghraf/              compare with the snapshot, creating it if needed
+#   python grianghraf.py briathra.txt grianghraf/ --nuashonraigh   also save any changes to the snapshot
+#
+# Shard file layout: one line per verb, sorted, with the verb and then the form in every cell in
+# reimnigh.uimhir_cille() order, separated by tabs. Empty cells are empty.
+
+import gzip
+from hashlib import sha256
+import json
+from os import listdir, makedirs, path, remove
+from zlib import crc32
+import reimnigh
+
+leagan_formáide = 1
+líon_blúirí = 64  # shards per conjugation
+comhad_innéacs = "innéacs.json"
+
+
+# which shard a verb goes in
+def blúire(briathar: str) -> str:
+	return f"{reimnigh.cén_aicme(briathar)}-{crc32(briathar.encode('utf-8')) % líon_blúirí:02}"
+
+
+# hash of a list of verbs, to tell if a shard's verbs have changed
+def hais_briathra(briathra: list) -> str:
+	return sha256("\n".join(briathra).encode('utf-8')).hexdigest()
+
+
+# the text of shard files, given the verbs in each shard
+# all the verbs are conjugated together in both dialects so that worker processes are only started once
+def déan_blúirí(grúpaí: dict, próisis: int = 1) -> dict:
+	briathra = [briathar for briathra_bhlúire in grúpaí.values() for briathar in briathra_bhlúire]
+	cealla = {briathar: [""] * reimnigh.líon_ceall for briathar in briathra}
+	pleananna = {aicme: réimniú.pleanáil_canúintí(reimnigh.FoghaAimsire, reimnigh.FoghaPearsan, reimnigh.FoghaFoirme)
+	             for aicme, réimniú in reimnigh.faigh_rialacha().items()}
+	torthaí = briathra and reimnigh.réimnigh_bulc(briathra, próisis=próisis, canúintí=True) or ()
+	for briathar, toradh in zip(briathra, torthaí):
+		for t in reimnigh.taifid_canúintí(briathar, toradh, pleananna[reimnigh.cén_aicme(briathar)]):
+			cealla[briathar][reimnigh.uimhir_cille(t.aimsir, t.pearsa, t.foirm, False)] = t.caighdeánach
+			cealla[briathar][reimnigh.uimhir_cille(t.aimsir, t.pearsa, t.foirm, True)] = t.mumhan
+	return {ainm: "".join(f"{briathar}\t" + "\t".join(cealla[briathar]) + "\n" for briathar in briathra_bhlúire)
+	        for ainm, briathra_bhlúire in grúpaí.items()}
+
+
+# the forms in a shard file's text, by verb
+def léigh_blúire(téacs: str) -> dict:
+	cealla = {}
+	for líne in téacs.splitlines():
+		briathar, *foirmeacha = líne.split("\t")
+		cealla[briathar] = foirmeacha
+	return cealla
+
+
+# what changed between two versions of a shard, as lines of text
+def difríochtaí(sean: dict, nua: dict):
+	for briathar in sorted(sean.keys() | nua.keys()):
+		if briathar not in nua:
+			yield f"- {briathar}"
+		elif briathar not in sean:
+			yield f"+ {briathar}"
+		else:
+			for uimhir, (roimhe, anois) in enumerate(zip(sean[briathar], nua[briathar])):
+				if roimhe != anois:
+					aimsir, pearsa, foirm, mumhan = reimnigh.cill(uimhir)
+					yield (f"~ {briathar} {aimsir.name} {pearsa.name} {foirm.name}{mumhan and ' mumhan' or ''}: "
+					       f"{roimhe or '-'} -> {anois or '-'}")
+
+
+class Grianghraf:
+	def __init__(self, fillteán: str):
+		self.fillteán = fillteán
+		try:
+			with open(path.join(fillteán, comhad_innéacs), encoding='utf-8') as comhad:
+				innéacs = json.load(comhad)
+		except FileNotFoundError:
+			innéacs = {'leagan': leagan_formáide, 'blúirí': {}}
+		if innéacs.get('leagan') != leagan_formáide:
+			raise ValueError(f"{fillteán} is not a version {leagan_formáide} snapshot")
+		self.blúirí = innéacs['blúirí']  # shard -> {'comhad', 'briathra', 'méarlorg'}
+
+	# text of a stored shard
+	def léigh(self, ainm: str) -> str:
+		with gzip.open(path.join(self.fillteán, self.blúirí[ainm]['comhad']), 'rt', encoding='utf-8') as comhad:
+			return comhad.read()
+
+	# Compare the snapshot with what the current rules give for a list of verbs.
+	# Yields each difference, and with nuashonraigh saves the new forms as the snapshot.
+	# Shards that have the same verbs and rule fingerprint as before are skipped unless gach is set.
+	def seiceáil(self, briathra, nuashonraigh: bool = False, gach: bool = False, próisis: int = 1):
+		grúpaí = {}
+		for briathar in sorted(set(briathra)):
+			grúpaí.setdefault(blúire(briathar), []).append(briathar)
+
+		nua = {}
+		athraithe = {}  # shards that have to be conjugated again
+		for ainm in sorted(grúpaí.keys() | self.blúirí.keys()):
+			briathra_bhlúire = grúpaí.get(ainm, [])
+			méarlorg = briathra_bhlúire and reimnigh.méarlorg_rialacha(reimnigh.cén_aicme(briathra_bhlúire[0])) or ""
+			sean = self.blúirí.get(ainm)
+			if not gach and sean and sean['briathra'] == hais_briathra(briathra_bhlúire) and sean['méarlorg'] == méarlorg:
+				nua[ainm] = sean
+			else:
+				athraithe[ainm] = briathra_bhlúire
+
+		for ainm, téacs in déan_blúirí(athraithe, próisis).items():
+			briathra_bhlúire = athraithe[ainm]
+			sean = self.blúirí.get(ainm)
+			yield from difríochtaí(sean and léigh_blúire(self.léigh(ainm)) or {}, léigh_blúire(téacs))
+			if briathra_bhlúire:
+				eolas = {'briathra': hais_briathra(briathra_bhlúire),
+				         'méarlorg': reimnigh.méarlorg_rialacha(reimnigh.cén_aicme(briathra_bhlúire[0]))}
+				eolas['comhad'] = sha256(téacs.encode('utf-8')).hexdigest()[:32] + ".tsv.gz"
+				nua[ainm] = eolas
+				if nuashonraigh and not path.exists(path.join(self.fillteán, eolas['comhad'])):
+					makedirs(self.fillteán, exist_ok=True)
+					with gzip.open(path.join(self.fillteán, eolas['comhad']), 'wt', encoding='utf-8') as comhad:
+						comhad.write(téacs)
+
+		if nuashonraigh:
+			self.blúirí = nua
+			makedirs(self.fillteán, exist_ok=True)
+			with open(path.join(self.fillteán, comhad_innéacs), 'w', encoding='utf-8') as comhad:
+				json.dump({'leagan': leagan_formáide, 'blúirí': nua}, comhad, ensure_ascii=False, indent='\t',
+				          sort_keys=True)
+			# clear away shard files that nothing uses any more
+			in_úsáid = {eolas['comhad'] for eolas in nua.values()}
+			for comhad in listdir(self.fillteán):
+				if comhad.endswith(".tsv.gz") and comhad not in in_úsáid:
+					remove(path.join(self.fillteán, comhad))
+
+
+if __name__ == '__main__':
+	from argparse import ArgumentParser
+	import sys
+
+	parser = ArgumentParser()
+	parser.add_argument('briathra', help='comhad le briathar amháin ar gach líne')
+	parser.add_argument('fillteán', help='an fillteán ina gcoinnítear an grianghraf')
+	parser.add_argument('--nuashonraigh', action='store_true', help='sábháiltear na hathruithe sa ghrianghraf')
+	parser.add_argument('--gach', action='store_true', help='réimnítear gach briathar arís, fiú mura bhfuil athrú ar na rialacha')
+	parser.add_argument('--jobs', metavar='N', type=int, default=1, help='líon na bpróiseas (0 = ceann do gach LAP)')
+	args = parser.parse_args()
+
+	nua = not path.exists(path.join(args.fillteán, comhad_innéacs))
+	with open(args.briathra, encoding='utf-8') as comhad:
+		briathra = list(reimnigh.léigh_briathra(comhad))
+	grianghraf = Grianghraf(args.fillteán)
+	líon = 0
+	for líne in grianghraf.seiceáil(briathra, args.nuashonraigh or nua, args.gach, args.jobs or None):
+		if not nua:
+			print(líne)
+			líon += 1
+	if nua:
+		print(f"snapshot of {len(set(briathra))} verbs saved in {args.fillteán}")
+	elif líon:
+		print(f"{líon} changes{not args.nuashonraigh and ', run with --nuashonraigh to save them' or ''}", file=sys.stderr)
+		sys.exit(not args.nuashonraigh)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+# Query expansion for search
+#
+# Gives every word a verb can appear as, so a search engine can match "mbeannóidh", "bheannaigh" or
+# "d'eitil" to the verb they come from. Every form is conjugated in both dialects with its parts marked
+# (see reimnigh.LeaganRoinnte) and the verb itself is taken out of it, without the particle or pronoun,
+# both as it is and without its initial mutation.
+#
+#   python leathnu.py bris                                  every word "bris" can appear as
+#   python leathnu.py --input briathra.txt > synonyms.txt   a synonym file for a list of verbs
+#
+# The synonym file has a line for each verb in the explicit mapping format Solr and Elasticsearch use
+#   bhris, bhrisfeadh, ..., bris, ... => bris
+
+import reimnigh
+from reimnigh import is_guta, is_inséimhithe, uraigh
+
+
+# the word a form's verb appears as, and the same without its initial mutation
+# e.g. "an mbrisfidh sé" -> "mbrisfidh", "brisfidh"
+def focail(leagan: reimnigh.LeaganRoinnte) -> tuple:
+	míreanna = leagan.míreanna
+	i = míreanna[0][0] == 'mír'  # the parts after the particle are always in the same order
+	réimír, céad_litir, _, fréamh, deireadh = míreanna[i:i + 5]
+	return (leagan[réimír[1]:deireadh[2]].casefold(),
+	        (leagan[céad_litir[1]:céad_litir[2]] + leagan[fréamh[1]:deireadh[2]]).casefold())
+
+
+# every initial mutation a word could take in running text
+def claochluithe(focal: str):
+	if is_guta(focal[0]):
+		yield f"n-{focal}"
+		yield f"h{focal}"
+		yield f"d'{focal}"
+	else:
+		if is_inséimhithe(focal):
+			séimhithe = f"{focal[0]}h{focal[1:]}"
+			yield séimhithe
+			if focal[0] == 'f':
+				yield f"d'{séimhithe}"
+		urú = uraigh(focal[0])
+		if urú:
+			yield urú + focal
+
+
+# the words in a result from reimnigh.réimnigh_canúintí() made with aibhsigh
+def focail_toraidh(toradh: list, gach_claochlú: bool = False) -> set:
+	aschur = set()
+	for a in toradh:
+		for ró in a['pearsana']:
+			for leagan in ró:
+				aschur.update(focail(leagan.caighdeánach))
+				if leagan.difriúil:
+					aschur.update(focail(leagan.mumhan))
+	if gach_claochlú:
+		for focal in list(aschur):
+			aschur.update(claochluithe(focal))
+	return aschur
+
+
+# every word a verb can appear as in either dialect, with and without mutations
+# with gach_claochlú, every mutation of each word is added too, not just the ones its forms have
+def leathnaigh(briathar: str, gach_claochlú: bool = False) -> set:
+	return focail_toraidh(reimnigh.réimnigh_canúintí(briathar, aibhsigh=True), gach_claochlú)
+
+
+# leathnaigh() for many verbs, yielding (verb, sorted words) in input order
+def leathnaigh_bulc(briathra, gach_claochlú: bool = False, próisis: int = 1):
+	from collections import deque
+	ciú = deque()
+
+	def léigh():
+		for briathar in briathra:
+			ciú.append(briathar)
+			yield briathar
+
+	for toradh in reimnigh.réimnigh_bulc(léigh(), aibhsigh=True, próisis=próisis, canúintí=True):
+		yield ciú.popleft(), sorted(focail_toraidh(toradh, gach_claochlú))
+
+
+# write a synonym file for many verbs, returning how many verbs and words were written
+def scríobh_comhchiallaigh(briathra, comhad, gach_claochlú: bool = False, próisis: int = 1) -> tuple:
+	líon_briathra = líon_focal = 0
+	for briathar, focail_bhriathair in leathnaigh_bulc(briathra, gach_claochlú, próisis):
+		comhad.write(f"{', '.join(focail_bhriathair)} => {briathar}\n")
+		líon_briathra += 1
+		líon_focal += len(focail_bhriathair)
+	return líon_briathra, líon_focal
+
+
+if __name__ == '__main__':
+	from argparse import ArgumentParser
+	import sys
+	from time import perf_counter
+
+	parser = ArgumentParser()
+	parser.add_argument('briathar', nargs='?')
+	parser.add_argument('--input', metavar='COMHAD', help='scríobhtar comhad comhchiallach do gach briathar sa chomhad seo')
+	parser.add_argument('--gach-claochlú', action='store_true',
+	                    help='cuirtear gach claochlú tosaigh a d\'fhéadfadh a bheith ar gach focal leis')
+	parser.add_argument('--jobs', metavar='N', type=int, default=1, help='líon na bpróiseas (0 = ceann do gach LAP)')
+	args = parser.parse_args()
+
+	if args.input is None:
+		if args.briathar is None:
+			parser.error("give a verb or --input")
+		print("\n".join(sorted(leathnaigh(args.briathar, args.gach_claochlú))))
+	else:
+		tús = perf_counter()
+		with open(args.input, encoding='utf-8') as comhad:
+			líon_briathra, líon_focal = scríobh_comhchiallaigh(reimnigh.léigh_briathra(comhad), sys.stdout,
+			                                                    args.gach_claochlú, args.jobs or None)
+		sys.stdout.flush()
+		am = perf_counter() - tús
+		print(f"{líon_briathra} verbs, {líon_focal} words in {am:.2f}s ({líon_briathra / am:.0f} verbs/s)", file=sys.stderr)
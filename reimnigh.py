@@ -5,8 +5,12 @@
 
 from copy import deepcopy
 from enum import Enum, auto
-from re import sub, findall, match
-from typing import List
+from functools import lru_cache
+from re import sub, findall
+from threading import Lock
+from time import perf_counter
+from types import MappingProxyType
+from typing import List, Mapping, NamedTuple
 
 # vowels
 gutaí = "aouieáóúíé"
@@ -78,6 +82,23 @@ def leath_nó_caolaigh(deireadh: str, caol: bool) -> str:
 		return sub(r"\(\w+\)|[\[\]]", "", deireadh)
 
 
+# An ending from the rules with its broad and slender forms worked out once, so conjugating only has to
+# pick one. It's indexed by whether the stem is slender, e.g. "[ó](eo)idh" -> ("óidh", "eoidh").
+class Deireadh(NamedTuple):
+	leathan: str
+	caol: str
+	tús: tuple  # first letter of each without a fada, or '' if there isn't one, for doubled vowels
+	t: bool  # whether the ending as written starts with t, for the adjustments to -áil and long -igh stems
+	f_nó_t: bool  # whether it starts with f or t, for the adjustment to -iaigh stems
+
+
+@lru_cache(maxsize=None)
+def déan_deireadh(amhdheireadh: str) -> Deireadh:
+	leathan, caol = leath_nó_caolaigh(amhdheireadh, False), leath_nó_caolaigh(amhdheireadh, True)
+	return Deireadh(leathan, caol, tuple(d and cuir_fada(d[0]).casefold() for d in (leathan, caol)),
+	                amhdheireadh.startswith('t'), amhdheireadh[:1] in ('f', 't'))
+
+
 # highlight string if ANSI highlights are enabled
 def aibhsigh(teaghrán: str) -> str:
 	return f"[01m{teaghrán}[21m"
@@ -93,6 +114,152 @@ def neamhaibhsigh(teaghrán: str) -> str:
 	return sub(r"\[\d\dm", "", teaghrán)
 
 
+# A conjugated form that knows which part of it is which
+# It's the plain text of the form, with míreanna giving (part, start, end) for each part. The parts are
+# mír (particle), réimír (mutation prefix), céad_litir, séimhiú, fréamh (rest of the stem), deireadh
+# and forainm. Mutations and endings are always there even if they're empty, the particle and
+# pronoun only if the form has them.
+# e.g. "ní bhrisfidh sé" -> (mír, 0, 2), (réimír, 3, 3), (céad_litir, 3, 4), (séimhiú, 4, 5), ...
+class LeaganRoinnte(str):
+	def __new__(cls, píosaí: list):
+		míreanna = []
+		tús = 0
+		for cineál, téacs in píosaí:
+			if cineál:
+				míreanna.append((cineál, tús, tús + len(téacs)))
+			tús += len(téacs)
+		leagan = super().__new__(cls, "".join(téacs for _, téacs in píosaí))
+		object.__setattr__(leagan, 'míreanna', tuple(míreanna))
+		return leagan
+
+	def __getnewargs__(self):
+		return ([(None, str(self))],)
+
+	# forms can be shared between calls and threads, e.g. those of irregular verbs
+	def __setattr__(self, ainm, luach):
+		raise AttributeError(f"cannot modify {type(self).__name__}")
+
+	def __delattr__(self, ainm):
+		raise AttributeError(f"cannot modify {type(self).__name__}")
+
+
+# parts of a form that are highlighted
+míreanna_aibhsithe = frozenset(['réimír', 'séimhiú', 'deireadh', 'forainm'])
+
+
+# every part of a form including the spaces between them, which have no name
+def codanna(leagan: LeaganRoinnte):
+	deireadh = 0
+	for cineál, tús, críoch in leagan.míreanna:
+		if tús > deireadh:
+			yield None, leagan[deireadh:tús]
+		yield cineál, leagan[tús:críoch]
+		deireadh = críoch
+	if deireadh < len(leagan):
+		yield None, leagan[deireadh:]
+
+
+# a form with ANSI highlights
+def rindreáil_ansi(leagan: str) -> str:
+	if not isinstance(leagan, LeaganRoinnte):
+		return leagan
+	return "".join(cineál in míreanna_aibhsithe and aibhsigh(téacs) or téacs for cineál, téacs in codanna(leagan))
+
+
+# a form as HTML with each highlighted part in a <span> with the part's name as its class
+def rindreáil_html(leagan: str) -> str:
+	from html import escape
+	if not isinstance(leagan, LeaganRoinnte):
+		return escape(leagan)
+	return "".join(cineál in míreanna_aibhsithe and f'<span class="{cineál}">{escape(téacs)}</span>' or escape(téacs)
+	               for cineál, téacs in codanna(leagan) if téacs)
+
+
+# a form as plain text
+def rindreáil_téacs(leagan: str) -> str:
+	return str(leagan)
+
+
+# Counts of which rules fired and time spent in each phase of conjugating
+# Turned off unless ionstraim is set, e.g. with tosaigh_ionstraim(). Checking for it is the only cost
+# when it's off. Only counts work done in this process, so use one process with réimnigh_bulc().
+class Ionstraim:
+	def __init__(self):
+		self.rialacha = {}  # (kind, rule) -> times fired
+		self.céimeanna = {}  # phase -> [calls, seconds]
+		self._glas = Lock()
+
+	# a rule fired
+	def cuntas(self, cineál: str, riail: str):
+		with self._glas:
+			eochair = (cineál, riail)
+			self.rialacha[eochair] = self.rialacha.get(eochair, 0) + 1
+
+	# a phase that started at perf_counter() time tús has finished
+	def am(self, céim: str, tús: float):
+		fad = perf_counter() - tús
+		with self._glas:
+			luach = self.céimeanna.setdefault(céim, [0, 0.0])
+			luach[0] += 1
+			luach[1] += fad
+
+	def glan(self):
+		with self._glas:
+			self.rialacha.clear()
+			self.céimeanna.clear()
+
+	# the counts as something that can be turned into JSON
+	def mar_json(self) -> dict:
+		with self._glas:
+			rialacha = {}
+			for (cineál, riail), líon in sorted(self.rialacha.items()):
+				rialacha.setdefault(cineál, {})[riail] = líon
+			return {'rialacha': rialacha,
+			        'céimeanna': {céim: {'glaonna': glaonna, 'soicindí': soicindí}
+			                      for céim, (glaonna, soicindí) in sorted(self.céimeanna.items())}}
+
+	# the counts in the Prometheus text exposition format
+	def mar_prometheus(self) -> str:
+		def lipéad(luach: str) -> str:
+			return luach.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+		with self._glas:
+			línte = ["# HELP reimnigh_rule_total Number of times each conjugation rule fired.",
+			         "# TYPE reimnigh_rule_total counter"]
+			línte += [f'reimnigh_rule_total{{kind="{lipéad(cineál)}",rule="{lipéad(riail)}"}} {líon}'
+			          for (cineál, riail), líon in sorted(self.rialacha.items())]
+			línte += ["# HELP reimnigh_phase_calls_total Number of times each phase of conjugation ran.",
+			          "# TYPE reimnigh_phase_calls_total counter"]
+			línte += [f'reimnigh_phase_calls_total{{phase="{lipéad(céim)}"}} {glaonna}'
+			          for céim, (glaonna, _) in sorted(self.céimeanna.items())]
+			línte += ["# HELP reimnigh_phase_seconds_total Time spent in each phase of conjugation.",
+			          "# TYPE reimnigh_phase_seconds_total counter"]
+			línte += [f'reimnigh_phase_seconds_total{{phase="{lipéad(céim)}"}} {soicindí!r}'
+			          for céim, (_, soicindí) in sorted(self.céimeanna.items())]
+		return "\n".join(línte) + "\n"
+
+
+ionstraim = None
+_glas_ionstraime = Lock()
+
+
+# start counting rules and timing phases, returning what they're counted in
+def tosaigh_ionstraim() -> Ionstraim:
+	global ionstraim
+	with _glas_ionstraime:
+		if ionstraim is None:
+			ionstraim = Ionstraim()
+		return ionstraim
+
+
+# stop counting, returning what was counted
+def stop_ionstraim() -> Ionstraim:
+	global ionstraim
+	with _glas_ionstraime:
+		sean, ionstraim = ionstraim, None
+		return sean
+
+
 # analytic, synthetic or infinitive form
 class Foirm(Enum):
 	scartha = auto()
@@ -135,11 +302,227 @@ class FoghaFoirme(Enum):
 	cheisteach = auto()
 
 
+# Every form in a full paradigm numbered in a fixed order: by tense, person, form and dialect
+líon_ceall = len(FoghaAimsire) * len(FoghaPearsan) * len(FoghaFoirme) * 2
+_innéacs_aimsire = {a: i for i, a in enumerate(FoghaAimsire)}
+_innéacs_pearsan = {p: i for i, p in enumerate(FoghaPearsan)}
+_innéacs_foirme = {f: i for i, f in enumerate(FoghaFoirme)}
+_cealla = [(a, p, f, m) for a in FoghaAimsire for p in FoghaPearsan for f in FoghaFoirme for m in (False, True)]
+
+
+# number of a cell in the paradigm
+def uimhir_cille(aimsir: FoghaAimsire, pearsa: FoghaPearsan, foirm: FoghaFoirme, mumhan: bool) -> int:
+	return ((_innéacs_aimsire[aimsir] * len(FoghaPearsan) + _innéacs_pearsan[pearsa]) * len(FoghaFoirme)
+	        + _innéacs_foirme[foirm]) * 2 + bool(mumhan)
+
+
+# tense, person, form and dialect of a cell number
+def cill(uimhir: int) -> tuple:
+	return _cealla[uimhir]
+
+
+# The parts of a verb that every form is built from, worked out once per verb
+# e.g. "beannaigh" -> fréamh="beann", caol=False
+class Anailís(NamedTuple):
+	briathar: str
+	fréamh: str  # stem
+	caol: bool  # is the stem slender?
+	uimhir: int  # conjugation
+	deireadh_áil: bool  # special ending flags
+	deireadh_iaigh: bool
+	deireadh_igh_fada: bool
+	deireadh_uaigh: bool
+	riail: str  # which way the stem was found, for Ionstraim
+
+
+# Endings that verbs are classified by, written like the end of a regular expression:
+# each + is one letter that must come before the ending and [^x] is one letter other than x
+# e.g. "+[^a]ghair" matches "foghair" but not "aghair" or "caghair"
+class Patrún(NamedTuple):
+	litriú: str  # letters the verb ends with
+	fad_íos: int  # shortest verb this can match
+	eisceachtaí: tuple  # longer endings that don't match
+
+
+def déan_patrún(patrún: str) -> Patrún:
+	litriú = patrún.lstrip('+')
+	fad_íos = len(patrún) - len(litriú)
+	eisceachtaí = ()
+	if litriú.startswith('[^'):
+		litir, litriú = litriú[2], litriú[4:]
+		eisceachtaí = (litir + litriú,)
+		fad_íos += 1
+	return Patrún(litriú, fad_íos + len(litriú), eisceachtaí)
+
+
+# A row of a decision table: the verb must match one of the endings in deirí (if there are any),
+# none of the endings in gan, have at least this many syllables, and so on
+class RiailDeiridh(NamedTuple):
+	toradh: object
+	deirí: frozenset = frozenset()
+	gan: frozenset = frozenset()
+	siollaí: int = 0
+	gearr: bool = False  # must not have a long ending, see deireadh_fada()
+	uimhir: int = None  # only for this conjugation
+
+
+_deirí_scartha = frozenset(['+eir', '+oir', '+uir', '+[^a]ghair'])
+
+# which conjugation a verb is in, for cén_aicme(), checked in order
+tábla_aicmí = (
+	RiailDeiridh(2, frozenset(['igh', 'ir', 'il', 'in', 'is', 'ing']), _deirí_scartha | {'uigh'}, siollaí=2, gearr=True),
+	RiailDeiridh(2, frozenset(['dhaill', 'nill'])),
+	RiailDeiridh(1.5, frozenset(['igh', 'ígh']), gearr=True),
+	RiailDeiridh(1),
+)
+
+# how the stem of a verb is found, for anailísigh(), checked in order
+tábla_fréamhacha = (
+	# form stems for verbs ending in -igh, -il, -ir, -in and -is
+	RiailDeiridh('igh', frozenset(['igh', 'ígh'])),
+	# most verbs ending in -áil are stemmed to -ál, except for the ones that aren't
+	RiailDeiridh('áil', frozenset(['++áil']), frozenset(['dháil'])),
+	RiailDeiridh('áin', frozenset(['+páin', '+peáin'])),
+	RiailDeiridh('aic', frozenset(['+aic', '+aid'])),
+	RiailDeiridh('aill', frozenset(['aill']), siollaí=2),
+	RiailDeiridh('ill', frozenset(['ill']), uimhir=2),
+	RiailDeiridh('coimriú', gan=_deirí_scartha, siollaí=2, gearr=True),
+	RiailDeiridh('gan_athrú'),
+)
+
+# other endings that change how a verb is conjugated
+_deirí_eile = ('áil', 'iaigh', 'uaigh', '[^á]il', '[^á]ir', '[^á]in', '[^á]is')
+
+_patrúin = {patrún: déan_patrún(patrún) for patrún in sorted(
+	{p for riail in tábla_aicmí + tábla_fréamhacha for p in riail.deirí | riail.gan}.union(_deirí_eile))}
+
+
+# reverse suffix trie of every ending the patterns need
+# each node maps the next letter back from the end to the next node, and None to the ending that stops there
+# along with the patterns that have that ending
+def _déan_crann() -> dict:
+	crann = {}
+	for ainm, patrún in _patrúin.items():
+		for litriú in (patrún.litriú,) + patrún.eisceachtaí:
+			nód = crann
+			for litir in reversed(litriú):
+				nód = nód.setdefault(litir, {})
+			nód.setdefault(None, (litriú, []))
+		nód = crann
+		for litir in reversed(patrún.litriú):
+			nód = nód[litir]
+		nód[None][1].append((ainm, patrún))
+	return crann
+
+
+_crann_deirí = _déan_crann()
+
+
+# What the decision tables need to know about a verb, worked out in one pass over its ending
+class Próifíl(NamedTuple):
+	deirí: frozenset  # the patterns from the tables that the verb matches
+	siollaí: int
+	fada: bool  # see deireadh_fada()
+
+
+@lru_cache(maxsize=4096)
+def próifíl(briathar: str) -> Próifíl:
+	litrithe = set()
+	iarrthóirí = []
+	nód = _crann_deirí
+	for litir in reversed(briathar):
+		nód = nód.get(litir)
+		if nód is None:
+			break
+		if None in nód:
+			litriú, patrúin = nód[None]
+			litrithe.add(litriú)
+			iarrthóirí += patrúin
+	deirí = frozenset(ainm for ainm, patrún in iarrthóirí
+	                  if len(briathar) >= patrún.fad_íos and not litrithe.intersection(patrún.eisceachtaí))
+	fada = gutaí_deireanach(briathar) is not None and bool(deireadh_fada(briathar))
+	return Próifíl(deirí, comhair_siollaí(briathar), fada)
+
+
+# the first row of a decision table that fits a verb
+def roghnaigh(tábla: tuple, p: Próifíl, uimhir: int = None):
+	for riail in tábla:
+		if (not riail.deirí or riail.deirí & p.deirí) and not riail.gan & p.deirí and p.siollaí >= riail.siollaí \
+				and not (riail.gearr and p.fada) and (riail.uimhir is None or riail.uimhir == uimhir):
+			return riail.toradh
+
+
+# find the stem of a verb
+# results are cached, check anailísigh.cache_info() for the hit rate
+@lru_cache(maxsize=4096)
+def anailísigh(briathar: str, uimhir: int) -> Anailís:
+	p = próifíl(briathar)
+	riail = roghnaigh(tábla_fréamhacha, p, uimhir)
+	if riail == 'igh':
+		fréamh = sub(r"^((?:.+[^a])|.)a?[ií]gh$", r"\1", briathar)
+		caol = briathar[-4] not in "aáoóuú"
+	elif riail == 'áil':
+		fréamh = sub(r"(á)i(l)$", r"\1\2", briathar)
+		caol = False
+	elif riail == 'áin':
+		fréamh = sub(r"(á)i(n)$", r"\1\2", briathar)
+		caol = False
+	elif riail == 'aic':
+		fréamh = sub(r"ai([cd])$", r"a\1", briathar)
+		caol = False
+	elif riail == 'aill':
+		fréamh = sub(r"aill$", uimhir == 1 and 'all' or 'l', briathar)
+		caol = False
+	elif riail == 'ill':
+		fréamh = sub(r"n?ill$", 'l', briathar)
+		caol = True
+	elif riail == 'coimriú':
+		fréamh = sub(r"^(.+[^aá])[a]?i(?:([lrns])|(gh))$", r"\1\2", briathar)
+		if 'igh' in p.deirí:
+			caol = briathar[-4] not in "aáoóuú"
+		elif p.deirí & {'[^á]il', '[^á]ir', '[^á]in', '[^á]is'}:
+			caol = briathar[-3] not in "aáoóuú"
+		else:
+			caol = guta_deireanach(briathar) in "eéií"
+	else:
+		fréamh = briathar
+		caol = guta_deireanach(briathar) in "eéií"
+
+	return Anailís(briathar, fréamh, caol, uimhir,
+	               deireadh_áil='áil' in p.deirí,
+	               deireadh_iaigh='iaigh' in p.deirí,
+	               deireadh_igh_fada='igh' in p.deirí and p.fada,
+	               deireadh_uaigh='uaigh' in p.deirí,
+	               riail=riail)
+
+
+# Rule objects that can be frozen once the rule tables are built so they can be shared
+# between calls and threads without anyone modifying them
+class Reoiteach:
+	_reoite = False
+
+	def __setattr__(self, ainm, luach):
+		if self._reoite:
+			raise AttributeError(f"cannot modify frozen {type(self).__name__} rule")
+		super().__setattr__(ainm, luach)
+
+	# freeze this object and every rule object it holds
+	def reoigh(self):
+		for luach in vars(self).values():
+			if isinstance(luach, Reoiteach):
+				luach.reoigh()
+		object.__setattr__(self, '_reoite', True)
+		return self
+
+
+_gan_deireadh = déan_deireadh('')  # for forms that are just the verb
+
+
 # Defines a specific form of a verb with various rules
 # e.g. the first person singular affirmative form for a first conjugation verb 
 #      is a synthetic form with an ending "aim" or "im"
 #      -> foirm=Foirm.táite, deireadh_tháite="[a]im" 
-class Leagan:
+class Leagan(Reoiteach):
 	def __init__(self, *, mír:str=None, urú:bool=None, séimhiú:bool=None,
 	             forainmnigh:bool=None, foirm:Foirm=None, deireadh_tháite:str=None):
 		self.mír = mír
@@ -149,11 +532,18 @@ class Leagan:
 		self.deireadh_tháite = deireadh_tháite
 		self.forainmnigh = forainmnigh
 		self.mumhan = None
+		self._deireadh_tháite = deireadh_tháite is not None and déan_deireadh(deireadh_tháite) or None
 
 	# conjugate
-	def réimnigh(self, briathar, deireadh_scartha, leaganacha, forainm, réimniú, mumhan, aibhsiú):
+	def réimnigh(self, anailís: Anailís, deireadh_scartha: Deireadh, leaganacha, forainm, mumhan, aibhsiú):
 		aschur = []  # output stored in list
+		briathar = anailís.briathar
+		fréamh = anailís.fréamh
+		guta_fréimhe = fréamh and cuir_fada(fréamh[-1]).casefold()  # to compare with the ending for doubled vowels
 		leagan = (mumhan and self.mumhan) and self.mumhan or self  # check if we're using the Munster form
+		ionstr = ionstraim
+		if ionstr and leagan is not self:
+			ionstr.cuntas('leagan', 'mumhan')
 
 		for bunleagan in leaganacha:
 			# Build rules from hierarchy. If this object has a rule specified itself, use that
@@ -164,39 +554,7 @@ class Leagan:
 			séimhiú = leagan.séimhiú is None and (bunleagan is None or None or bunleagan.séimhiú) or leagan.séimhiú
 			forainmnigh = leagan.forainmnigh is None and (bunleagan is None or None or bunleagan.forainmnigh) or leagan.forainmnigh
 
-			# form stems for verbs ending in -igh, -il, -ir, -in and -is
-			if críochnaigh_le(briathar, ['igh', 'ígh']):
-				fréamh = sub(r"^((?:.+[^a])|.)a?[ií]gh$", r"\1", briathar)
-				caol = briathar[-4] not in "aáoóuú"
-			# most verbs ending in -áil are stemmed to -ál, except for the ones that aren't
-			elif briathar.endswith("áil") and len(briathar) > 4 and not briathar.endswith("dháil"):
-				fréamh = sub(r"(á)i(l)$", r"\1\2", briathar)
-				caol = False
-			elif match(r".+pe?áin$", briathar):
-				fréamh = sub(r"(á)i(n)$", r"\1\2", briathar)
-				caol = False
-			elif match(r".+ai[cd]$", briathar):
-				fréamh = sub(r"ai([cd])$", r"a\1", briathar)
-				caol = False
-			elif briathar.endswith('aill') and comhair_siollaí(briathar) > 1:
-				fréamh = sub(r"aill$", réimniú == 1 and 'all' or 'l', briathar)
-				caol = False
-			elif briathar.endswith('ill') and réimniú == 2:
-				fréamh = sub(r"n?ill$", 'l', briathar)
-				caol = True
-			elif comhair_siollaí(briathar) > 1 and not deireadh_fada(briathar) and not match(r".+[eou]ir$", briathar)\
-					and not match(r".+[^a]ghair$", briathar):
-				fréamh = sub(r"^(.+[^aá])[a]?i(?:([lrns])|(gh))$", r"\1\2", briathar)
-				if briathar.endswith('igh'):
-					caol = briathar[-4] not in "aáoóuú"
-				elif match(r".*[^á]i[lrns]$", briathar):
-					caol = briathar[-3] not in "aáoóuú"
-				else:
-					caol = guta_deireanach(briathar) in "eéií"
-			else:
-				fréamh = briathar
-				caol = guta_deireanach(briathar) in "eéií"
-
+			caol = anailís.caol
 			céad_litir = briathar[0]  # first letter
 			litreacha_eile = (foirm == Foirm.infinideach) and briathar[1:] or fréamh[1:]  # rest of the word
 
@@ -205,6 +563,11 @@ class Leagan:
 
 			# prefix
 			réimnír = urú and uraigh(céad_litir) or ''
+			if ionstr:
+				if s:
+					ionstr.cuntas('claochlú', 'séimhiú')
+				if urú:
+					ionstr.cuntas('claochlú', 'urú')
 
 			if mír is None:
 				mír = ''
@@ -212,9 +575,13 @@ class Leagan:
 			# 'go' causes vowels to take an n- prefix
 			elif mír == 'go' and is_guta(céad_litir):
 				réimnír = 'n-'
+				if ionstr:
+					ionstr.cuntas('claochlú', 'go_n')
 			# 'ná' causes vowels to take a h- prefix
 			elif mír == 'ná' and is_guta(céad_litir):
 				réimnír = 'h'
+				if ionstr:
+					ionstr.cuntas('claochlú', 'ná_h')
 			# 'do' is supressed unless the verb starts with a vowel or we're using the Munster dialect
 			elif mír == 'do':
 				if is_guta(céad_litir) or (céad_litir == 'f' and s == 'h'):
@@ -222,48 +589,70 @@ class Leagan:
 					# hack to supress d' prefix for past tense autonomous form
 					if forainm is None and leagan.deireadh_tháite.endswith("dh"):
 						réimnír = ''
+					if ionstr:
+						ionstr.cuntas('claochlú', réimnír and "d'" or "d'_saor")
 					mír = ''
 				else:
 					mír = mumhan and 'do' or ''
+					if ionstr and mumhan:
+						ionstr.cuntas('claochlú', 'do_mumhan')
 
-			# raw verb ending definition that includes both slender and broad form information
-			amhdheireadh = {Foirm.táite: leagan.deireadh_tháite,
-			                Foirm.scartha: deireadh_scartha,
-			                Foirm.infinideach: ''}[foirm]
+			# verb ending with both its slender and broad forms
+			d = foirm == Foirm.táite and leagan._deireadh_tháite or foirm == Foirm.scartha and deireadh_scartha or _gan_deireadh
 
 			# some verbs with long vowel endings have special behaviour for endings starting with t or f
-			if briathar.endswith('áil') and litreacha_eile.endswith('ál') and amhdheireadh.startswith('t'):
+			if anailís.deireadh_áil and litreacha_eile.endswith('ál') and d.t:
 				caol = True
 				litreacha_eile = litreacha_eile[:-2] + 'áil'
-			elif briathar.endswith('iaigh') and amhdheireadh and amhdheireadh[0] in 'ft':
+				if ionstr:
+					ionstr.cuntas('deireadh', 'áil_t')
+			elif anailís.deireadh_iaigh and d.f_nó_t:
 				caol = False
 				litreacha_eile = litreacha_eile + 'a'
-			elif briathar.endswith('igh') and deireadh_fada(briathar) and amhdheireadh.startswith('t'):
+				if ionstr:
+					ionstr.cuntas('deireadh', 'iaigh_ft')
+			elif anailís.deireadh_igh_fada and d.t:
 				caol = True
 				litreacha_eile = litreacha_eile + 'i'
+				if ionstr:
+					ionstr.cuntas('deireadh', 'igh_fada_t')
 
 
 			# form the ending
-			deireadh = leath_nó_caolaigh(amhdheireadh, caol)  # form the analytic ending
+			deireadh = d[caol]
 
 			# remove double vowels if the stem ends with the same letter the ending starts with
-			if deireadh and fréamh and cuir_fada(fréamh[-1]).casefold() == cuir_fada(deireadh[0]).casefold():
+			if guta_fréimhe and guta_fréimhe == d.tús[caol]:
 				deireadh = deireadh[1:]
+				if ionstr:
+					ionstr.cuntas('deireadh', 'guta_dúbailte')
 			# if stem ends in ó or ú and ending ends in a, remove the a
 			elif deireadh and litreacha_eile and críochnaigh_le(litreacha_eile, ['ó', 'ú', 'o']) and deireadh.startswith('a'):
 				deireadh = deireadh[1:]
-			elif deireadh and réimniú == 1 and (deireadh.startswith('t') or deireadh.startswith('f')) and (céad_litir + litreacha_eile).endswith('é') and not deireadh.endswith('imis'):
+				if ionstr:
+					ionstr.cuntas('deireadh', 'ó_ú_a')
+			elif deireadh and anailís.uimhir == 1 and (deireadh.startswith('t') or deireadh.startswith('f')) and (céad_litir + litreacha_eile).endswith('é') and not deireadh.endswith('imis'):
 				deireadh = f"i{deireadh}"
+				if ionstr:
+					ionstr.cuntas('deireadh', 'é_i')
 			# if stem ends in th and ending ends starts with t, cut off th
 			elif deireadh and litreacha_eile and deireadh.startswith('t') and litreacha_eile.endswith('th'):
 				litreacha_eile = litreacha_eile[:-2]
-			elif briathar.endswith('uaigh') and litreacha_eile.endswith('ui') and deireadh.startswith('t'):
+				if ionstr:
+					ionstr.cuntas('deireadh', 'th_t')
+			elif anailís.deireadh_uaigh and litreacha_eile.endswith('ui') and deireadh.startswith('t'):
 				litreacha_eile = litreacha_eile[:-1] + 'ai'
-			elif briathar.endswith('uaigh') and litreacha_eile.endswith('u') and deireadh.startswith('f'):
+				if ionstr:
+					ionstr.cuntas('deireadh', 'uaigh_t')
+			elif anailís.deireadh_uaigh and litreacha_eile.endswith('u') and deireadh.startswith('f'):
 				litreacha_eile += 'a'
+				if ionstr:
+					ionstr.cuntas('deireadh', 'uaigh_f')
 			# analytic 3rd person plural Munster forms that would normally end in an lenited d end in an unlenited d instead
 			if mumhan and foirm == Foirm.scartha and forainm == 'siad' and deireadh.endswith('idh'):
 				deireadh = deireadh[:-1]
+				if ionstr:
+					ionstr.cuntas('deireadh', 'siad_idh_mumhan')
 
 			# if we didn't specify if pronouns should be shown or not
 			# then show them unless we're using a synthetic form
@@ -271,23 +660,37 @@ class Leagan:
 				forainm = ''
 
 			if aibhsiú:
-				focal = f"{aibhsigh(réimnír)}{céad_litir}{aibhsigh(s)}{litreacha_eile}{aibhsigh(deireadh)}"
-				aschur.append(f"{mír and mír + ' ' or ''}{focal}{forainm and ' ' + aibhsigh(forainm) or ''}")
+				píosaí = mír and [('mír', mír), (None, ' ')] or []
+				píosaí += [('réimír', réimnír), ('céad_litir', céad_litir), ('séimhiú', s), ('fréamh', litreacha_eile),
+				           ('deireadh', deireadh)]
+				if forainm:
+					píosaí += [(None, ' '), ('forainm', forainm)]
+				aschur.append(LeaganRoinnte(píosaí))
 			else:
 				focal = f"{réimnír}{céad_litir}{s}{litreacha_eile}{deireadh}"
 				aschur.append(f"{mír and mír + ' ' or ''}{focal}{forainm and ' ' + forainm or ''}")
 		return aschur
 
+	# whether the Munster form can be different from the standard one for any verb
+	# these are the only places réimnigh() looks at the dialect, so if this is False the forms are always the same
+	def canúnach(self, bunleagan, deireadh_scartha: Deireadh, deireadh_scartha_mumhan: Deireadh, forainm) -> bool:
+		if self.mumhan:
+			return True
+		# worked out the same way as in réimnigh()
+		foirm = self.foirm or bunleagan and bunleagan.forainmnigh or Foirm.táite
+		mír = self.mír is None and (bunleagan is None or None or bunleagan.mír) or self.mír
+		return mír == 'do' or foirm == Foirm.scartha and (deireadh_scartha != deireadh_scartha_mumhan or forainm == 'siad')
+
 
 # Person
-class Pearsa:
+class Pearsa(Reoiteach):
 	def __init__(self):
 		self.uatha = None
 		self.iorla = None
 
 
 # Tense
-class Aimsir:
+class Aimsir(Reoiteach):
 	def __init__(self, ainm: str):
 		self.ainm = ainm
 		self.céad_phearsa = Pearsa()
@@ -300,9 +703,63 @@ class Aimsir:
 		self.diúltach = Leagan(mír='ní', séimhiú=True)
 		self.ceisteach = Leagan(mír='an', urú=True)
 
+	# rules for a person
+	def leagan_pearsan(self, p: FoghaPearsan) -> Leagan:
+		if p == FoghaPearsan.céad_uatha:
+			return self.céad_phearsa.uatha
+		if p == FoghaPearsan.dara_uatha:
+			return self.dara_pearsa.uatha
+		if p == FoghaPearsan.tríú_uatha:
+			return self.tríú_pearsa.uatha
+		if p == FoghaPearsan.céad_iorla:
+			return self.céad_phearsa.iorla
+		if p == FoghaPearsan.dara_iorla:
+			return self.dara_pearsa.iorla
+		if p == FoghaPearsan.tríú_iorla:
+			return self.tríú_pearsa.iorla
+		if p == FoghaPearsan.briathar_saor:
+			return self.briathar_saor
+
+	# rules for an affirmative, negative or interrogative form, None if this tense doesn't have it
+	def bunleagan(self, f: FoghaFoirme) -> Leagan:
+		if f == FoghaFoirme.dhearfach:
+			return self.dearfach
+		if f == FoghaFoirme.dhiúltach:
+			return self.diúltach
+		if f == FoghaFoirme.cheisteach:
+			return self.ceisteach
+
+	# analytic ending for a dialect, with its broad and slender forms worked out
+	def deireadh(self, mumhan: bool) -> Deireadh:
+		return déan_deireadh((mumhan and self.deireadh_scartha_mumhan) and self.deireadh_scartha_mumhan or self.deireadh_scartha)
+
+
+# The rules for one tense picked out by Réimniú.pleanáil()
+class PleanAimsire(NamedTuple):
+	aimsir: FoghaAimsire
+	ainm: str
+	deireadh_scartha: Deireadh
+	foirmeacha: tuple  # Leagan for each of affirmative, negative and interrogative forms asked for
+	foghannaFoirmeacha: tuple  # which form each of those is
+	pearsana: tuple  # (FoghaPearsan, Leagan) for each person asked for
+
+
+# Plans made by Réimniú.pleanáil_canúintí() for conjugating both dialects at once
+class PleanCanúintí(NamedTuple):
+	caighdeánach: tuple  # plan from pleanáil() for the standard dialect
+	mumhan: tuple  # and for Munster
+	canúnach: tuple  # for each tense, for each person, which forms can be different in Munster and their rules
+
+
+# The standard and Munster versions of one form
+class LeaganCanúna(NamedTuple):
+	caighdeánach: str
+	mumhan: str
+	difriúil: bool  # whether they're different for this verb
+
 
 # Conjugation
-class Réimniú:
+class Réimniú(Reoiteach):
 	def __init__(self):
 		self.a_chaite = Aimsir("an aimsir chaite")
 		self.a_gchaite = Aimsir("an aimsir ghnáthchaite")
@@ -320,42 +777,124 @@ class Réimniú:
 		                FoghaAimsire.coinníollach: self.m_coinn}
 		self.uimhir = 1
 
-	# conjugate
-	def réimnigh(self, fréamh: str, foghannaAimsirí: list, foghannaPearsana: list, foghannaFoirmeacha: list, mumhan: bool, aibhsigh: bool):
-		aschur = []
+	def reoigh(self):
+		if not self._reoite:
+			self.aimsirí = MappingProxyType(self.aimsirí)
+		return super().reoigh()
+
+	# for the snapshot of the rules, as a mapping proxy can't be pickled
+	def __getstate__(self):
+		return {**vars(self), 'aimsirí': dict(self.aimsirí)}
+
+	def __setstate__(self, staid: dict):
+		vars(self).update(staid)
+		if self._reoite:
+			object.__setattr__(self, 'aimsirí', MappingProxyType(self.aimsirí))
+
+	# work out which rules are needed for the given tenses, persons and forms
+	# this doesn't depend on the verb so one plan can be used for many verbs
+	def pleanáil(self, foghannaAimsirí: list, foghannaPearsana: list, foghannaFoirmeacha: list, mumhan: bool) -> tuple:
+		ionstr = ionstraim
+		tús = ionstr and perf_counter()
+		foghannaPearsana = list(foghannaPearsana)
+		foghannaFoirmeacha = list(foghannaFoirmeacha)
+		plean = []
 		for a in foghannaAimsirí:
 			aimsir = self.aimsirí.get(a)
 			foirmeacha = []
+			fogha_foirmeacha = []
 
 			for f in foghannaFoirmeacha:
-				if f == FoghaFoirme.dhearfach and aimsir.dearfach:
-					foirmeacha.append(aimsir.dearfach)
-				if f == FoghaFoirme.dhiúltach and aimsir.diúltach:
-					foirmeacha.append(aimsir.diúltach)
-				if f == FoghaFoirme.cheisteach and aimsir.ceisteach:
-					foirmeacha.append(aimsir.ceisteach)
-
-			deireadh = (mumhan and aimsir.deireadh_scartha_mumhan) and aimsir.deireadh_scartha_mumhan or aimsir.deireadh_scartha
+				bunleagan = aimsir.bunleagan(f)
+				if bunleagan:
+					foirmeacha.append(bunleagan)
+					fogha_foirmeacha.append(f)
+
+			pearsana = tuple((p, aimsir.leagan_pearsan(p)) for p in foghannaPearsana)
+			plean.append(PleanAimsire(a, aimsir.ainm, aimsir.deireadh(mumhan), tuple(foirmeacha), tuple(fogha_foirmeacha), pearsana))
+		if ionstr:
+			ionstr.am('pleanáil', tús)
+		return tuple(plean)
+
+	# conjugate following a plan made by pleanáil()
+	def réimnigh_de_réir_plean(self, fréamh: str, plean: tuple, mumhan: bool, aibhsigh: bool):
+		ionstr = ionstraim
+		tús = ionstr and perf_counter()
+		anailís = anailísigh(fréamh, self.uimhir)
+		if ionstr:
+			ionstr.am('fréamh', tús)
+			ionstr.cuntas('fréamh', anailís.riail)
+			tús = perf_counter()
+		aschur = []
+		for a in plean:
+			pearsana = [leagan.réimnigh(anailís, a.deireadh_scartha, a.foirmeacha, p.forainm, mumhan, aibhsigh) for p, leagan in a.pearsana]
+			aschur.append({'ainm': a.ainm, 'pearsana': pearsana})
+		if ionstr:
+			ionstr.am('réimniú', tús)
+		return aschur
+
+	# plan for conjugating both dialects at once, working out which forms can be different in Munster
+	def pleanáil_canúintí(self, foghannaAimsirí: list, foghannaPearsana: list, foghannaFoirmeacha: list) -> PleanCanúintí:
+		plean = self.pleanáil(foghannaAimsirí, foghannaPearsana, foghannaFoirmeacha, False)
+		plean_mumhan = self.pleanáil(foghannaAimsirí, foghannaPearsana, foghannaFoirmeacha, True)
+		canúnach = []
+		for a, am in zip(plean, plean_mumhan):
+			pearsana = []
+			for p, leagan in a.pearsana:
+				innéacsanna = tuple(i for i, bunleagan in enumerate(a.foirmeacha)
+				                    if leagan.canúnach(bunleagan, a.deireadh_scartha, am.deireadh_scartha, p.forainm))
+				pearsana.append((innéacsanna, tuple(am.foirmeacha[i] for i in innéacsanna)))
+			canúnach.append(tuple(pearsana))
+		return PleanCanúintí(plean, plean_mumhan, tuple(canúnach))
+
+	# conjugate the standard and Munster forms together, following a plan made by pleanáil_canúintí()
+	# the stem is only found once, and only forms that can be different in Munster are conjugated again
+	def réimnigh_canúintí(self, fréamh: str, plean: PleanCanúintí, aibhsigh: bool):
+		ionstr = ionstraim
+		tús = ionstr and perf_counter()
+		anailís = anailísigh(fréamh, self.uimhir)
+		if ionstr:
+			ionstr.am('fréamh', tús)
+			ionstr.cuntas('fréamh', anailís.riail)
+			tús = perf_counter()
+		aschur = []
+		for a, am, canúnach_aimsire in zip(plean.caighdeánach, plean.mumhan, plean.canúnach):
 			pearsana = []
-			aschur_aimsire = {'ainm': aimsir.ainm, 'pearsana': pearsana}
-			for p in foghannaPearsana:
-				if p == FoghaPearsan.céad_uatha:
-					pearsana.append(aimsir.céad_phearsa.uatha.réimnigh(fréamh, deireadh, foirmeacha, p.forainm, self.uimhir, mumhan, aibhsigh))
-				if p == FoghaPearsan.dara_uatha:
-					pearsana.append(aimsir.dara_pearsa.uatha.réimnigh(fréamh, deireadh, foirmeacha, p.forainm, self.uimhir, mumhan, aibhsigh))
-				if p == FoghaPearsan.tríú_uatha:
-					pearsana.append(aimsir.tríú_pearsa.uatha.réimnigh(fréamh, deireadh, foirmeacha, p.forainm, self.uimhir, mumhan, aibhsigh))
-				if p == FoghaPearsan.céad_iorla:
-					pearsana.append(aimsir.céad_phearsa.iorla.réimnigh(fréamh, deireadh, foirmeacha, p.forainm, self.uimhir, mumhan, aibhsigh))
-				if p == FoghaPearsan.dara_iorla:
-					pearsana.append(aimsir.dara_pearsa.iorla.réimnigh(fréamh, deireadh, foirmeacha, p.forainm, self.uimhir, mumhan, aibhsigh))
-				if p == FoghaPearsan.tríú_iorla:
-					pearsana.append(aimsir.tríú_pearsa.iorla.réimnigh(fréamh, deireadh, foirmeacha, p.forainm, self.uimhir, mumhan, aibhsigh))
-				if p == FoghaPearsan.briathar_saor:
-					pearsana.append(aimsir.briathar_saor.réimnigh(fréamh, deireadh, foirmeacha, p.forainm, self.uimhir, mumhan, aibhsigh))
-			aschur.append(aschur_aimsire)
+			for (p, leagan), (innéacsanna, foirmeacha_mumhan) in zip(a.pearsana, canúnach_aimsire):
+				ró = leagan.réimnigh(anailís, a.deireadh_scartha, a.foirmeacha, p.forainm, False, aibhsigh)
+				ró_canúintí = [LeaganCanúna(c, c, False) for c in ró]
+				if innéacsanna:
+					leaganacha = leagan.réimnigh(anailís, am.deireadh_scartha, foirmeacha_mumhan, p.forainm, True, aibhsigh)
+					for i, m in zip(innéacsanna, leaganacha):
+						ró_canúintí[i] = LeaganCanúna(ró[i], m, ró[i] != m)
+				pearsana.append(ró_canúintí)
+			aschur.append({'ainm': a.ainm, 'pearsana': pearsana})
+		if ionstr:
+			ionstr.am('réimniú', tús)
 		return aschur
 
+	# conjugate a single form, without working out anything else
+	def réimnigh_cill(self, fréamh: str, a: FoghaAimsire, p: FoghaPearsan, f: FoghaFoirme, mumhan: bool, aibhsigh: bool):
+		aimsir = self.aimsirí.get(a)
+		bunleagan = aimsir.bunleagan(f)
+		if bunleagan:
+			ionstr = ionstraim
+			tús = ionstr and perf_counter()
+			anailís = anailísigh(fréamh, self.uimhir)
+			if ionstr:
+				ionstr.am('fréamh', tús)
+				ionstr.cuntas('fréamh', anailís.riail)
+				tús = perf_counter()
+			leagan = aimsir.leagan_pearsan(p).réimnigh(anailís, aimsir.deireadh(mumhan), (bunleagan,), p.forainm, mumhan, aibhsigh)[0]
+			if ionstr:
+				ionstr.am('réimniú', tús)
+			return leagan
+
+	# conjugate
+	def réimnigh(self, fréamh: str, foghannaAimsirí: list, foghannaPearsana: list, foghannaFoirmeacha: list, mumhan: bool, aibhsigh: bool):
+		plean = self.pleanáil(foghannaAimsirí, foghannaPearsana, foghannaFoirmeacha, mumhan)
+		return self.réimnigh_de_réir_plean(fréamh, plean, mumhan, aibhsigh)
+
 
 # define conjugation rules
 def déan_rialacha():
@@ -631,29 +1170,680 @@ def déan_rialacha():
 	return {1: céad_réimniú, 1.5: céad_réimniú_igh, 2: dara_réimniú}
 
 
+# shared rule tables, built on first use by faigh_rialacha()
+_rialacha = None
+_glas_rialacha = Lock()
+
+
+# get the conjugation rules, building and freezing them the first time they're needed
+# the same read-only tables are returned on every call so they're never copied
+# they're read from the snapshot of the rules if there's one for this version of the code, along with the
+# irregular verbs
+def faigh_rialacha() -> Mapping[float, Réimniú]:
+	global _rialacha, _neamhrialta
+	if _rialacha is None:
+		with _glas_rialacha:
+			if _rialacha is None:
+				ionstr = ionstraim
+				tús = ionstr and perf_counter()
+				reoite = _léigh_rialacha_reoite()
+				if reoite:
+					rialacha, neamhrialta = reoite
+					_neamhrialta = MappingProxyType(neamhrialta)
+				else:
+					rialacha = déan_rialacha()
+					for réimniú in rialacha.values():
+						réimniú.reoigh()
+				_rialacha = MappingProxyType(rialacha)
+				if ionstr:
+					ionstr.am('rialacha', tús)
+					ionstr.cuntas('rialacha', reoite and 'léite' or 'tógtha')
+	return _rialacha
+
+
+# Irregular verbs, with every form written out rather than worked out from the rules
+# Each tense has the standard form and the Munster one. foirmeacha is the verb for each person as it is in
+# the affirmative, without its initial mutation and with "+" where the pronoun goes after it. spleách is the
+# same after particles like "ní" and "an" if it's different, and diúltach after "ní" if it's different again.
+# The particles and the mutations they cause are the same as for regular verbs unless míreanna gives them:
+# (particle, mutation) for each of the affirmative, negative and interrogative, where the mutation is 's' for
+# lenition, 'u' for eclipsis or '' for neither. Munster has the same particles as the standard unless it gives
+# its own, and the autonomous form has the same as the other persons unless míreanna_saor gives its own.
+class AimsirNeamhrialta(NamedTuple):
+	foirmeacha: str
+	spleách: str = None
+	diúltach: str = None
+	míreanna: tuple = None
+	míreanna_saor: tuple = None
+
+
+_ní_an = (('do', 's'), ('ní', 's'), ('an', 'u'))  # a past tense with "ní" and "an" rather than "níor" and "ar"
+_níor_ar = (('do', 's'), ('níor', 's'), ('ar', 's'))  # the usual past tense
+_níor_ar_saor = (('do', ''), ('níor', ''), ('ar', ''))  # and its autonomous form
+_gan_séimhiú = ((None, ''), ('ní', ''), ('an', 'u'))  # "abair" is never lenited
+
+briathra_neamhrialta = {
+	'abair': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("dúirt+ dúirt+ dúirt+ dúramar dúirt+ dúirt+ dúradh", míreanna=_gan_séimhiú),
+			AimsirNeamhrialta("dúrt dúrais dúirt+ dúramair dúrabhair dúradar dúradh")),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("deirinn deirteá deireadh+ deirimis deireadh+ deiridís deirtí", míreanna=_gan_séimhiú),
+			AimsirNeamhrialta("deirinn deirtheá deireadh+ deirimís deireadh+ deiridís deirtí")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("deirim deir+ deir+ deirimid deir+ deir+ deirtear", míreanna=_gan_séimhiú),
+			AimsirNeamhrialta("deirim deirir deir+ deirimíd deir+ deirid+ deirtear")),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("déarfaidh+ déarfaidh+ déarfaidh+ déarfaimid déarfaidh+ déarfaidh+ déarfar",
+			                  míreanna=_gan_séimhiú),
+			AimsirNeamhrialta("déarfad déarfair déarfaidh+ déarfaimíd déarfaidh+ déarfaid+ déarfar")),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("deire+ deire+ deire+ deirimid deire+ deire+ deirtear",
+			                  míreanna=(('go', 'u'), ('nár', ''), None)),
+			AimsirNeamhrialta("deiread deirir deireaidh+ deirimid deireaidh+ deireaid+ deirtear")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("abraim abair abradh+ abraimis abraigí abraidís abairtear"),
+			AimsirNeamhrialta("abraim abair abradh+ abraimís abraidh abraidís abairtear")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("déarfainn déarfá déarfadh+ déarfaimis déarfadh+ déarfaidís déarfaí", míreanna=_gan_séimhiú),
+			AimsirNeamhrialta("déarfainn déarfá déarfadh+ déarfaimís déarfadh+ déarfaidís déarfaí")),
+	},
+	'beir': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("rug+ rug+ rug+ rugamar rug+ rug+ rugadh"),
+			AimsirNeamhrialta("rugas rugais rug+ rugamair rugabhair rugadar rugadh")),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("beirinn beirteá beireadh+ beirimis beireadh+ beiridís beirtí"),
+			AimsirNeamhrialta("beirinn beirtheá beireadh+ beirimís beireadh+ beiridís beirtí")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("beirim beireann+ beireann+ beirimid beireann+ beireann+ beirtear"),
+			AimsirNeamhrialta("beirim beirir beireann+ beirimíd beireann+ beirid+ beirtear")),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("béarfaidh+ béarfaidh+ béarfaidh+ béarfaimid béarfaidh+ béarfaidh+ béarfar"),
+			AimsirNeamhrialta("béarfad béarfair béarfaidh+ béarfaimíd béarfaidh+ béarfaid+ béarfar")),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("beire+ beire+ beire+ beirimid beire+ beire+ beirtear"),
+			AimsirNeamhrialta("beiread beirir beireaidh+ beirimid beireaidh+ beireaid+ beirtear")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("beirim beir beireadh+ beirimis beirigí beiridís beirtear"),
+			AimsirNeamhrialta("beirim beir beireadh+ beirimís beiridh beiridís beirtear")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("béarfainn béarfá béarfadh+ béarfaimis béarfadh+ béarfaidís béarfaí"),
+			AimsirNeamhrialta("béarfainn béarfá béarfadh+ béarfaimís béarfadh+ béarfaidís béarfaí")),
+	},
+	'bí': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("bí+ bí+ bí+ bíomar bí+ bí+ bíothas",
+			                  "raibh+ raibh+ raibh+ rabhamar raibh+ raibh+ rabhthas", míreanna=_ní_an),
+			AimsirNeamhrialta("bíos bís bí+ bíomair bíobhair bíodar bíothas",
+			                  "rabhas rabhais raibh+ rabhamair rabhabhair rabhadar rabhthas")),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("bínn bíteá bíodh+ bímis bíodh+ bídís bítí"),
+			AimsirNeamhrialta("bínn bítheá bíodh+ bímís bíodh+ bídís bítí")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("táim tá+ tá+ táimid tá+ tá+ táthar",
+			                  "fuilim fuil+ fuil+ fuilimid fuil+ fuil+ fuiltear",
+			                  "nílim níl+ níl+ nílimid níl+ níl+ níltear", míreanna=((None, ''), (None, ''), ('an', 'u'))),
+			AimsirNeamhrialta("táim taoi tá+ táimíd tá+ táid+ táthar",
+			                  "fuilim fuilir fuil+ fuilimíd fuil+ fuilid+ fuiltear",
+			                  "nílim nílir níl+ nílimíd níl+ nílid+ níltear")),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("beidh+ beidh+ beidh+ beimid beidh+ beidh+ beifear"),
+			AimsirNeamhrialta("bead beir beidh+ beimíd beidh+ beid+ beifear")),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("raibh+ raibh+ raibh+ rabhaimid raibh+ raibh+ rabhthar"),
+			AimsirNeamhrialta("rabhad rabhair raibh+ rabhaimid raibh+ rabhaid+ rabhthar")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("bím bí bíodh+ bímis bígí bídís bítear"),
+			AimsirNeamhrialta("bím bí bíodh+ bímís bídh bídís bítear")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("beinn beifeá beadh+ beimis beadh+ beidís beifí"),
+			AimsirNeamhrialta("beinn beifeá beadh+ beimís beadh+ beidís beifí")),
+	},
+	'clois': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("cuala+ cuala+ cuala+ cualamar cuala+ cuala+ cualathas", míreanna_saor=_níor_ar),
+			AimsirNeamhrialta("cualas cualais cuala+ cualamair cualabhair cualadar cualathas")),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("cloisinn cloisteá cloiseadh+ cloisimis cloiseadh+ cloisidís cloistí"),
+			AimsirNeamhrialta("cloisinn cloistheá cloiseadh+ cloisimís cloiseadh+ cloisidís cloistí")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("cloisim cloiseann+ cloiseann+ cloisimid cloiseann+ cloiseann+ cloistear"),
+			AimsirNeamhrialta("cloisim cloisir cloiseann+ cloisimíd cloiseann+ cloisid+ cloistear")),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("cloisfidh+ cloisfidh+ cloisfidh+ cloisfimid cloisfidh+ cloisfidh+ cloisfear"),
+			AimsirNeamhrialta("cloisfead cloisfir cloisfidh+ cloisfimíd cloisfidh+ cloisfid+ cloisfear")),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("cloise+ cloise+ cloise+ cloisimid cloise+ cloise+ cloistear"),
+			AimsirNeamhrialta("cloisead cloisir cloiseaidh+ cloisimid cloiseaidh+ cloiseaid+ cloistear")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("cloisim clois cloiseadh+ cloisimis cloisigí cloisidís cloistear"),
+			AimsirNeamhrialta("cloisim clois cloiseadh+ cloisimís cloisidh cloisidís cloistear")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("cloisfinn cloisfeá cloisfeadh+ cloisfimis cloisfeadh+ cloisfidís cloisfí"),
+			AimsirNeamhrialta("cloisfinn cloisfeá cloisfeadh+ cloisfimís cloisfeadh+ cloisfidís cloisfí")),
+	},
+	'déan': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("rinne+ rinne+ rinne+ rinneamar rinne+ rinne+ rinneadh",
+			                  "dearna+ dearna+ dearna+ dearnamar dearna+ dearna+ dearnadh", míreanna=_ní_an),
+			AimsirNeamhrialta("deineas deinis dein+ deineamair deineabhair deineadar deineadh",
+			                  míreanna=_níor_ar, míreanna_saor=_níor_ar_saor)),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("déanainn déantá déanadh+ déanaimis déanadh+ déanaidís déantaí"),
+			AimsirNeamhrialta("deininn deintheá deineadh+ deinimís deineadh+ deinidís deintí")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("déanaim déanann+ déanann+ déanaimid déanann+ déanann+ déantar"),
+			AimsirNeamhrialta("deinim deinir deineann+ deinimíd deineann+ deinid+ deintear")),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("déanfaidh+ déanfaidh+ déanfaidh+ déanfaimid déanfaidh+ déanfaidh+ déanfar"),
+			AimsirNeamhrialta("déanfad déanfair déanfaidh+ déanfaimíd déanfaidh+ déanfaid+ déanfar")),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("déana+ déana+ déana+ déanaimid déana+ déana+ déantar"),
+			AimsirNeamhrialta("deinead deinir deineaidh+ deinimid deineaidh+ deineaid+ deintear")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("déanaim déan déanadh+ déanaimis déanaigí déanaidís déantar"),
+			AimsirNeamhrialta("deinim dein deineadh+ deinimís deinidh deinidís deintear")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("déanfainn déanfá déanfadh+ déanfaimis déanfadh+ déanfaidís déanfaí"),
+			AimsirNeamhrialta("déanfainn déanfá déanfadh+ déanfaimís déanfadh+ déanfaidís déanfaí")),
+	},
+	'faigh': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("fuair+ fuair+ fuair+ fuaireamar fuair+ fuair+ fuarthas",
+			                  míreanna=((None, ''), ('ní', 'u'), ('an', 'u'))),
+			AimsirNeamhrialta("fuaireas fuairis fuair+ fuaireamair fuaireabhair fuaireadar fuarthas")),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("faighinn faighteá faigheadh+ faighimis faigheadh+ faighidís faightí"),
+			AimsirNeamhrialta("faighinn faightheá faigheadh+ faighimís faigheadh+ faighidís faightí")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("faighim faigheann+ faigheann+ faighimid faigheann+ faigheann+ faightear"),
+			AimsirNeamhrialta("faighim faighir faigheann+ faighimíd faigheann+ faighid+ faightear")),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("geobhaidh+ geobhaidh+ geobhaidh+ geobhaimid geobhaidh+ geobhaidh+ geofar",
+			                  "faighidh+ faighidh+ faighidh+ faighimid faighidh+ faighidh+ faighfear",
+			                  míreanna=((None, 's'), ('ní', 'u'), ('an', 'u'))),
+			AimsirNeamhrialta("geobhad geobhair geobhaidh+ geobhaimíd geobhaidh+ geobhaid+ geofar",
+			                  "faighead faighir faighidh+ faighimíd faighidh+ faighid+ faighfear")),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("faighe+ faighe+ faighe+ faighimid faighe+ faighe+ faightear"),
+			AimsirNeamhrialta("faighead faighir faigheaidh+ faighimid faigheaidh+ faigheaid+ faightear")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("faighim faigh faigheadh+ faighimis faighigí faighidís faightear"),
+			AimsirNeamhrialta("faighim faigh faigheadh+ faighimís faighidh faighidís faightear")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("geobhainn geofá geobhadh+ geobhaimis geobhadh+ geobhaidís geofaí",
+			                  "faighinn faighfeá faigheadh+ faighimis faigheadh+ faighidís faighfí",
+			                  míreanna=(('do', 's'), ('ní', 'u'), ('an', 'u'))),
+			AimsirNeamhrialta("geobhainn geofá geobhadh+ geobhaimís geobhadh+ geobhaidís geofaí",
+			                  "faighinn faighfeá faigheadh+ faighimís faigheadh+ faighidís faighfí")),
+	},
+	'feic': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("conaic+ conaic+ conaic+ conaiceamar conaic+ conaic+ conacthas",
+			                  "faca+ faca+ faca+ facamar faca+ faca+ facthas", míreanna=_ní_an),
+			AimsirNeamhrialta("conac conaicís conaic+ conaiceamair conaiceabhair conaiceadar conacthas",
+			                  "feaca feacaís feaca+ feacamair feacabhair feacadar feacthas")),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("feicinn feicteá feiceadh+ feicimis feiceadh+ feicidís feictí"),
+			AimsirNeamhrialta("cínn cítheá cíodh+ címís cíodh+ cídís cítí",
+			                  "feicinn feictheá feiceadh+ feicimís feiceadh+ feicidís feictí")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("feicim feiceann+ feiceann+ feicimid feiceann+ feiceann+ feictear"),
+			AimsirNeamhrialta("cím cír cíonn+ címíd cíonn+ cíd+ cítear",
+			                  "feicim feicir feiceann+ feicimíd feiceann+ feicid+ feictear",
+			                  míreanna=((None, 's'), ('ní', 's'), ('an', 'u')))),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("feicfidh+ feicfidh+ feicfidh+ feicfimid feicfidh+ feicfidh+ feicfear"),
+			AimsirNeamhrialta("cífead cífir cífidh+ cífimíd cífidh+ cífid+ cífear",
+			                  "feicfead feicfir feicfidh+ feicfimíd feicfidh+ feicfid+ feicfear",
+			                  míreanna=((None, 's'), ('ní', 's'), ('an', 'u')))),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("feice+ feice+ feice+ feicimid feice+ feice+ feictear"),
+			AimsirNeamhrialta("feicead feicir feiceaidh+ feicimid feiceaidh+ feiceaid+ feictear")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("feicim feic feiceadh+ feicimis feicigí feicidís feictear"),
+			AimsirNeamhrialta("feicim feic feiceadh+ feicimís feicidh feicidís feictear")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("feicfinn feicfeá feicfeadh+ feicfimis feicfeadh+ feicfidís feicfí"),
+			AimsirNeamhrialta("cífinn cífeá cífeadh+ cífimís cífeadh+ cífidís cífí",
+			                  "feicfinn feicfeá feicfeadh+ feicfimís feicfeadh+ feicfidís feicfí")),
+	},
+	'ith': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("ith+ ith+ ith+ itheamar ith+ ith+ itheadh",
+			                  míreanna_saor=((None, ''), ('níor', ''), ('ar', ''))),
+			AimsirNeamhrialta("itheas ithis ith+ itheamair itheabhair itheadar itheadh")),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("ithinn itheá itheadh+ ithimis itheadh+ ithidís ití"),
+			AimsirNeamhrialta("ithinn itheá itheadh+ ithimís itheadh+ ithidís ití")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("ithim itheann+ itheann+ ithimid itheann+ itheann+ itear"),
+			AimsirNeamhrialta("ithim ithir itheann+ ithimíd itheann+ ithid+ itear")),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("íosfaidh+ íosfaidh+ íosfaidh+ íosfaimid íosfaidh+ íosfaidh+ íosfar"),
+			AimsirNeamhrialta("íosfad íosfair íosfaidh+ íosfaimíd íosfaidh+ íosfaid+ íosfar")),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("ithe+ ithe+ ithe+ ithimid ithe+ ithe+ itear"),
+			AimsirNeamhrialta("ithead ithir itheaidh+ ithimid itheaidh+ itheaid+ itear")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("ithim ith itheadh+ ithimis ithigí ithidís itear"),
+			AimsirNeamhrialta("ithim ith itheadh+ ithimís ithidh ithidís itear")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("íosfainn íosfá íosfadh+ íosfaimis íosfadh+ íosfaidís íosfaí"),
+			AimsirNeamhrialta("íosfainn íosfá íosfadh+ íosfaimís íosfadh+ íosfaidís íosfaí")),
+	},
+	'tabhair': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("tug+ tug+ tug+ tugamar tug+ tug+ tugadh"),
+			AimsirNeamhrialta("tugas tugais tug+ tugamair tugabhair tugadar tugadh")),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("tugainn tugtá tugadh+ tugaimis tugadh+ tugaidís tugtaí"),
+			AimsirNeamhrialta("tugainn tugthá tugadh+ tugaimís tugadh+ tugaidís tugtaí")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("tugaim tugann+ tugann+ tugaimid tugann+ tugann+ tugtar"),
+			AimsirNeamhrialta("tugaim tugair tugann+ tugaimíd tugann+ tugaid+ tugtar")),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("tabharfaidh+ tabharfaidh+ tabharfaidh+ tabharfaimid tabharfaidh+ tabharfaidh+ tabharfar"),
+			AimsirNeamhrialta("tabharfad tabharfair tabharfaidh+ tabharfaimíd tabharfaidh+ tabharfaid+ tabharfar")),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("tuga+ tuga+ tuga+ tugaimid tuga+ tuga+ tugtar"),
+			AimsirNeamhrialta("tugad tugair tugaidh+ tugaimid tugaidh+ tugaid+ tugtar")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("tugaim tabhair tugadh+ tugaimis tugaigí tugaidís tugtar"),
+			AimsirNeamhrialta("tugaim tabhair tugadh+ tugaimís tugaidh tugaidís tugtar")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("tabharfainn tabharfá tabharfadh+ tabharfaimis tabharfadh+ tabharfaidís tabharfaí"),
+			AimsirNeamhrialta("tabharfainn tabharfá tabharfadh+ tabharfaimís tabharfadh+ tabharfaidís tabharfaí")),
+	},
+	'tar': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("táinig+ táinig+ táinig+ tángamar táinig+ táinig+ tángthas", míreanna_saor=_níor_ar),
+			AimsirNeamhrialta("tánag tánais táinig+ tángamair tángabhair tángadar tángthas")),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("tagainn tagtá tagadh+ tagaimis tagadh+ tagaidís tagtaí"),
+			AimsirNeamhrialta("tagainn tagthá tagadh+ tagaimís tagadh+ tagaidís tagtaí")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("tagaim tagann+ tagann+ tagaimid tagann+ tagann+ tagtar"),
+			AimsirNeamhrialta("tagaim tagair tagann+ tagaimíd tagann+ tagaid+ tagtar")),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("tiocfaidh+ tiocfaidh+ tiocfaidh+ tiocfaimid tiocfaidh+ tiocfaidh+ tiocfar"),
+			AimsirNeamhrialta("tiocfad tiocfair tiocfaidh+ tiocfaimíd tiocfaidh+ tiocfaid+ tiocfar")),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("taga+ taga+ taga+ tagaimid taga+ taga+ tagtar"),
+			AimsirNeamhrialta("tagad tagair tagaidh+ tagaimid tagaidh+ tagaid+ tagtar")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("tagaim tar tagadh+ tagaimis tagaigí tagaidís tagtar"),
+			AimsirNeamhrialta("tagaim tar tagadh+ tagaimís tagaidh tagaidís tagtar")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("tiocfainn tiocfá tiocfadh+ tiocfaimis tiocfadh+ tiocfaidís tiocfaí"),
+			AimsirNeamhrialta("tiocfainn tiocfá tiocfadh+ tiocfaimís tiocfadh+ tiocfaidís tiocfaí")),
+	},
+	'téigh': {
+		FoghaAimsire.chaite: (
+			AimsirNeamhrialta("cuaigh+ cuaigh+ cuaigh+ cuamar cuaigh+ cuaigh+ cuathas",
+			                  "deachaigh+ deachaigh+ deachaigh+ deachamar deachaigh+ deachaigh+ deachthas", míreanna=_ní_an),
+			AimsirNeamhrialta("cuas cuais cuaigh+ cuamair cuabhair cuadar cuathas",
+			                  "deaghas deaghais deaghaidh+ deaghamair deaghabhair deaghadar deaghthas")),
+		FoghaAimsire.ghnáthchaite: (
+			AimsirNeamhrialta("téinn téiteá téadh+ téimis téadh+ téidís téití"),
+			AimsirNeamhrialta("téinn téitheá téadh+ téimís téadh+ téidís téití")),
+		FoghaAimsire.láithreach: (
+			AimsirNeamhrialta("téim téann+ téann+ téimid téann+ téann+ téitear"),
+			AimsirNeamhrialta("téim téir téann+ téimíd téann+ téid+ téitear")),
+		FoghaAimsire.fháistineach: (
+			AimsirNeamhrialta("rachaidh+ rachaidh+ rachaidh+ rachaimid rachaidh+ rachaidh+ rachfar"),
+			AimsirNeamhrialta("raghad raghair raghaidh+ raghaimíd raghaidh+ raghaid+ raghfar")),
+		FoghaAimsire.foshuiteach: (
+			AimsirNeamhrialta("té+ té+ té+ téimid té+ té+ téitear"),
+			AimsirNeamhrialta("téad téir téidh+ téimid téidh+ téid+ téitear")),
+		FoghaAimsire.ordaitheach: (
+			AimsirNeamhrialta("téim téigh téadh+ téimis téigí téidís téitear"),
+			AimsirNeamhrialta("téim téir téadh+ téimís téidh téidís téitear")),
+		FoghaAimsire.coinníollach: (
+			AimsirNeamhrialta("rachainn rachfá rachadh+ rachaimis rachadh+ rachaidís rachfaí"),
+			AimsirNeamhrialta("raghainn raghfá raghadh+ raghaimís raghadh+ raghaidís raghfaí")),
+	},
+}
+
+
+# a word of an irregular verb with its particle, mutation and pronoun, as the parts of a LeaganRoinnte
+def _píosaí_neamhrialta(focal: str, mír: str, claochlú: str, forainm: str, mumhan: bool) -> list:
+	céad_litir = focal[0]
+	s = claochlú == 's' and is_inséimhithe(focal) and 'h' or ''
+	réimír = claochlú == 'u' and uraigh(céad_litir) or ''
+	# the same as what particles do to regular verbs in Leagan.réimnigh()
+	if mír == 'go' and is_guta(céad_litir):
+		réimír = 'n-'
+	elif mír == 'ná' and is_guta(céad_litir):
+		réimír = 'h'
+	elif mír == 'do':
+		if is_guta(céad_litir) or (céad_litir == 'f' and s):
+			réimír = "d'"
+			mír = None
+		elif not mumhan:
+			mír = None
+	píosaí = mír and [('mír', mír), (None, ' ')] or []
+	píosaí += [('réimír', réimír), ('céad_litir', céad_litir), ('séimhiú', s), ('fréamh', focal[1:]), ('deireadh', '')]
+	if forainm:
+		píosaí += [(None, ' '), ('forainm', forainm)]
+	return píosaí
+
+
+# An irregular verb's every form, worked out once from briathra_neamhrialta
+# It conjugates the same way as a Réimniú, and takes the same plans, but only looks its forms up.
+class BriatharNeamhrialta(Reoiteach):
+	def __init__(self, briathar: str, réimniú: Réimniú):
+		self.briathar = briathar
+		self.uimhir = réimniú.uimhir
+		self._réimniú = réimniú  # the rules for the particles the forms take, and for which forms there are
+		roinnte = [None] * líon_ceall
+		for a, (caighdeánach, mumhan) in briathra_neamhrialta[briathar].items():
+			aimsir = réimniú.aimsirí[a]
+			for m, spec in ((False, caighdeánach), (True, mumhan)):
+				míreanna = spec.míreanna or m and caighdeánach.míreanna
+				míreanna_saor = spec.míreanna_saor or m and caighdeánach.míreanna_saor or míreanna
+				foirmeacha = spec.foirmeacha.split()
+				spleách = (spec.spleách or spec.foirmeacha).split()
+				diúltach = spec.diúltach and spec.diúltach.split() or spleách
+				for i, p in enumerate(FoghaPearsan):
+					leagan = aimsir.leagan_pearsan(p)
+					leagan = m and leagan.mumhan or leagan
+					for j, f in enumerate(FoghaFoirme):
+						bunleagan = aimsir.bunleagan(f)
+						if not bunleagan:
+							continue
+						míreanna_pearsan = p == FoghaPearsan.briathar_saor and míreanna_saor or míreanna
+						if míreanna_pearsan:
+							mír, claochlú = míreanna_pearsan[j]
+						else:
+							# as for a regular verb, e.g. no lenition for the past autonomous
+							mír = leagan.mír is None and bunleagan.mír or leagan.mír
+							séimhiú = leagan.séimhiú is None and bunleagan.séimhiú or leagan.séimhiú
+							urú = leagan.urú is None and bunleagan.urú or leagan.urú
+							claochlú = séimhiú and 's' or urú and 'u' or ''
+						focal = (j == 0 and foirmeacha or j == 1 and diúltach or spleách)[i]
+						forainm = focal.endswith('+') and p.forainm or ''
+						roinnte[uimhir_cille(a, p, f, m)] = LeaganRoinnte(
+							_píosaí_neamhrialta(focal.rstrip('+'), mír, claochlú, forainm, m))
+		self._roinnte = tuple(roinnte)
+		self._téacs = tuple(l is not None and str(l) or None for l in roinnte)
+
+	# for the snapshot of the rules, each form as its text and its parts, with the parts of forms that are
+	# split the same way shared, which is much quicker to load than every LeaganRoinnte
+	def __getstate__(self):
+		míreanna = {}
+		cealla = tuple(l is not None and (str(l), míreanna.setdefault(l.míreanna, l.míreanna)) or None
+		               for l in self._roinnte)
+		return {**{k: v for k, v in vars(self).items() if k != '_téacs'}, '_roinnte': cealla}
+
+	def __setstate__(self, staid: dict):
+		roinnte = []
+		for cill in staid['_roinnte']:
+			leagan = None
+			if cill is not None:
+				leagan = str.__new__(LeaganRoinnte, cill[0])
+				object.__setattr__(leagan, 'míreanna', cill[1])
+			roinnte.append(leagan)
+		vars(self).update(staid, _roinnte=tuple(roinnte), _téacs=tuple(cill and cill[0] for cill in staid['_roinnte']))
+
+	def pleanáil(self, foghannaAimsirí: list, foghannaPearsana: list, foghannaFoirmeacha: list, mumhan: bool) -> tuple:
+		return self._réimniú.pleanáil(foghannaAimsirí, foghannaPearsana, foghannaFoirmeacha, mumhan)
+
+	def pleanáil_canúintí(self, foghannaAimsirí: list, foghannaPearsana: list, foghannaFoirmeacha: list) -> PleanCanúintí:
+		return self._réimniú.pleanáil_canúintí(foghannaAimsirí, foghannaPearsana, foghannaFoirmeacha)
+
+	# plans from any conjugation can be used, as only the tenses, persons and forms in them are looked at
+	def réimnigh_de_réir_plean(self, fréamh: str, plean: tuple, mumhan: bool, aibhsigh: bool):
+		cealla = aibhsigh and self._roinnte or self._téacs
+		return [{'ainm': a.ainm,
+		         'pearsana': [[cealla[uimhir_cille(a.aimsir, p, f, mumhan)] for f in a.foghannaFoirmeacha]
+		                      for p, _ in a.pearsana]}
+		        for a in plean]
+
+	def réimnigh_canúintí(self, fréamh: str, plean: PleanCanúintí, aibhsigh: bool):
+		cealla = aibhsigh and self._roinnte or self._téacs
+		aschur = []
+		for a in plean.caighdeánach:
+			pearsana = []
+			for p, _ in a.pearsana:
+				ró = []
+				for f in a.foghannaFoirmeacha:
+					uimhir = uimhir_cille(a.aimsir, p, f, False)
+					c, m = cealla[uimhir], cealla[uimhir + 1]
+					ró.append(LeaganCanúna(c, m, c != m))
+				pearsana.append(ró)
+			aschur.append({'ainm': a.ainm, 'pearsana': pearsana})
+		return aschur
+
+	def réimnigh_cill(self, fréamh: str, a: FoghaAimsire, p: FoghaPearsan, f: FoghaFoirme, mumhan: bool, aibhsigh: bool):
+		return (aibhsigh and self._roinnte or self._téacs)[uimhir_cille(a, p, f, mumhan)]
+
+	def réimnigh(self, fréamh: str, foghannaAimsirí: list, foghannaPearsana: list, foghannaFoirmeacha: list, mumhan: bool, aibhsigh: bool):
+		plean = self.pleanáil(foghannaAimsirí, foghannaPearsana, foghannaFoirmeacha, mumhan)
+		return self.réimnigh_de_réir_plean(fréamh, plean, mumhan, aibhsigh)
+
+
+_neamhrialta = None
+
+
+# get the tables of irregular verbs, keyed by verb, working them out the first time they're needed
+def faigh_neamhrialta() -> Mapping[str, BriatharNeamhrialta]:
+	global _neamhrialta
+	if _neamhrialta is None:
+		rialacha = faigh_rialacha()
+		with _glas_rialacha:
+			if _neamhrialta is None:
+				ionstr = ionstraim
+				tús = ionstr and perf_counter()
+				_neamhrialta = MappingProxyType({briathar: BriatharNeamhrialta(briathar, rialacha[cén_aicme(briathar)]).reoigh()
+				                                 for briathar in briathra_neamhrialta})
+				if ionstr:
+					ionstr.am('neamhrialta', tús)
+				_scríobh_rialacha_reoite(rialacha, _neamhrialta)
+	return _neamhrialta
+
+
+# Snapshot of the rules
+# The built rule tables and irregular verbs are pickled into a file alongside this module's compiled code
+# in __pycache__, so a new process can load them rather than building them again. It's written the first
+# time they're built, unless Python isn't writing compiled code either (-B or PYTHONDONTWRITEBYTECODE), and
+# can be written beforehand with tóg_rialacha_reoite() or --tóg-rialacha. The file starts with a hash of
+# the source of this module, so it isn't used once anything here has changed. Only the classes the rules
+# are made of can be loaded from it, and they're the ones in this module whether it was imported or run
+# as a script. Set REIMNIGH_RIALACHA_REOITE=0 to always build the rules.
+leagan_rialacha_reoite = 1
+_aicmí_reoite = frozenset(['Foirm', 'FoghaAimsire', 'Deireadh', 'Leagan', 'Pearsa', 'Aimsir', 'Réimniú', 'BriatharNeamhrialta'])
+
+
+# where the snapshot of the rules is kept, or None if it isn't
+def cosán_rialacha_reoite() -> str:
+	import os
+	import sys
+	from importlib.util import cache_from_source
+
+	if os.environ.get('REIMNIGH_RIALACHA_REOITE') == '0' or not __file__.endswith('.py') or not sys.implementation.cache_tag:
+		return None
+	return cache_from_source(os.path.abspath(__file__))[:-len('.pyc')] + '.rialacha'
+
+
+# the hash the snapshot has to start with, of the source of this module and the format of the snapshot
+# it's the same hash Python checks compiled code against, which is much quicker to import than hashlib
+@lru_cache(maxsize=None)
+def _eochair_rialacha_reoite() -> bytes:
+	from importlib.util import source_hash
+	import pickle
+
+	with open(__file__, 'rb') as comhad:
+		foinse = comhad.read()
+	return source_hash(foinse + f"\n{leagan_rialacha_reoite} {pickle.HIGHEST_PROTOCOL}".encode('utf-8'))
+
+
+# the rule tables and irregular verbs from the snapshot, or None if there isn't one for this code
+def _léigh_rialacha_reoite(cosán: str = None):
+	import pickle
+
+	class Díphiocálaí(pickle.Unpickler):
+		def find_class(self, modúl, ainm):
+			if ainm not in _aicmí_reoite:
+				raise pickle.UnpicklingError(f"{modúl}.{ainm} is not part of the rules")
+			return globals()[ainm]
+
+	cosán = cosán or cosán_rialacha_reoite()
+	if cosán is None:
+		return None
+	try:
+		with open(cosán, 'rb') as comhad:
+			eochair = _eochair_rialacha_reoite()
+			if comhad.read(len(eochair)) != eochair:
+				return None
+			return Díphiocálaí(comhad).load()
+	# anything wrong with it just means the rules are built again
+	except Exception:
+		return None
+
+
+# save the rule tables and irregular verbs in the snapshot, if it can be
+def _scríobh_rialacha_reoite(rialacha: Mapping, neamhrialta: Mapping, cosán: str = None, éigeantach: bool = False):
+	import os
+	import pickle
+	import sys
+
+	cosán = cosán or cosán_rialacha_reoite()
+	if cosán is None or sys.dont_write_bytecode and not éigeantach:
+		return None
+	sealadach = f"{cosán}.{os.getpid()}"
+	try:
+		os.makedirs(os.path.dirname(cosán), exist_ok=True)
+		with open(sealadach, 'wb') as comhad:
+			comhad.write(_eochair_rialacha_reoite())
+			pickle.dump((dict(rialacha), dict(neamhrialta)), comhad, pickle.HIGHEST_PROTOCOL)
+		# other processes only ever see a whole file
+		os.replace(sealadach, cosán)
+	except OSError:
+		if os.path.exists(sealadach):
+			os.remove(sealadach)
+		if not éigeantach:
+			return None
+		raise
+	return cosán
+
+
+# write the snapshot of the rules now, e.g. when installing, and return where it was written
+def tóg_rialacha_reoite(cosán: str = None) -> str:
+	cosán = _scríobh_rialacha_reoite(faigh_rialacha(), faigh_neamhrialta(), cosán, éigeantach=True)
+	if cosán is None:
+		raise RuntimeError("the snapshot of the rules is turned off")
+	return cosán
+
+
+# the code that turns rules into forms, for méarlorg_rialacha()
+# anything that can change the forms of a verb other than the rule tables themselves should be in here, or be
+# used by name from something that is, as _ainmneacha_cóid() adds those too. Code only reached through the
+# tables and other values built when the module is loaded, e.g. _déan_crann(), has to be listed.
+_cód_rialacha = ('comhair_siollaí', 'uraigh', 'cuir_fada', 'is_inséimhithe', 'is_guta', 'críochnaigh_le',
+                 'deireadh_fada', 'gutaí_deireanach', 'guta_deireanach', 'leath_nó_caolaigh', 'Deireadh', 'déan_deireadh',
+                 'Foirm', 'FoghaAimsire', 'FoghaPearsan', 'FoghaFoirme', 'RiailDeiridh', 'déan_patrún', '_déan_crann',
+                 'próifíl', 'roghnaigh', 'anailísigh', 'LeaganRoinnte', 'Leagan', 'Aimsir', 'Réimniú',
+                 '_píosaí_neamhrialta', 'BriatharNeamhrialta')
+
+
+# a rule object as text that only changes when the rules do
+def _mar_théacs(luach) -> str:
+	if isinstance(luach, Reoiteach):
+		return f"{type(luach).__name__}({', '.join(f'{k}={_mar_théacs(v)}' for k, v in sorted(vars(luach).items()))})"
+	if isinstance(luach, Mapping):
+		return f"{{{', '.join(f'{_mar_théacs(k)}: {_mar_théacs(v)}' for k, v in luach.items())}}}"
+	if isinstance(luach, (set, frozenset)):
+		return f"{{{', '.join(sorted(_mar_théacs(v) for v in luach))}}}"
+	if isinstance(luach, tuple):
+		return f"{type(luach).__name__}({', '.join(_mar_théacs(v) for v in luach)})"
+	if isinstance(luach, Enum):
+		return luach.name
+	return repr(luach)
+
+
+# the functions and classes in _cód_rialacha and every one of this module's functions and classes they use,
+# in a fixed order, each with its source
+# the module is parsed once here rather than letting inspect.getsource() parse it again for every class
+def _ainmneacha_cóid() -> dict:
+	import ast
+
+	with open(__file__, encoding='utf-8') as comhad:
+		foinse = comhad.read()
+	línte = foinse.splitlines(keepends=True)
+	nóid = {nód.name: nód for nód in ast.parse(foinse).body if isinstance(nód, (ast.FunctionDef, ast.ClassDef))}
+	ainmneacha = list(_cód_rialacha)
+	for ainm in ainmneacha:
+		for nód in ast.walk(nóid[ainm]):
+			if isinstance(nód, ast.Name) and nód.id in nóid and nód.id not in ainmneacha:
+				ainmneacha.append(nód.id)
+	return {ainm: "".join(línte[nóid[ainm].lineno - 1:nóid[ainm].end_lineno]) for ainm in ainmneacha}
+
+
+# hash of the source of the code that conjugates, which only has to be read once
+@lru_cache(maxsize=None)
+def _méarlorg_cóid() -> str:
+	from hashlib import sha256
+
+	h = sha256()
+	for cód in _ainmneacha_cóid().values():
+		h.update(cód.encode('utf-8'))
+	return h.hexdigest()
+
+
+# A hash of everything that decides what forms a verb gets: the code that conjugates, the tables that
+# classify verbs and find their stems, the irregular verbs, and the rules for the conjugation given (or all of them).
+# If it's the same as it was, every verb of that conjugation is conjugated the same way as it was.
+@lru_cache(maxsize=None)
+def méarlorg_rialacha(aicme: float = None) -> str:
+	from hashlib import sha256
+
+	h = sha256(_méarlorg_cóid().encode('utf-8'))
+	h.update(_mar_théacs((gutaí, tábla_aicmí, tábla_fréamhacha, _deirí_eile, briathra_neamhrialta)).encode('utf-8'))
+	rialacha = faigh_rialacha()
+	for a in aicme is None and sorted(rialacha) or [aicme]:
+		h.update(f"{a}: {_mar_théacs(rialacha[a])}".encode('utf-8'))
+	return h.hexdigest()
+
+
+# detect which conjugation a verb is part of, as a key for faigh_rialacha()
+def cén_aicme(briathar: str) -> float:
+	return roghnaigh(tábla_aicmí, próifíl(briathar))
+
+
 # detect which conjugation a verb is part of
+# irregular verbs are looked up first, and give their table of forms, which conjugates the same way
 def cén_réimniú(briathar: str) -> Réimniú:
-	if comhair_siollaí(briathar) > 1 and críochnaigh_le(briathar, ['igh', 'ir', 'il', 'in', 'is', 'ing']) \
-			and not deireadh_fada(briathar) and not briathar.endswith('uigh')\
-			and not match(r".+[eou]ir$", briathar) and not match(r".+[^a]ghair$", briathar):
-		return déan_rialacha().get(2)
-	elif briathar.endswith('dhaill') or briathar.endswith('nill'):
-		return déan_rialacha().get(2)
-	elif críochnaigh_le(briathar, ['igh', 'ígh']) \
-			and not deireadh_fada(briathar):
-		return déan_rialacha().get(1.5)
-	return déan_rialacha().get(1)
+	neamhrialta = faigh_neamhrialta().get(briathar)
+	if neamhrialta:
+		return neamhrialta
+	ionstr = ionstraim
+	if ionstr:
+		tús = perf_counter()
+		aicme = cén_aicme(briathar)
+		ionstr.am('aicme', tús)
+		return faigh_rialacha().get(aicme)
+	return faigh_rialacha().get(cén_aicme(briathar))
 
 
 # print results
 def priontáil_toradh(toradh: List, aibhsiú: bool = False):
+	ionstr = ionstraim
+	tús = ionstr and perf_counter()
+
+	# width of a cell as it appears on the screen
+	# only forms that came with their ANSI highlights already in them need them stripped out
+	def fad(cill: str) -> int:
+		return aibhsiú and not isinstance(cill, LeaganRoinnte) and len(neamhaibhsigh(cill)) or len(cill)
+
 	leithid_colún = {}
 	for aimsir in toradh:
 		for ró in aimsir['pearsana']:
 			for i, cill in enumerate(ró):
-				fad = len(neamhaibhsigh(cill))
-				if leithid_colún.get(i) is None or fad > leithid_colún.get(i):
-					leithid_colún[i] = fad
+				fad_cille = fad(cill)
+				if leithid_colún.get(i) is None or fad_cille > leithid_colún.get(i):
+					leithid_colún[i] = fad_cille
 	for aimsir in toradh:
 		# if more than one tense was specified, print the name of each tense
 		if len(toradh) > 1:
@@ -664,22 +1854,317 @@ def priontáil_toradh(toradh: List, aibhsiú: bool = False):
 		for ró in aimsir['pearsana']:
 			líne = ""
 			for i, cill in enumerate(ró):
-				líne += cill + " " * (leithid_colún[i] - len(neamhaibhsigh(cill)) + 4)
+				líne += (aibhsiú and rindreáil_ansi(cill) or cill) + " " * (leithid_colún[i] - fad(cill) + 4)
 			print(líne)
 		# print an empty line between each tense
 		if aimsir != toradh[-1]:
 			print()
-
-
+	if ionstr:
+		ionstr.am('priontáil', tús)
+
+
+# One conjugated form along with what it is
+class Taifead(NamedTuple):
+	briathar: str
+	aimsir: FoghaAimsire
+	pearsa: FoghaPearsan
+	foirm: FoghaFoirme
+	mumhan: bool
+	leagan: str
+
+
+# match up the forms in a result from réimnigh() with the tense, person and form of each one,
+# using the plan the result was made from
+def taifid(briathar: str, toradh: List, plean: tuple, mumhan: bool):
+	for a, aschur_aimsire in zip(plean, toradh):
+		for (p, _), ró in zip(a.pearsana, aschur_aimsire['pearsana']):
+			for f, leagan in zip(a.foghannaFoirmeacha, ró):
+				yield Taifead(briathar, a.aimsir, p, f, mumhan, leagan)
+
+
+# One form in both dialects along with what it is
+class TaifeadCanúna(NamedTuple):
+	briathar: str
+	aimsir: FoghaAimsire
+	pearsa: FoghaPearsan
+	foirm: FoghaFoirme
+	caighdeánach: str
+	mumhan: str
+	difriúil: bool
+
+
+# the same as taifid() for a result from réimnigh_canúintí() and the plan it was made from
+def taifid_canúintí(briathar: str, toradh: List, plean: PleanCanúintí):
+	for a, aschur_aimsire in zip(plean.caighdeánach, toradh):
+		for (p, _), ró in zip(a.pearsana, aschur_aimsire['pearsana']):
+			for f, leagan in zip(a.foghannaFoirmeacha, ró):
+				yield TaifeadCanúna(briathar, a.aimsir, p, f, *leagan)
+
+
+# conjugate many verbs like réimnigh_iomlán(), giving a list of records for each verb
+def taifid_iomlána(briathra, aimsirí: list = FoghaAimsire, pearsana: list = FoghaPearsan, foirmeacha: list = FoghaFoirme,
+                   mumhan: bool = False, méid_baisce: int = 1000):
+	aimsirí, pearsana, foirmeacha = list(aimsirí), list(pearsana), list(foirmeacha)
+	pleananna = {}
+	for baisc in _smutáin(briathra, méid_baisce):
+		for briathar, toradh in zip(baisc, réimnigh_iomlán(baisc, aimsirí, pearsana, foirmeacha, mumhan, False, méid_baisce)):
+			aicme = cén_aicme(briathar)
+			if aicme not in pleananna:
+				pleananna[aicme] = faigh_rialacha()[aicme].pleanáil(aimsirí, pearsana, foirmeacha, mumhan)
+			yield list(taifid(briathar, toradh, pleananna[aicme], mumhan))
+
+
+# field names for JSON Lines and CSV output
+réimsí_taifid = ("verb", "tense", "person", "polarity", "dialect", "form")
+réimsí_taifid_canúna = ("verb", "tense", "person", "polarity", "form", "form_munster", "differs")
+
+
+# write records as JSON Lines, one object per form
+def scríobh_jsonl(taifid, comhad):
+	from json import dumps
+	comhad.write("".join(
+		f'{{"verb": {dumps(t.briathar, ensure_ascii=False)}, "tense": "{t.aimsir.name}", "person": "{t.pearsa.name}", '
+		f'"polarity": "{t.foirm.name}", "dialect": "{t.mumhan and "mumhan" or "caighdeánach"}", '
+		f'"form": {dumps(t.leagan, ensure_ascii=False)}}}\n' for t in taifid))
+
+
+# write records from taifid_canúintí() as JSON Lines, one object per form with both dialects
+def scríobh_jsonl_canúintí(taifid, comhad):
+	from json import dumps
+	comhad.write("".join(
+		f'{{"verb": {dumps(t.briathar, ensure_ascii=False)}, "tense": "{t.aimsir.name}", "person": "{t.pearsa.name}", '
+		f'"polarity": "{t.foirm.name}", "form": {dumps(t.caighdeánach, ensure_ascii=False)}, '
+		f'"form_munster": {dumps(t.mumhan, ensure_ascii=False)}, "differs": {t.difriúil and "true" or "false"}}}\n'
+		for t in taifid))
+
+
+# write records as CSV, one row per form
+def scríobh_csv(taifid, comhad, ceanntásc: bool = False):
+	from csv import writer
+	scríbhneoir = writer(comhad)
+	if ceanntásc:
+		scríbhneoir.writerow(réimsí_taifid)
+	scríbhneoir.writerows((t.briathar, t.aimsir.name, t.pearsa.name, t.foirm.name, t.mumhan and "mumhan" or "caighdeánach",
+	                       t.leagan) for t in taifid)
+
+
+# write records from taifid_canúintí() as CSV, one row per form with both dialects
+def scríobh_csv_canúintí(taifid, comhad, ceanntásc: bool = False):
+	from csv import writer
+	scríbhneoir = writer(comhad)
+	if ceanntásc:
+		scríbhneoir.writerow(réimsí_taifid_canúna)
+	scríbhneoir.writerows((t.briathar, t.aimsir.name, t.pearsa.name, t.foirm.name, t.caighdeánach, t.mumhan,
+	                       int(t.difriúil)) for t in taifid)
+
+
+# Threads
+# réimnigh(), réimnigh_canúintí(), réimnigh_cill(), réimnigh_iomlán(), réimnigh_bulc(), réimnigh_snáitheanna(),
+# cén_réimniú(), cén_aicme(), anailísigh() and méarlorg_rialacha() can all be called from any number of threads
+# at once, with no locking needed by the caller. The rules are built once, under a lock, and frozen so nothing
+# can change them (see Reoiteach), stems are immutable Anailís tuples kept in a thread-safe cache, and a plan
+# is a tuple that isn't changed after it's made. Results are new lists each time, but the forms in them can be
+# shared with other calls, so LeaganRoinnte can't be changed either. A Paraidím can be shared between threads
+# too, though a form asked for by two at once might be conjugated twice. Turning instrumentation on or off
+# while other threads are conjugating only means some of their work may or may not be counted.
 def réimnigh(briathar: str, aimsirí: list = FoghaAimsire, pearsana: list = FoghaPearsan, foirmeacha: list = FoghaFoirme, mumhan: bool = False, aibhsigh: bool = False):
 	return cén_réimniú(briathar).réimnigh(briathar, aimsirí, pearsana, foirmeacha, mumhan, aibhsigh)
 
 
-if __name__ == '__main__':
+# conjugate a verb in the standard dialect and Munster at once
+# gives the same as réimnigh() but with a LeaganCanúna for each form, saying whether the two are different
+def réimnigh_canúintí(briathar: str, aimsirí: list = FoghaAimsire, pearsana: list = FoghaPearsan,
+                      foirmeacha: list = FoghaFoirme, aibhsigh: bool = False):
+	réimniú = cén_réimniú(briathar)
+	return réimniú.réimnigh_canúintí(briathar, réimniú.pleanáil_canúintí(aimsirí, pearsana, foirmeacha), aibhsigh)
+
+
+# conjugate a single form of a verb
+# returns None if there's no such form, e.g. the interrogative subjunctive
+def réimnigh_cill(briathar: str, aimsir: FoghaAimsire, pearsa: FoghaPearsan, foirm: FoghaFoirme, mumhan: bool = False,
+                  aibhsigh: bool = False):
+	return cén_réimniú(briathar).réimnigh_cill(briathar, aimsir, pearsa, foirm, mumhan, aibhsigh)
+
+
+# A verb's paradigm where each form is only conjugated the first time it's asked for
+# e.g. Paraidím("bris")[FoghaAimsire.chaite, FoghaPearsan.céad_uatha, FoghaFoirme.dhearfach] -> "bhris mé"
+class Paraidím:
+	def __init__(self, briathar: str, mumhan: bool = False, aibhsigh: bool = False):
+		self.briathar = briathar
+		self.mumhan = mumhan
+		self.aibhsigh = aibhsigh
+		self._réimniú = cén_réimniú(briathar)
+		self._cealla = {}
+
+	def __getitem__(self, eochair: tuple):
+		try:
+			return self._cealla[eochair]
+		except KeyError:
+			aimsir, pearsa, foirm = eochair
+			leagan = self._cealla[eochair] = self._réimniú.réimnigh_cill(self.briathar, aimsir, pearsa, foirm,
+			                                                               self.mumhan, self.aibhsigh)
+			return leagan
+
+
+# conjugate many verbs with the same options
+# verbs are read in batches and grouped by conjugation, and the rules for each conjugation are only
+# looked up once no matter how many verbs there are. Results are yielded in the same order as the input.
+# With canúintí each verb is conjugated in both dialects like réimnigh_canúintí(), and mumhan is ignored.
+def réimnigh_iomlán(briathra, aimsirí: list = FoghaAimsire, pearsana: list = FoghaPearsan, foirmeacha: list = FoghaFoirme,
+                    mumhan: bool = False, aibhsigh: bool = False, méid_baisce: int = 1000, canúintí: bool = False):
+	aimsirí, pearsana, foirmeacha = list(aimsirí), list(pearsana), list(foirmeacha)
+	rialacha = faigh_rialacha()
+	neamhrialta = faigh_neamhrialta()
+	pleananna = {}
+
+	def réimnigh_baisc(baisc: list):
+		grúpaí = {}
+		for i, briathar in enumerate(baisc):
+			grúpaí.setdefault(cén_aicme(briathar), []).append(i)
+		torthaí = [None] * len(baisc)
+		for aicme, innéacsanna in grúpaí.items():
+			réimniú = rialacha[aicme]
+			plean = pleananna.get(aicme)
+			if plean is None and canúintí:
+				plean = pleananna[aicme] = réimniú.pleanáil_canúintí(aimsirí, pearsana, foirmeacha)
+			elif plean is None:
+				plean = pleananna[aicme] = réimniú.pleanáil(aimsirí, pearsana, foirmeacha, mumhan)
+			# irregular verbs take the same plan, but look their forms up
+			if canúintí:
+				for i in innéacsanna:
+					torthaí[i] = neamhrialta.get(baisc[i], réimniú).réimnigh_canúintí(baisc[i], plean, aibhsigh)
+			else:
+				for i in innéacsanna:
+					torthaí[i] = neamhrialta.get(baisc[i], réimniú).réimnigh_de_réir_plean(baisc[i], plean, mumhan, aibhsigh)
+		return torthaí
+
+	baisc = []
+	for briathar in briathra:
+		baisc.append(briathar)
+		if len(baisc) >= méid_baisce:
+			yield from réimnigh_baisc(baisc)
+			baisc = []
+	if baisc:
+		yield from réimnigh_baisc(baisc)
+
+
+# conjugate one chunk of verbs in a worker process for réimnigh_bulc()
+def _réimnigh_smután(smután: list, aimsirí: list, pearsana: list, foirmeacha: list, mumhan: bool, aibhsigh: bool,
+                     canúintí: bool) -> list:
+	return list(réimnigh_iomlán(smután, aimsirí, pearsana, foirmeacha, mumhan, aibhsigh, canúintí=canúintí))
+
+
+# split a stream of verbs into lists of a given size
+def _smutáin(briathra, méid_smutáin: int):
+	smután = []
+	for briathar in briathra:
+		smután.append(briathar)
+		if len(smután) >= méid_smutáin:
+			yield smután
+			smután = []
+	if smután:
+		yield smután
+
+
+# conjugate many verbs using a pool of worker processes
+# the verbs are sent to the workers in chunks and the results come back in the same order as the input,
+# identical to what réimnigh_iomlán() gives. Each worker builds its own rule tables once when it starts.
+# Only a few chunks per worker are in flight at any time, so memory use doesn't grow with the input.
+def réimnigh_bulc(briathra, aimsirí: list = FoghaAimsire, pearsana: list = FoghaPearsan, foirmeacha: list = FoghaFoirme,
+                  mumhan: bool = False, aibhsigh: bool = False, próisis: int = None, méid_smutáin: int = 256,
+                  canúintí: bool = False):
+	if próisis == 1:
+		yield from réimnigh_iomlán(briathra, aimsirí, pearsana, foirmeacha, mumhan, aibhsigh, méid_smutáin, canúintí)
+		return
+
+	from functools import partial
+	from multiprocessing import Pool
+	from os import cpu_count
+	from queue import SimpleQueue
+	from threading import Event, Semaphore, Thread
+
+	próisis = próisis or cpu_count() or 1
+	obair = partial(_réimnigh_smután, aimsirí=list(aimsirí), pearsana=list(pearsana), foirmeacha=list(foirmeacha),
+	                mumhan=mumhan, aibhsigh=aibhsigh, canúintí=canúintí)
+	with Pool(próisis, initializer=faigh_rialacha) as linn:
+		# the input is read on its own thread, so that when it's a pipe each chunk is sent off as soon as it's read
+		# and its results are passed on without waiting for the next line to arrive
+		ar_siúl = SimpleQueue()
+		spás = Semaphore(2 * próisis)
+		stad = Event()
+
+		def léigh():
+			try:
+				for smután in _smutáin(briathra, méid_smutáin):
+					while not spás.acquire(timeout=0.1):
+						if stad.is_set():
+							return
+					ar_siúl.put(linn.apply_async(obair, (smután,)))
+			except BaseException as e:
+				ar_siúl.put(e)
+			ar_siúl.put(None)
+
+		Thread(target=léigh, name='reimnigh-ionchur', daemon=True).start()
+		try:
+			while True:
+				toradh = ar_siúl.get()
+				if toradh is None:
+					break
+				if isinstance(toradh, BaseException):
+					raise toradh
+				yield from toradh.get()
+				spás.release()
+		finally:
+			stad.set()
+
+
+# conjugate many verbs using a pool of threads in this process
+# the same as réimnigh_bulc() but with threads, so there's nothing to start or copy to other processes and
+# every thread shares the one set of rules. It only runs faster than réimnigh_iomlán() on a free-threaded
+# build of Python, as otherwise only one thread conjugates at a time, but it can be used from a server that
+# already runs on threads without blocking it.
+def réimnigh_snáitheanna(briathra, aimsirí: list = FoghaAimsire, pearsana: list = FoghaPearsan,
+                         foirmeacha: list = FoghaFoirme, mumhan: bool = False, aibhsigh: bool = False,
+                         snáitheanna: int = None, méid_smutáin: int = 256, canúintí: bool = False):
+	if snáitheanna == 1:
+		yield from réimnigh_iomlán(briathra, aimsirí, pearsana, foirmeacha, mumhan, aibhsigh, méid_smutáin, canúintí)
+		return
+
+	from collections import deque
+	from concurrent.futures import ThreadPoolExecutor
+	from os import cpu_count
+
+	snáitheanna = snáitheanna or cpu_count() or 1
+	aimsirí, pearsana, foirmeacha = list(aimsirí), list(pearsana), list(foirmeacha)
+	faigh_neamhrialta()  # build the rules now rather than in every thread at once
+	with ThreadPoolExecutor(snáitheanna, thread_name_prefix='reimnigh') as linn:
+		ar_siúl = deque()
+		for smután in _smutáin(briathra, méid_smutáin):
+			ar_siúl.append(linn.submit(_réimnigh_smután, smután, aimsirí, pearsana, foirmeacha, mumhan, aibhsigh,
+			                           canúintí))
+			if len(ar_siúl) >= 2 * snáitheanna:
+				yield from ar_siúl.popleft().result()
+			# pass on any results that are already finished
+			while ar_siúl and ar_siúl[0].done():
+				yield from ar_siúl.popleft().result()
+		while ar_siúl:
+			yield from ar_siúl.popleft().result()
+
+
+# read verbs from a file, one per line
+def léigh_briathra(comhad):
+	for líne in comhad:
+		briathar = líne.strip()
+		if briathar:
+			yield briathar
+
+
+# command line options
+def déan_parsálaí():
 	from argparse import ArgumentParser
 
 	parser = ArgumentParser()
-	parser.add_argument('briathar', type=str)
+	parser.add_argument('briathar', type=str, nargs='?')
 
 	parser.add_argument('-c', help='taispeántar an aimsir chaite', action='store_true')
 	parser.add_argument('-g', help='taispeántar an aimsir ghnáchchaite', action='store_true')
@@ -704,8 +2189,27 @@ if __name__ == '__main__':
 
 	parser.add_argument('-a', help='aibhsítear athruithe', action='store_true')
 
-	args = parser.parse_args()
-
+	parser.add_argument('--input', metavar='COMHAD',
+	                    help="léitear briathra ón gcomhad seo, ceann in aghaidh an líne ('-' le haghaidh stdin)")
+	parser.add_argument('--format', choices=['téacs', 'jsonl', 'csv'], default='téacs',
+	                    help='formáid an aschuir: colúin téacs, JSON Lines nó CSV')
+	parser.add_argument('--jobs', metavar='N', type=int, default=1,
+	                    help='líon na bpróiseas a úsáidtear le briathra an chomhaid a réimniú (0 = ceann do gach LAP)')
+	parser.add_argument('--ionstraim', choices=['json', 'prometheus'],
+	                    help="scríobhtar ar stderr cé chomh minic a cuireadh gach riail i bhfeidhm agus an t-am a caitheadh "
+	                         "le gach céim (sa phróiseas seo amháin, mar sin úsáid --jobs 1)")
+	parser.add_argument('--canúintí', action='store_true',
+	                    help='le --format jsonl nó csv, tugtar an caighdeán agus foirm na Mumhan taobh le taobh, '
+	                         'agus cé acu atá siad difriúil')
+	parser.add_argument('--taisce', metavar='COMHAD',
+	                    help='coinnítear torthaí sa chomhad SQLite seo agus úsáidtear arís iad (féach taisce.py)')
+	parser.add_argument('--tóg-rialacha', action='store_true',
+	                    help='scríobhtar na rialacha tógtha in __pycache__ le go mbeidh siad réidh don chéad uair eile')
+	return parser
+
+
+# work out which tenses, persons and forms were asked for on the command line
+def roghanna(args) -> tuple:
 	aimsirí = []
 	foirmeacha = []
 	pearsana = []
@@ -770,4 +2274,119 @@ if __name__ == '__main__':
 	if gach_pearsana or briathar_saor:
 		pearsana.append(FoghaPearsan.briathar_saor)
 
-	priontáil_toradh(réimnigh(args.briathar, aimsirí, pearsana, foirmeacha, args.m, args.a), args.a)
+	return aimsirí, pearsana, foirmeacha
+
+
+def príomh(argv: list = None, taisce=None):
+	import sys
+
+	parser = déan_parsálaí()
+	args = parser.parse_args(argv)
+	if args.taisce and taisce is None:
+		# run again with the persistent cache open
+		# taisce.py imports reimnigh, which has to be this module even when it's run as a script
+		sys.modules.setdefault('reimnigh', sys.modules[__name__])
+		from taisce import Taisce
+		with Taisce(args.taisce) as taisce:
+			return príomh(argv, taisce)
+	if args.ionstraim and ionstraim is None:
+		# run again with instrumentation turned on and report on it afterwards
+		tosaigh_ionstraim()
+		try:
+			return príomh(argv)
+		finally:
+			ionstr = stop_ionstraim()
+			if args.ionstraim == 'json':
+				from json import dumps
+				sys.stderr.write(dumps(ionstr.mar_json(), ensure_ascii=False, indent='\t') + "\n")
+			else:
+				sys.stderr.write(ionstr.mar_prometheus())
+	if args.tóg_rialacha:
+		print(tóg_rialacha_reoite())
+		return
+	aimsirí, pearsana, foirmeacha = roghanna(args)
+	téacs = args.format == 'téacs'
+	aibhsiú = téacs and args.a  # no highlighting in machine-readable output
+	if args.canúintí and téacs:
+		parser.error("--canúintí needs --format jsonl or csv")
+
+	if args.briathar is not None and args.input is None and téacs:
+		if taisce:
+			toradh = taisce.réimnigh(args.briathar, aimsirí, pearsana, foirmeacha, args.m, aibhsiú)
+		elif len(aimsirí) == len(pearsana) == len(foirmeacha) == 1:
+			# just one form asked for, so there's no need to go through the whole paradigm
+			leagan = réimnigh_cill(args.briathar, aimsirí[0], pearsana[0], foirmeacha[0], args.m, aibhsiú)
+			toradh = [{'ainm': aimsirí[0].ainm, 'pearsana': [leagan and [leagan] or []]}]
+		else:
+			toradh = réimnigh(args.briathar, aimsirí, pearsana, foirmeacha, args.m, aibhsiú)
+		priontáil_toradh(toradh, aibhsiú)
+		return
+
+	# conjugate every verb in the input file, or stdin if there isn't one
+	# results come back in input order, so the verbs read so far are queued up to match them
+	from collections import deque
+	from contextlib import nullcontext
+	briathra = deque()
+	pleananna = {}
+
+	def léigh(comhad):
+		for briathar in léigh_briathra(comhad):
+			briathra.append(briathar)
+			yield briathar
+
+	sruth = args.briathar is None and args.input in (None, '-')
+	if args.briathar is not None:
+		ionchur = nullcontext([args.briathar])
+	elif sruth:
+		ionchur = nullcontext(sys.stdin)
+	else:
+		ionchur = open(args.input, encoding='utf-8')
+	if args.format == 'csv':
+		(args.canúintí and scríobh_csv_canúintí or scríobh_csv)((), sys.stdout, ceanntásc=True)
+	try:
+		with ionchur as comhad:
+			# when streaming each verb is passed on as soon as it's read so its results can be written straight away
+			if taisce:
+				torthaí = taisce.réimnigh_bulc(léigh(comhad), aimsirí, pearsana, foirmeacha, args.m, aibhsiú,
+				                               args.jobs or None, méid_smutáin=sruth and 1 or 256,
+				                               méid_baisce=sruth and 1 or 4096, canúintí=args.canúintí)
+			else:
+				torthaí = réimnigh_bulc(léigh(comhad), aimsirí, pearsana, foirmeacha, args.m, aibhsiú, args.jobs or None,
+				                        méid_smutáin=sruth and 1 or 256, canúintí=args.canúintí)
+			for i, toradh in enumerate(torthaí):
+				briathar = briathra.popleft()
+				if téacs:
+					# print each verb's name above its results
+					if i:
+						print()
+					print(briathar)
+					priontáil_toradh(toradh, aibhsiú)
+				elif args.canúintí:
+					aicme = cén_aicme(briathar)
+					if aicme not in pleananna:
+						pleananna[aicme] = faigh_rialacha()[aicme].pleanáil_canúintí(aimsirí, pearsana, foirmeacha)
+					taifid_bhriathair = taifid_canúintí(briathar, toradh, pleananna[aicme])
+					if args.format == 'jsonl':
+						scríobh_jsonl_canúintí(taifid_bhriathair, sys.stdout)
+					else:
+						scríobh_csv_canúintí(taifid_bhriathair, sys.stdout)
+				else:
+					aicme = cén_aicme(briathar)
+					if aicme not in pleananna:
+						pleananna[aicme] = faigh_rialacha()[aicme].pleanáil(aimsirí, pearsana, foirmeacha, args.m)
+					taifid_bhriathair = taifid(briathar, toradh, pleananna[aicme], args.m)
+					if args.format == 'jsonl':
+						scríobh_jsonl(taifid_bhriathair, sys.stdout)
+					else:
+						scríobh_csv(taifid_bhriathair, sys.stdout)
+				if sruth:
+					sys.stdout.flush()
+	except BrokenPipeError:
+		# whatever we were writing to has stopped reading, e.g. head
+		# point stdout at devnull so Python doesn't complain again when flushing it on exit
+		from os import devnull, dup2, open as oscail, O_WRONLY
+		dup2(oscail(devnull, O_WRONLY), sys.stdout.fileno())
+
+
+if __name__ == '__main__':
+	príomh()
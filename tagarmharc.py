@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+# Benchmarks for reimnigh.py
+#
+# Run with the name of one or more benchmarks, or with no arguments to run all of them. Timings are given
+# as percentiles over every call made. Results can be saved as a JSON baseline with --sábháil and a later
+# run compared against it with --compáráil, which exits with an error if anything got slower than allowed.
+#
+# The verbs come from briathra.txt, which has verbs of every conjugation and at least one verb for each way
+# anailísigh() can find a stem. Some of the verbs for the rarer ways are made up.
+
+from io import StringIO
+import json
+from os import cpu_count, environ, path
+import platform
+from statistics import fmean
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import tracemalloc
+import reimnigh
+from reimnigh import FoghaAimsire, FoghaPearsan, FoghaFoirme
+
+fillteán = path.dirname(path.abspath(__file__))
+with open(path.join(fillteán, "briathra.txt"), encoding='utf-8') as comhad:
+	briathra = list(reimnigh.léigh_briathra(comhad))
+
+
+# the p-th percentile of a sorted list of numbers
+def peircintíl(luachanna: list, p: float) -> float:
+	return luachanna[min(len(luachanna) - 1, int(len(luachanna) * p / 100))]
+
+
+# time each call of a function on each argument, returning the times in microseconds
+def samplaigh(gníomh, argóintí, athuair: int = 3) -> list:
+	amanna = []
+	for _ in range(athuair):
+		for argóint in argóintí:
+			tús = perf_counter()
+			gníomh(argóint)
+			amanna.append((perf_counter() - tús) * 1e6)
+	return amanna
+
+
+# Collects the results of a run, printing each one as it comes in
+class Taifeadán:
+	def __init__(self):
+		self.tomhais = {}
+
+	# a set of timings in microseconds, lower is better
+	def amanna(self, ainm: str, amanna: list):
+		amanna = sorted(amanna)
+		tomhas = {'aonad': "µs", 'p50': peircintíl(amanna, 50), 'p90': peircintíl(amanna, 90),
+		          'p99': peircintíl(amanna, 99), 'meán': fmean(amanna), 'líon': len(amanna)}
+		self.tomhais[ainm] = tomhas
+		print(f"{ainm:<48}{tomhas['p50']:>12.1f}{tomhas['p90']:>12.1f}{tomhas['p99']:>12.1f} µs")
+
+	# a single figure such as a rate or a size
+	def luach(self, ainm: str, luach: float, aonad: str, níos_airde_níos_fearr: bool = True):
+		self.tomhais[ainm] = {'aonad': aonad, 'luach': luach, 'níos_airde_níos_fearr': níos_airde_níos_fearr}
+		print(f"{ainm:<48}{luach:>12.1f} {aonad}")
+
+
+# building the rule tables, and the per-verb cost when they're rebuilt for every verb as they used to be
+def tagarmharc_rialacha(t: Taifeadán):
+	def atógáil(briathar):
+		réimniú = reimnigh.déan_rialacha()[reimnigh.cén_aicme(briathar)]
+		réimniú.réimnigh(briathar, FoghaAimsire, FoghaPearsan, FoghaFoirme, False, False)
+
+	t.amanna("déan_rialacha()", samplaigh(lambda _: reimnigh.déan_rialacha(), range(50)))
+	t.amanna("réimnigh() per verb, rules rebuilt", samplaigh(atógáil, briathra[::5]))
+	t.amanna("réimnigh() per verb, shared rules", samplaigh(reimnigh.réimnigh, briathra[::5]))
+
+
+# working out the class and stem of a verb, with and without the cache
+def tagarmharc_fréamh(t: Taifeadán):
+	rialacha = reimnigh.faigh_rialacha()
+	uimhreacha = {b: rialacha[reimnigh.cén_aicme(b)].uimhir for b in briathra}
+	reimnigh.anailísigh.cache_clear()
+	t.amanna("próifíl() uncached", samplaigh(reimnigh.próifíl.__wrapped__, briathra))
+	t.amanna("cén_aicme()", samplaigh(reimnigh.cén_aicme, briathra))
+	t.amanna("anailísigh() uncached", samplaigh(lambda b: reimnigh.anailísigh.__wrapped__(b, uimhreacha[b]), briathra))
+	t.amanna("anailísigh() cached", samplaigh(lambda b: reimnigh.anailísigh(b, uimhreacha[b]), briathra))
+	eolas = reimnigh.anailísigh.cache_info()
+	t.luach("stem cache hit rate", 100 * eolas.hits / (eolas.hits + eolas.misses), "%")
+
+
+# conjugating a single form compared with asking réimnigh() for one form and with a lazy paradigm
+def tagarmharc_cill(t: Taifeadán):
+	a, p, f = FoghaAimsire.láithreach, FoghaPearsan.céad_iorla, FoghaFoirme.cheisteach
+	paraidímí = {b: reimnigh.Paraidím(b) for b in briathra}
+	t.amanna("réimnigh() one form", samplaigh(lambda b: reimnigh.réimnigh(b, [a], [p], [f]), briathra))
+	t.amanna("réimnigh_cill()", samplaigh(lambda b: reimnigh.réimnigh_cill(b, a, p, f), briathra))
+	t.amanna("Paraidím[...]", samplaigh(lambda b: paraidímí[b][a, p, f], briathra))
+
+
+# building one form from its rules once the stem is known, for every form of every regular verb
+def tagarmharc_leagan(t: Taifeadán):
+	rialacha = reimnigh.faigh_rialacha()
+	cealla = []
+	for b in briathra:
+		if b in reimnigh.briathra_neamhrialta:
+			continue
+		réimniú = rialacha[reimnigh.cén_aicme(b)]
+		anailís = reimnigh.anailísigh(b, réimniú.uimhir)
+		for mumhan in False, True:
+			for a in réimniú.pleanáil(FoghaAimsire, FoghaPearsan, FoghaFoirme, mumhan):
+				for p, leagan in a.pearsana:
+					cealla += [(leagan, anailís, a.deireadh_scartha, (bunleagan,), p.forainm, mumhan)
+					           for bunleagan in a.foirmeacha]
+	t.amanna("Leagan.réimnigh() per form", samplaigh(lambda c: c[0].réimnigh(*c[1:], False), cealla))
+	t.amanna("Leagan.réimnigh() per form, highlighted", samplaigh(lambda c: c[0].réimnigh(*c[1:], True), cealla))
+
+
+# conjugating every form of a verb
+def tagarmharc_paraidím(t: Taifeadán):
+	t.amanna("réimnigh() full paradigm", samplaigh(reimnigh.réimnigh, briathra))
+	t.amanna("réimnigh() full paradigm, Munster", samplaigh(lambda b: reimnigh.réimnigh(b, mumhan=True), briathra))
+
+
+# formatting full paradigms for output
+def tagarmharc_formáidiú(t: Taifeadán):
+	torthaí = [reimnigh.réimnigh(b) for b in briathra]
+	torthaí_aibhsithe = [reimnigh.réimnigh(b, aibhsigh=True) for b in briathra]
+	taifid = list(reimnigh.taifid_iomlána(briathra))
+	aschur = StringIO()
+	stdout = sys.stdout
+	try:
+		sys.stdout = aschur
+		amanna = samplaigh(reimnigh.priontáil_toradh, torthaí)
+		amanna_aibhsithe = samplaigh(lambda toradh: reimnigh.priontáil_toradh(toradh, True), torthaí_aibhsithe)
+	finally:
+		sys.stdout = stdout
+	t.amanna("priontáil_toradh()", amanna)
+	t.amanna("priontáil_toradh(), highlighted", amanna_aibhsithe)
+	t.amanna("scríobh_jsonl()", samplaigh(lambda taifid_bhriathair: reimnigh.scríobh_jsonl(taifid_bhriathair, aschur),
+	                                      taifid))
+
+
+# run in a new process to time the first form it conjugates, which includes getting the rules
+céad_leagan = """
+from time import perf_counter
+import reimnigh
+tús = perf_counter()
+reimnigh.réimnigh_cill("eitil", reimnigh.FoghaAimsire.chaite, reimnigh.FoghaPearsan.céad_uatha, reimnigh.FoghaFoirme.dhearfach)
+print((perf_counter() - tús) * 1e6)
+"""
+
+
+# importing reimnigh and conjugating the first form in a new process, in microseconds
+def tús_próisis(timpeallacht: dict) -> tuple:
+	toradh = subprocess.run([sys.executable, "-X", "importtime", "-c", céad_leagan], cwd=fillteán, env=timpeallacht,
+	                        check=True, capture_output=True, encoding='utf-8')
+	# the cumulative time of the last import of reimnigh itself
+	iompórtáil = [líne.split("|") for líne in toradh.stderr.splitlines() if líne.rstrip().endswith("| reimnigh")]
+	return float(iompórtáil[-1][1]), float(toradh.stdout)
+
+
+# starting the command line from nothing to conjugate one form, and the first form conjugated in a new process
+# with the rules read from their snapshot and built from scratch
+def tagarmharc_tosú(t: Taifeadán):
+	ordú = [sys.executable, path.join(fillteán, "reimnigh.py"), "eitil", "-1ucd"]
+	t.amanna("reimnigh.py eitil -1ucd", samplaigh(lambda _: subprocess.run(ordú, check=True, stdout=subprocess.DEVNULL),
+	                                               range(10), 1))
+	reimnigh.tóg_rialacha_reoite()
+	for ainm, luach in (("snapshot", "1"), ("built", "0")):
+		amanna = [tús_próisis({**environ, 'REIMNIGH_RIALACHA_REOITE': luach}) for _ in range(10)]
+		t.amanna(f"import reimnigh ({ainm})", [iompórtáil for iompórtáil, _ in amanna])
+		t.amanna(f"first form in a new process ({ainm})", [céad for _, céad in amanna])
+
+
+# throughput of réimnigh_iomlán() compared with calling réimnigh() for each verb
+def tagarmharc_iomlán(t: Taifeadán):
+	aimsirí = [FoghaAimsire.láithreach]
+	for ainm, gníomh in (("réimnigh() loop", lambda _: [reimnigh.réimnigh(b, aimsirí, mumhan=True) for b in briathra]),
+	                     ("réimnigh_iomlán()", lambda _: list(reimnigh.réimnigh_iomlán(briathra, aimsirí, mumhan=True)))):
+		t.luach(f"{ainm} throughput", len(briathra) / min(samplaigh(gníomh, range(5), 1)) * 1e6, "verbs/s")
+
+
+# both dialects of full paradigms, one after the other compared with in one pass
+def tagarmharc_canúintí(t: Taifeadán):
+	def dhá_uair(_):
+		list(reimnigh.réimnigh_iomlán(briathra))
+		list(reimnigh.réimnigh_iomlán(briathra, mumhan=True))
+
+	for ainm, gníomh in (("réimnigh_iomlán() once per dialect", dhá_uair),
+	                     ("réimnigh_iomlán(canúintí=True)", lambda _: list(reimnigh.réimnigh_iomlán(briathra, canúintí=True)))):
+		t.luach(f"{ainm} throughput", len(briathra) / min(samplaigh(gníomh, range(5), 1)) * 1e6, "verbs/s")
+
+
+# how réimnigh_bulc() scales with the number of worker processes
+def tagarmharc_bulc(t: Taifeadán):
+	liosta = briathra * 10
+	líon = 1
+	while True:
+		tús = perf_counter()
+		for _ in reimnigh.réimnigh_bulc(liosta, próisis=líon):
+			pass
+		t.luach(f"réimnigh_bulc() throughput, {líon} process(es)", len(liosta) / (perf_counter() - tús), "verbs/s")
+		if líon >= (cpu_count() or 1):
+			break
+		líon = min(líon * 2, cpu_count())
+
+
+# whether this build of Python runs one thread at a time (free-threaded builds from 3.13 can turn the GIL off)
+def gil() -> bool:
+	return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+# how réimnigh_snáitheanna() scales with the number of threads, where one thread is réimnigh_iomlán()
+# it can only get faster with more threads on a free-threaded build with the GIL turned off
+def tagarmharc_snáitheanna(t: Taifeadán):
+	print(f"GIL {gil() and 'enabled' or 'disabled'}, {cpu_count()} CPU(s)")
+	liosta = briathra * 10
+	for líon in sorted({1, 2, 4, 8, cpu_count() or 1}):
+		tús = perf_counter()
+		for _ in reimnigh.réimnigh_snáitheanna(liosta, snáitheanna=líon, méid_smutáin=32):
+			pass
+		t.luach(f"réimnigh_snáitheanna() throughput, {líon} thread(s)", len(liosta) / (perf_counter() - tús), "verbs/s")
+
+
+# looking up single forms in a lexicon file compared with conjugating them
+def tagarmharc_foclóir(t: Taifeadán):
+	import foclior
+	a, p, f = FoghaAimsire.fháistineach, FoghaPearsan.tríú_iorla, FoghaFoirme.dhiúltach
+	with TemporaryDirectory() as fillteán_sealadach:
+		cosán = path.join(fillteán_sealadach, "foclóir.bin")
+		tús = perf_counter()
+		foclior.tóg(briathra, cosán)
+		t.luach("foclior.tóg() per verb", (perf_counter() - tús) / len(briathra) * 1e6, "µs", False)
+		with foclior.Foclóir(cosán) as foclóir:
+			t.amanna("Foclóir.leagan()", samplaigh(lambda b: foclóir.leagan(b, a, p, f), briathra))
+	t.amanna("réimnigh_cill() of the same forms", samplaigh(lambda b: reimnigh.réimnigh_cill(b, a, p, f), briathra))
+
+
+# building the reverse index of forms and looking forms up in it
+def tagarmharc_anailíseoir(t: Taifeadán):
+	import anailiseoir
+
+	# build it a few verbs at a time
+	def tóg():
+		anailíseoir = anailiseoir.Anailíseoir()
+		for i in range(0, len(briathra), 20):
+			anailíseoir.cuir_le(briathra[i:i + 20])
+		return anailíseoir
+
+	tús = perf_counter()
+	tóg()
+	t.luach("Anailíseoir.cuir_le() per verb", (perf_counter() - tús) / len(briathra) * 1e6, "µs", False)
+	tracemalloc.start()
+	anailíseoir = tóg()
+	cuimhne = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	t.luach("Anailíseoir index memory", cuimhne / 1024, "KiB", False)
+	foirmeacha = ["bheannóidís", "ní léimeann", "d'eitil", "osclaímid", "xyz"] * 20
+	t.amanna("Anailíseoir.anailísigh()", samplaigh(anailíseoir.anailísigh, foirmeacha))
+
+
+# memory used by many full paradigms as réimnigh() gives them compared with a dluth.Stór
+def tagarmharc_dlúth(t: Taifeadán):
+	import dluth
+
+	def tomhais_cuimhne(gníomh):
+		tracemalloc.start()
+		toradh = gníomh()
+		cuimhne = tracemalloc.get_traced_memory()[0]
+		tracemalloc.stop()
+		return toradh, cuimhne
+
+	def stór():
+		stór = dluth.Stór()
+		paraidímí = stór.cuir_le(briathra)
+		stór.reoigh()
+		return paraidímí
+
+	liosta, cuimhne = tomhais_cuimhne(lambda: [reimnigh.réimnigh(b) for b in briathra])
+	t.luach("réimnigh() results memory per verb", cuimhne / len(briathra), "bytes", False)
+	paraidímí, cuimhne = tomhais_cuimhne(stór)
+	t.luach("dluth.Stór memory per verb", cuimhne / len(briathra), "bytes", False)
+	a, p, f = FoghaAimsire.fháistineach, FoghaPearsan.tríú_iorla, FoghaFoirme.dhiúltach
+	t.amanna("ParaidímDhlúth[...]", samplaigh(lambda paraidím: paraidím[a, p, f], paraidímí))
+	t.amanna("ParaidímDhlúth.mar_liosta()", samplaigh(lambda paraidím: paraidím.mar_liosta(), paraidímí))
+
+
+# conjugating full paradigms through a persistent cache, the first time and once they're all in it
+def tagarmharc_taisce(t: Taifeadán):
+	import taisce
+	with TemporaryDirectory() as fillteán_sealadach, taisce.Taisce(path.join(fillteán_sealadach, "t.sqlite")) as tsc:
+		for ainm in "empty", "full":
+			tús = perf_counter()
+			for _ in tsc.réimnigh_bulc(briathra, próisis=1):
+				pass
+			t.luach(f"Taisce.réimnigh_bulc() throughput, {ainm} cache", len(briathra) / (perf_counter() - tús), "verbs/s")
+		t.amanna("Taisce.réimnigh(), full cache", samplaigh(tsc.réimnigh, briathra))
+
+
+# writing a search synonym file, and how big it is
+def tagarmharc_leathnú(t: Taifeadán):
+	from io import StringIO
+	import leathnu
+	for ainm, gach_claochlú in ("", False), (", every mutation", True):
+		aschur = StringIO()
+		tús = perf_counter()
+		leathnu.scríobh_comhchiallaigh(briathra, aschur, gach_claochlú)
+		t.luach(f"scríobh_comhchiallaigh(){ainm} throughput", len(briathra) / (perf_counter() - tús), "verbs/s")
+		t.luach(f"synonym file{ainm} per verb", len(aschur.getvalue().encode('utf-8')) / len(briathra), "bytes", False)
+
+
+tagarmhairc = {
+	'rialacha': tagarmharc_rialacha,
+	'fréamh': tagarmharc_fréamh,
+	'cill': tagarmharc_cill,
+	'leagan': tagarmharc_leagan,
+	'paraidím': tagarmharc_paraidím,
+	'formáidiú': tagarmharc_formáidiú,
+	'tosú': tagarmharc_tosú,
+	'iomlán': tagarmharc_iomlán,
+	'canúintí': tagarmharc_canúintí,
+	'bulc': tagarmharc_bulc,
+	'snáitheanna': tagarmharc_snáitheanna,
+	'foclóir': tagarmharc_foclóir,
+	'anailíseoir': tagarmharc_anailíseoir,
+	'dlúth': tagarmharc_dlúth,
+	'taisce': tagarmharc_taisce,
+	'leathnú': tagarmharc_leathnú,
+}
+
+
+# compare results with a saved baseline and return the names of those that got worse by more than
+# the tolerance, given as a fraction
+def compáráil(tomhais: dict, bunlíne: dict, lamháil: float) -> list:
+	níos_measa = []
+	print(f"\n{'compared with baseline':<48}{'before':>12}{'after':>12}{'change':>10}")
+	for ainm, tomhas in tomhais.items():
+		roimhe = bunlíne['tomhais'].get(ainm)
+		if roimhe is None or roimhe['aonad'] != tomhas['aonad']:
+			continue
+		if 'luach' in tomhas:
+			sean, nua, níos_airde = roimhe['luach'], tomhas['luach'], tomhas['níos_airde_níos_fearr']
+		else:
+			sean, nua, níos_airde = roimhe['p50'], tomhas['p50'], False
+		athrú = sean and (nua - sean) / sean or 0
+		measa = athrú < -lamháil if níos_airde else athrú > lamháil
+		if measa:
+			níos_measa.append(ainm)
+		print(f"{ainm:<48}{sean:>12.1f}{nua:>12.1f}{athrú:>+10.1%}{measa and '  !!' or ''}")
+	return níos_measa
+
+
+if __name__ == '__main__':
+	from argparse import ArgumentParser
+
+	parser = ArgumentParser()
+	parser.add_argument('tagarmhairc', nargs='*', help=f"na tagarmhairc le rith: {', '.join(tagarmhairc)}")
+	parser.add_argument('--sábháil', metavar='COMHAD', help='sábháiltear na torthaí mar bhunlíne JSON')
+	parser.add_argument('--compáráil', metavar='COMHAD', help='cuirtear na torthaí i gcomparáid le bunlíne JSON')
+	parser.add_argument('--lamháil', type=float, default=10, help='an méadú is mó a cheadaítear, mar chéatadán (10)')
+	args = parser.parse_args()
+	for ainm in args.tagarmhairc:
+		if ainm not in tagarmhairc:
+			parser.error(f"níl a leithéid de thagarmharc ann: {ainm}")
+
+	t = Taifeadán()
+	print(f"{'':<48}{'p50':>12}{'p90':>12}{'p99':>12}")
+	for ainm in args.tagarmhairc or tagarmhairc:
+		print(f"== {ainm}")
+		tagarmhairc[ainm](t)
+
+	if args.sábháil:
+		with open(args.sábháil, 'w', encoding='utf-8') as comhad:
+			json.dump({'python': platform.python_version(), 'implementation': platform.python_implementation(),
+			           'machine': platform.machine(), 'gil': gil(), 'tomhais': t.tomhais}, comhad, ensure_ascii=False, indent='\t')
+	if args.compáráil:
+		with open(args.compáráil, encoding='utf-8') as comhad:
+			bunlíne = json.load(comhad)
+		if compáráil(t.tomhais, bunlíne, args.lamháil / 100):
+			sys.exit(1)
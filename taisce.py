@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+# Persistent cache of conjugated verbs
+#
+# Keeps what réimnigh() gives in an SQLite file so jobs that conjugate the same verbs with the same options
+# again and again only do the work once. Results are keyed on the verb, the tenses, persons and forms asked
+# for, the dialect, highlighting, and the rule fingerprint of the verb's conjugation
+# (reimnigh.méarlorg_rialacha()), so changing the rules means old results are never used again. The least
+# recently used results are dropped once there are more than a set number. Several processes can use the
+# same file at once.
+#
+#   with Taisce("reimnigh.sqlite") as taisce:
+#       taisce.réimnigh("bris")                      -> the same as reimnigh.réimnigh("bris")
+#       taisce.réimnigh_bulc(briathra, próisis=4)    -> the same as reimnigh.réimnigh_bulc()
+#       taisce.staitisticí()                         -> hits, misses and evictions
+#
+#   python taisce.py COMHAD [--glan]
+
+from contextlib import contextmanager
+from hashlib import sha256
+import pickle
+import sqlite3
+from threading import Lock
+from time import time
+import reimnigh
+from reimnigh import FoghaAimsire, FoghaPearsan, FoghaFoirme
+
+leagan_scéimre = 1
+uasmhéid_réamhshocraithe = 100000  # results kept
+
+
+# the key a result is stored under
+def eochair(briathar: str, aimsirí: list, pearsana: list, foirmeacha: list, mumhan: bool, aibhsigh: bool,
+            canúintí: bool = False) -> bytes:
+	méarlorg = reimnigh.méarlorg_rialacha(reimnigh.cén_aicme(briathar))
+	canúint = canúintí and "canúintí" or str(bool(mumhan))
+	roghanna = "\t".join([briathar, ",".join(a.name for a in aimsirí), ",".join(p.name for p in pearsana),
+	                      ",".join(f.name for f in foirmeacha), canúint, str(bool(aibhsigh)), méarlorg])
+	return sha256(roghanna.encode('utf-8')).digest()
+
+
+class Taisce:
+	def __init__(self, cosán: str, uasmhéid: int = uasmhéid_réamhshocraithe):
+		self.uasmhéid = uasmhéid
+		self._glas = Lock()
+		# transactions are started by hand so that writers take the lock before reading, not part way through
+		self._nasc = sqlite3.connect(cosán, timeout=60, isolation_level=None, check_same_thread=False)
+		self._nasc.execute("PRAGMA journal_mode=WAL")
+		self._nasc.execute("PRAGMA synchronous=NORMAL")
+		with self._idirbheart():
+			if self._nasc.execute("PRAGMA user_version").fetchone()[0] != leagan_scéimre:
+				self._nasc.execute("DROP TABLE IF EXISTS torthaí")
+				self._nasc.execute("DROP TABLE IF EXISTS staitisticí")
+				self._nasc.execute(f"PRAGMA user_version={leagan_scéimre}")
+			self._nasc.execute("CREATE TABLE IF NOT EXISTS torthaí "
+			                   "(eochair BLOB PRIMARY KEY, toradh BLOB NOT NULL, úsáid REAL NOT NULL) WITHOUT ROWID")
+			self._nasc.execute("CREATE INDEX IF NOT EXISTS torthaí_úsáid ON torthaí (úsáid)")
+			self._nasc.execute("CREATE TABLE IF NOT EXISTS staitisticí (ainm TEXT PRIMARY KEY, luach INTEGER NOT NULL)")
+		# counts for this Taisce, added to the totals in the file when it's closed
+		self.aimsithe = self.caillte = self.díbeartha = 0
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *_):
+		self.dún()
+
+	# a write transaction that holds the database lock from the start
+	@contextmanager
+	def _idirbheart(self):
+		with self._glas:
+			self._nasc.execute("BEGIN IMMEDIATE")
+			try:
+				yield
+			except BaseException:
+				self._nasc.execute("ROLLBACK")
+				raise
+			self._nasc.execute("COMMIT")
+
+	# look up results, conjugate the ones that aren't there and store them, in input order
+	def _faigh(self, briathra: list, aimsirí: list, pearsana: list, foirmeacha: list, mumhan: bool, aibhsigh: bool,
+	           próisis: int = 1, méid_smutáin: int = 256, canúintí: bool = False) -> list:
+		eochracha = [eochair(b, aimsirí, pearsana, foirmeacha, mumhan, aibhsigh, canúintí) for b in briathra]
+		torthaí = dict.fromkeys(eochracha)
+		with self._glas:
+			for tús in range(0, len(eochracha), 500):
+				cuid = eochracha[tús:tús + 500]
+				for e, toradh in self._nasc.execute(
+						f"SELECT eochair, toradh FROM torthaí WHERE eochair IN ({','.join('?' * len(cuid))})", cuid):
+					torthaí[e] = pickle.loads(toradh)
+		aimsithe = [e for e, toradh in torthaí.items() if toradh is not None]
+		ar_iarraidh = {e: b for e, b in zip(eochracha, briathra) if torthaí[e] is None}
+		if ar_iarraidh:
+			# a pool is only worth starting if there's more than one worker's worth of verbs
+			if len(ar_iarraidh) <= méid_smutáin:
+				próisis = 1
+			nua = reimnigh.réimnigh_bulc(ar_iarraidh.values(), aimsirí, pearsana, foirmeacha, mumhan, aibhsigh, próisis,
+			                             méid_smutáin, canúintí)
+			torthaí.update(zip(ar_iarraidh, nua))
+
+		anois = time()
+		with self._idirbheart():
+			self._nasc.executemany("UPDATE torthaí SET úsáid = ? WHERE eochair = ?", ((anois, e) for e in aimsithe))
+			self._nasc.executemany("INSERT OR REPLACE INTO torthaí VALUES (?, ?, ?)",
+			                       ((e, pickle.dumps(torthaí[e], pickle.HIGHEST_PROTOCOL), anois) for e in ar_iarraidh))
+			díbeartha = 0
+			if ar_iarraidh:
+				# drop the least recently used down to 90% of the limit, so this doesn't happen on every write
+				líon = self._nasc.execute("SELECT COUNT(*) FROM torthaí").fetchone()[0]
+				if líon > self.uasmhéid:
+					díbeartha = self._nasc.execute(
+						"DELETE FROM torthaí WHERE eochair IN (SELECT eochair FROM torthaí ORDER BY úsáid LIMIT ?)",
+						(líon - self.uasmhéid * 9 // 10,)).rowcount
+			self.aimsithe += len(briathra) - len(ar_iarraidh)
+			self.caillte += len(ar_iarraidh)
+			self.díbeartha += díbeartha
+		return [torthaí[e] for e in eochracha]
+
+	# the same as reimnigh.réimnigh(), but using the cache
+	def réimnigh(self, briathar: str, aimsirí: list = FoghaAimsire, pearsana: list = FoghaPearsan,
+	             foirmeacha: list = FoghaFoirme, mumhan: bool = False, aibhsigh: bool = False) -> list:
+		return self._faigh([briathar], list(aimsirí), list(pearsana), list(foirmeacha), mumhan, aibhsigh)[0]
+
+	# the same as reimnigh.réimnigh_bulc(), but using the cache
+	# verbs are looked up méid_baisce at a time, and only the ones that weren't in the cache are conjugated
+	def réimnigh_bulc(self, briathra, aimsirí: list = FoghaAimsire, pearsana: list = FoghaPearsan,
+	                  foirmeacha: list = FoghaFoirme, mumhan: bool = False, aibhsigh: bool = False, próisis: int = None,
+	                  méid_smutáin: int = 256, méid_baisce: int = 4096, canúintí: bool = False):
+		aimsirí, pearsana, foirmeacha = list(aimsirí), list(pearsana), list(foirmeacha)
+		for baisc in reimnigh._smutáin(briathra, méid_baisce):
+			yield from self._faigh(baisc, aimsirí, pearsana, foirmeacha, mumhan, aibhsigh, próisis, méid_smutáin,
+			                       canúintí)
+
+	# counts for this Taisce and totals for everything that has used the file
+	def staitisticí(self) -> dict:
+		with self._glas:
+			iomlán = dict(self._nasc.execute("SELECT ainm, luach FROM staitisticí"))
+			líon, méid = self._nasc.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(toradh)), 0) FROM torthaí").fetchone()
+		staitisticí = {'aimsithe': self.aimsithe, 'caillte': self.caillte, 'díbeartha': self.díbeartha}
+		return {**staitisticí,
+		        'iomlán': {ainm: iomlán.get(ainm, 0) + luach for ainm, luach in staitisticí.items()},
+		        'torthaí': líon, 'bearta': méid}
+
+	# forget every result
+	def glan(self):
+		with self._idirbheart():
+			self._nasc.execute("DELETE FROM torthaí")
+
+	def dún(self):
+		if self._nasc is None:
+			return
+		with self._idirbheart():
+			self._nasc.executemany(
+				"INSERT INTO staitisticí VALUES (?, ?) ON CONFLICT (ainm) DO UPDATE SET luach = luach + excluded.luach",
+				[('aimsithe', self.aimsithe), ('caillte', self.caillte), ('díbeartha', self.díbeartha)])
+		self.aimsithe = self.caillte = self.díbeartha = 0
+		self._nasc.close()
+		self._nasc = None
+
+
+if __name__ == '__main__':
+	from argparse import ArgumentParser
+	import json
+
+	parser = ArgumentParser()
+	parser.add_argument('comhad', help='comhad na taisce')
+	parser.add_argument('--glan', action='store_true', help='scriostar gach toradh sa taisce')
+	args = parser.parse_args()
+
+	with Taisce(args.comhad) as taisce:
+		if args.glan:
+			taisce.glan()
+		staitisticí = taisce.staitisticí()
+	print(json.dumps({**staitisticí['iomlán'], 'torthaí': staitisticí['torthaí'], 'bearta': staitisticí['bearta']},
+	                 ensure_ascii=False, indent='\t'))
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+import unittest
+from anailiseoir import Anailíseoir
+from reimnigh import FoghaAimsire, FoghaPearsan, FoghaFoirme
+
+
+class AnailíseoirTests(unittest.TestCase):
+	def test_analysis(self):
+		anailíseoir = Anailíseoir(["beannaigh"])
+		anailíseoir.cuir_le(["léim", "beannaigh"])
+		self.assertEqual(["beannaigh", "léim"], anailíseoir.briathra)
+
+		t, = anailíseoir.anailísigh("bheannóidís")
+		self.assertEqual(("beannaigh", FoghaAimsire.coinníollach, FoghaPearsan.tríú_iorla, FoghaFoirme.dhearfach, False),
+		                 t[:5])
+
+		pearsana = {(t.pearsa, t.mumhan) for t in anailíseoir.anailísigh("Ní léimeann")}
+		self.assertIn((FoghaPearsan.tríú_uatha, False), pearsana)
+		self.assertIn((FoghaPearsan.tríú_iorla, False), pearsana)
+		self.assertEqual({FoghaPearsan.tríú_uatha}, {t.pearsa for t in anailíseoir.anailísigh("ní léimeann sé")})
+		self.assertEqual([], anailíseoir.anailísigh("bris"))
+
+	# a verb given twice at once is only added once
+	def test_repeated(self):
+		anailíseoir = Anailíseoir(["bris", "bris"])
+		anailíseoir.cuir_le(["léim", "léim", "bris"])
+		self.assertEqual(["bris", "léim"], anailíseoir.briathra)
+		t, = anailíseoir.anailísigh("bhris mé")
+		self.assertEqual("bris", t.briathar)
+		t, = anailíseoir.anailísigh("léimfidh mé")
+		self.assertEqual("léim", t.briathar)
+
+
+if __name__ == '__main__':
+	unittest.main()
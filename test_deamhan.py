@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+import json
+from os import environ, path
+from tempfile import TemporaryDirectory
+from threading import Thread
+import unittest
+from unittest import mock
+import deamhan
+import reimnigh
+from reimnigh import FoghaAimsire, FoghaPearsan, FoghaFoirme
+from taisce import Taisce
+
+
+class DeamhanTests(unittest.TestCase):
+	def setUp(self):
+		self.fillteán = TemporaryDirectory()
+		self.seoladh = path.join(self.fillteán.name, "reimnigh.sock")
+		self.freastalaí = deamhan.freastalaí(self.seoladh)
+		Thread(target=self.freastalaí.serve_forever, daemon=True).start()
+
+	def tearDown(self):
+		self.freastalaí.shutdown()
+		self.freastalaí.server_close()
+		self.fillteán.cleanup()
+
+	def test_same_as_local(self):
+		with deamhan.Cliant(self.seoladh) as cliant:
+			self.assertEqual(reimnigh.réimnigh("beannaigh", mumhan=True), cliant.réimnigh("beannaigh", mumhan=True))
+			self.assertEqual(reimnigh.réimnigh("eitil", [FoghaAimsire.chaite], [FoghaPearsan.céad_uatha], [FoghaFoirme.dhearfach]),
+			                 cliant.réimnigh("eitil", [FoghaAimsire.chaite], [FoghaPearsan.céad_uatha], [FoghaFoirme.dhearfach]))
+
+	def test_parts(self):
+		with deamhan.Cliant(self.seoladh) as cliant:
+			toradh = cliant.iarr(briathar="oscail", aimsirí=["chaite"], pearsana=["céad_uatha"], foirmeacha=["dhearfach"],
+			                     míreanna=True)['toradh']
+		leagan = toradh[0]['pearsana'][0][0]
+		self.assertEqual("d'oscail mé", leagan['leagan'])
+		self.assertIn(["réimír", 0, 2], leagan['míreanna'])
+
+	def test_errors(self):
+		with deamhan.Cliant(self.seoladh) as cliant:
+			self.assertIn('earráid', cliant.iarr(briathar="bris", aimsirí=["inné"]))
+			self.assertIn('earráid', cliant.iarr(aimsirí=["chaite"]))
+			# the connection is still usable afterwards
+			self.assertIn('toradh', cliant.iarr(briathar="bris"))
+
+	def test_bad_verb(self):
+		with deamhan.Cliant(self.seoladh) as cliant:
+			for briathar in "b", "igh":
+				self.assertIn(repr(briathar), cliant.iarr(briathar=briathar)['earráid'])
+				self.assertIn('earráid', cliant.iarr(briathar=briathar, aimsirí=["chaite"], pearsana=["céad_uatha"],
+				                                     foirmeacha=["dhearfach"]))
+			self.assertEqual(reimnigh.réimnigh("bris"), cliant.réimnigh("bris"))
+
+
+class CliantTests(unittest.TestCase):
+	def setUp(self):
+		self.fillteán = TemporaryDirectory()
+		self.seoladh = path.join(self.fillteán.name, "reimnigh.sock")
+		self.freastalaí = deamhan.freastalaí(self.seoladh)
+		Thread(target=self.freastalaí.serve_forever, daemon=True).start()
+
+	def tearDown(self):
+		self.freastalaí.shutdown()
+		self.freastalaí.server_close()
+		self.fillteán.cleanup()
+
+	# what something writes to stdout and stderr
+	@staticmethod
+	def aschur(gníomh, argv: list):
+		amach, earráidí = StringIO(), StringIO()
+		with redirect_stdout(amach), redirect_stderr(earráidí):
+			gníomh(argv)
+		return amach.getvalue(), earráidí.getvalue()
+
+	# the client against this daemon, and reimnigh.py without it, should print the same thing
+	# gives what the client wrote to stdout and stderr
+	def assertSameAsLocal(self, *argv, daemon=False):
+		áitiúil, _ = self.aschur(reimnigh.príomh, list(argv))
+		with mock.patch.dict(environ, {'REIMNIGH_DEAMHAN': self.seoladh}), \
+				mock.patch.object(reimnigh, 'príomh', wraps=reimnigh.príomh) as príomh:
+			amach, earráidí = self.aschur(deamhan.cliant, list(argv))
+		self.assertEqual(áitiúil, amach)
+		self.assertEqual(not daemon, príomh.called)
+		return amach, earráidí
+
+	def test_daemon(self):
+		self.assertSameAsLocal("bris", "-1ucd", daemon=True)
+		self.assertSameAsLocal("beannaigh", "-m", "-a", daemon=True)
+
+	def test_build_rules(self):
+		with mock.patch.object(reimnigh, 'tóg_rialacha_reoite', return_value="rialacha.pickle"):
+			amach, _ = self.assertSameAsLocal("bris", "-1ucd", "--tóg-rialacha")
+		self.assertEqual("rialacha.pickle\n", amach)
+
+	def test_instrumentation(self):
+		_, earráidí = self.assertSameAsLocal("bris", "-1ucd", "--ionstraim", "json")
+		ionstr = json.loads(earráidí)
+		self.assertEqual({'gan_athrú': 1}, ionstr['rialacha']['fréamh'])
+		self.assertEqual(1, ionstr['céimeanna']['fréamh']['glaonna'])
+
+	def test_cache(self):
+		cosán = path.join(self.fillteán.name, "taisce.sqlite")
+		self.assertSameAsLocal("bris", "-1ucd", "--taisce", cosán)
+		with Taisce(cosán) as taisce:
+			staitisticí = taisce.staitisticí()
+		self.assertEqual(1, staitisticí['torthaí'])
+		self.assertEqual(1, staitisticí['iomlán']['aimsithe'])
+
+	def test_dialects_need_format(self):
+		with mock.patch.dict(environ, {'REIMNIGH_DEAMHAN': self.seoladh}), redirect_stderr(StringIO()) as earráidí:
+			with self.assertRaises(SystemExit):
+				deamhan.cliant(["bris", "--canúintí"])
+		self.assertIn("--canúintí needs --format jsonl or csv", earráidí.getvalue())
+
+
+if __name__ == '__main__':
+	unittest.main()
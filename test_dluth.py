@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+import unittest
+import reimnigh
+from dluth import Stór
+from reimnigh import FoghaAimsire, FoghaPearsan, FoghaFoirme
+
+
+class StórTests(unittest.TestCase):
+	def test_same_as_reimnigh(self):
+		stór = Stór()
+		bris, glan = stór.cuir_le(["bris", "glan"])
+		beannaigh, = stór.cuir_le(["beannaigh"], mumhan=True)
+		stór.reoigh()
+		self.assertEqual(3, len(stór))
+		self.assertEqual("bhris mé", bris[FoghaAimsire.chaite, FoghaPearsan.céad_uatha, FoghaFoirme.dhearfach])
+		self.assertIsNone(glan[FoghaAimsire.foshuiteach, FoghaPearsan.céad_uatha, FoghaFoirme.cheisteach])
+		self.assertEqual(reimnigh.réimnigh("glan"), glan.mar_liosta())
+		self.assertEqual(reimnigh.réimnigh("beannaigh", mumhan=True), beannaigh.mar_liosta())
+		self.assertEqual(reimnigh.réimnigh("bris", [FoghaAimsire.láithreach], [FoghaPearsan.briathar_saor]),
+		                 bris.mar_liosta([FoghaAimsire.láithreach], [FoghaPearsan.briathar_saor]))
+		self.assertRaises(AttributeError, stór.cuir_le, ["léim"])
+		# and nothing was added before it failed
+		self.assertEqual(3, len(stór))
+		self.assertEqual(reimnigh.réimnigh("glan"), glan.mar_liosta())
+
+
+if __name__ == '__main__':
+	unittest.main()
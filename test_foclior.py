@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+from os import path
+from tempfile import TemporaryDirectory
+import unittest
+import foclior
+import reimnigh
+from reimnigh import FoghaAimsire, FoghaPearsan, FoghaFoirme
+
+
+class FoclóirTests(unittest.TestCase):
+	def test_lookup(self):
+		briathra = ["bris", "beannaigh", "sábháil", "oscail", "glan"]
+		with TemporaryDirectory() as fillteán:
+			cosán = path.join(fillteán, "foclóir.bin")
+			foclior.tóg(briathra, cosán)
+			with foclior.Foclóir(cosán) as foclóir:
+				self.assertEqual(sorted(briathra), list(foclóir.briathra()))
+				for briathar in briathra + ["ceannaigh"]:
+					for mumhan in False, True:
+						for a in FoghaAimsire:
+							for p in FoghaPearsan:
+								for f in FoghaFoirme:
+									ró = reimnigh.réimnigh(briathar, [a], [p], [f], mumhan)[0]['pearsana'][0]
+									self.assertEqual(ró and ró[0] or None, foclóir.leagan(briathar, a, p, f, mumhan))
+				self.assertIn("bris", foclóir)
+				self.assertNotIn("ceannaigh", foclóir)
+
+
+if __name__ == '__main__':
+	unittest.main()
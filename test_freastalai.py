@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+import asyncio
+import json
+import unittest
+from unittest import mock
+import freastalai
+import reimnigh
+
+
+class FreastalaíTests(unittest.TestCase):
+	def test_coalescing(self):
+		async def rith():
+			freastalaí = freastalai.Freastalaí(1)
+			try:
+				return await asyncio.gather(*(freastalaí.freagair({"briathar": "beannaigh"}) for _ in range(5))), freastalaí
+			finally:
+				freastalaí.close()
+
+		freagraí, freastalaí = asyncio.run(rith())
+		self.assertEqual([{'toradh': reimnigh.réimnigh("beannaigh")}] * 5, freagraí)
+		self.assertEqual({'iarratais': 5, 'comhcheangailte': 4, 'linn': 1}, freastalaí.staitisticí)
+
+	def test_http(self):
+		async def rith():
+			freastalaí = freastalai.Freastalaí(1)
+			seirbhís = await asyncio.start_server(freastalaí.ceangal, '127.0.0.1', 0)
+			port = seirbhís.sockets[0].getsockname()[1]
+			try:
+				léitheoir, scríbhneoir = await asyncio.open_connection('127.0.0.1', port)
+				scríbhneoir.write("GET /reimnigh?briathar=eitil&aimsir=chaite&pearsa=céad_uatha&foirm=dhearfach&mumhan=1 "
+				                  "HTTP/1.0\r\n\r\n".encode('utf-8'))
+				freagra = await léitheoir.read()
+				scríbhneoir.close()
+				return freagra
+			finally:
+				seirbhís.close()
+				freastalaí.close()
+
+		ceanntásc, _, corp = asyncio.run(rith()).partition(b"\r\n\r\n")
+		self.assertTrue(ceanntásc.startswith(b"HTTP/1.1 200"))
+		self.assertEqual({'toradh': [{'ainm': "an aimsir chaite", 'pearsana': [["d'eitlíos"]]}]}, json.loads(corp))
+
+
+	def test_errors(self):
+		# one response on a kept-alive connection
+		async def léigh_freagra(léitheoir):
+			ceanntásc = await léitheoir.readuntil(b"\r\n\r\n")
+			fad = int(ceanntásc.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+			return int(ceanntásc.split()[1]), json.loads(await léitheoir.readexactly(fad))
+
+		async def rith():
+			freastalaí = freastalai.Freastalaí(1)
+			seirbhís = await asyncio.start_server(freastalaí.ceangal, '127.0.0.1', 0)
+			port = seirbhís.sockets[0].getsockname()[1]
+			torthaí = []
+			try:
+				léitheoir, scríbhneoir = await asyncio.open_connection('127.0.0.1', port)
+				# a bad verb, through the worker processes and not, then a good one on the same connection
+				for ceist in "briathar=b", "briathar=igh&aimsir=chaite&pearsa=céad_uatha&foirm=dhearfach", "briathar=bris":
+					scríbhneoir.write(f"GET /reimnigh?{ceist} HTTP/1.1\r\n\r\n".encode('utf-8'))
+					torthaí.append(await léigh_freagra(léitheoir))
+				scríbhneoir.close()
+
+				for iarratas in (b"POST /reimnigh HTTP/1.1\r\nContent-Length: -5\r\n\r\n",
+				                 b"GET /reimnigh?briathar=" + b"a" * 100000 + b" HTTP/1.1\r\n\r\n"):
+					léitheoir, scríbhneoir = await asyncio.open_connection('127.0.0.1', port)
+					scríbhneoir.write(iarratas)
+					torthaí.append(await léigh_freagra(léitheoir))
+					scríbhneoir.close()
+
+				# anything else that goes wrong is an internal error for every request sharing the work
+				léitheoir, scríbhneoir = await asyncio.open_connection('127.0.0.1', port)
+				with mock.patch.object(freastalai.deamhan, 'freagair', side_effect=RuntimeError("briste")):
+					scríbhneoir.write(b"GET /reimnigh?briathar=glan&aimsir=chaite HTTP/1.1\r\n\r\n")
+					torthaí.append(await léigh_freagra(léitheoir))
+				scríbhneoir.write(b"GET /reimnigh?briathar=glan&aimsir=chaite HTTP/1.1\r\n\r\n")
+				torthaí.append(await léigh_freagra(léitheoir))
+				scríbhneoir.close()
+				return torthaí
+			finally:
+				seirbhís.close()
+				freastalaí.close()
+
+		torthaí = asyncio.run(rith())
+		self.assertEqual([400, 400, 200, 400, 400, 500, 200], [cód for cód, _ in torthaí])
+		self.assertIn("'b'", torthaí[0][1]['earráid'])
+		self.assertEqual({'toradh': reimnigh.réimnigh("bris")}, torthaí[2][1])
+		self.assertEqual({'earráid': "line too long"}, torthaí[4][1])
+		self.assertIn("briste", torthaí[5][1]['earráid'])
+
+
+if __name__ == '__main__':
+	unittest.main()
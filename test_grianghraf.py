@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+import tempfile
+import unittest
+from unittest import mock
+import reimnigh
+from grianghraf import Grianghraf, blúire
+
+
+class GrianghrafTests(unittest.TestCase):
+	def test_snapshot(self):
+		with tempfile.TemporaryDirectory() as fillteán:
+			self.assertEqual(["+ bris", "+ glan"], list(Grianghraf(fillteán).seiceáil(["glan", "bris"], True)))
+			self.assertEqual([], list(Grianghraf(fillteán).seiceáil(["bris", "glan"])))
+			self.assertIn("bris\tbhris mé\t", Grianghraf(fillteán).léigh(blúire("bris")))
+
+			# shards that haven't changed aren't conjugated again
+			with mock.patch.object(reimnigh, 'réimnigh_bulc', side_effect=AssertionError):
+				self.assertEqual(["- glan"], list(Grianghraf(fillteán).seiceáil(["bris"])))
+
+	def test_changed_forms(self):
+		with tempfile.TemporaryDirectory() as fillteán:
+			list(Grianghraf(fillteán).seiceáil(["bris"], True))
+
+			def réimnigh_bulc(briathra, próisis, canúintí):
+				toradh = reimnigh.réimnigh_canúintí("bris")
+				toradh[0]['pearsana'][0][0] = toradh[0]['pearsana'][0][0]._replace(caighdeánach="bhris mise")
+				return [toradh]
+
+			with mock.patch.object(reimnigh, 'réimnigh_bulc', side_effect=réimnigh_bulc):
+				self.assertEqual([], list(Grianghraf(fillteán).seiceáil(["bris"])))
+				self.assertEqual(["~ bris chaite céad_uatha dhearfach: bhris mé -> bhris mise"],
+				                 list(Grianghraf(fillteán).seiceáil(["bris"], gach=True)))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+from io import StringIO
+import unittest
+import leathnu
+
+
+class LeathnúTests(unittest.TestCase):
+	def test_words(self):
+		beannaigh = leathnu.leathnaigh("beannaigh")
+		self.assertTrue({"beannaigh", "bheannaigh", "mbeannóidh", "beannóidh", "bheannaíos"} <= beannaigh)
+		eitil = leathnu.leathnaigh("eitil")
+		self.assertTrue({"eitil", "d'eitil", "n-eitlímid", "eitlímid"} <= eitil)
+		# no particles or pronouns
+		for focal in beannaigh | eitil:
+			self.assertNotIn(" ", focal)
+		self.assertNotIn("ní", beannaigh)
+
+	def test_every_mutation(self):
+		bris = leathnu.leathnaigh("bris", gach_claochlú=True)
+		self.assertIn("mbris", bris)
+		self.assertNotIn("mbris", leathnu.leathnaigh("bris"))
+		self.assertEqual(["n-ól", "hól", "d'ól"], list(leathnu.claochluithe("ól")))
+		self.assertEqual(["fhág", "d'fhág", "bhfág"], list(leathnu.claochluithe("fág")))
+		self.assertEqual([], list(leathnu.claochluithe("scuab")))
+
+	def test_synonym_file(self):
+		aschur = StringIO()
+		self.assertEqual((2, len(leathnu.leathnaigh("bris")) + len(leathnu.leathnaigh("glan"))),
+		                 leathnu.scríobh_comhchiallaigh(["glan", "bris"], aschur))
+		línte = aschur.getvalue().splitlines()
+		self.assertTrue(línte[0].endswith(" => glan"))
+		self.assertIn("ghlan, ", línte[0])
+		self.assertEqual(sorted(leathnu.leathnaigh("bris")), línte[1][:-len(" => bris")].split(", "))
+
+
+if __name__ == '__main__':
+	unittest.main()
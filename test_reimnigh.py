@@ -3,14 +3,28 @@
 # © 2020 Caoimhe Ní Chaoimh
 # CC BY-NC-SA 4.0
 
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
+import gzip
 import json
+import os
+import pickle
+import re
+import select
 import subprocess
+import sys
+import tempfile
+from threading import Barrier
 import unittest
+from unittest import mock
 import reimnigh
 
 datadir = "test/BuNaMo/verb"  # submodule with grammar database
 gramadoir_exe = "test/gramadoir"  # test utility for processing data from above datasource
+# forms extracted from the above, so the tests don't need to run gramadoir (or Mono) every time
+cache_file = "test/bunamo-cache.json.gz"
+cache_version = 1
 
 # réimnigh and the gramadóir app output things in a slightly different format
 # so these are a few mappings to translate between them
@@ -28,37 +42,542 @@ shapemap = ["Declar", "Declar", "Interrog"]
 polmap = ["Pos", "Neg", "Pos"]
 
 # Don't test against these
-irregular_verbs = ["abair", "beir", "bí", "clois", "déan", "faigh", "feic", "ith", "tabhair", "tar", "téigh"]
+# BuNaMo's present tense of "bí" is the habitual "bíonn", where réimnigh gives "tá"
+skipped_verbs = ["bí"]
+
+
+# commit of the BuNaMo submodule, or None if it can't be found
+def bunamo_revision():
+	submodule = os.path.dirname(datadir)
+	if os.path.exists(os.path.join(submodule, ".git")):
+		command = ["git", "-C", submodule, "rev-parse", "HEAD"]
+	else:
+		command = ["git", "rev-parse", f"HEAD:{submodule}"]  # the commit recorded for the submodule
+	try:
+		result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+	except (OSError, subprocess.CalledProcessError):
+		return None
+	return result.stdout.decode('ascii').strip() or None
+
+
+# run gramadoir on one BuNaMo file, giving the verb and its forms keyed by "tense/person/shape/polarity"
+# There may be multiple entries for a given form, e.g. brisimid/briseann muid. Only the first one is kept.
+def extract_forms(file):
+	jsondata = subprocess.run([gramadoir_exe, file], stdout=subprocess.PIPE, check=True)
+	dictionary = json.loads(jsondata.stdout.decode('utf-8'))
+	forms = {}
+	for e in dictionary['forms']:
+		forms.setdefault(f"{e['tense']}/{e['person']}/{e['shape']}/{e['polarity']}", e['value'])
+	return dictionary['verbName'], forms
+
+
+# the forms of every verb in BuNaMo, from the cache if it's for the same revision,
+# otherwise from running gramadoir on every file, or None if neither is possible
+def load_bunamo():
+	revision = bunamo_revision()
+	try:
+		with gzip.open(cache_file, 'rt', encoding='utf-8') as f:
+			cache = json.load(f)
+		if cache['version'] == cache_version and (revision is None or cache['revision'] == revision):
+			return cache['verbs']
+	except (OSError, ValueError, KeyError):
+		pass
+
+	files = sorted(glob(f"{datadir}/*_verb.xml"))
+	if not files or not os.access(gramadoir_exe, os.X_OK):
+		return None
+	with ThreadPoolExecutor(os.cpu_count()) as pool:
+		verbs = dict(pool.map(extract_forms, files))
+	with gzip.open(cache_file, 'wt', encoding='utf-8') as f:
+		json.dump({'version': cache_version, 'revision': revision, 'verbs': verbs}, f, ensure_ascii=False,
+		          separators=(',', ':'))
+	return verbs
 
 
 class ReimnightTests(unittest.TestCase):
 	def test_conjugation(self):
-		files = glob(f"{datadir}/*_verb.xml")
-		for file in files:
-			jsondata = subprocess.run([gramadoir_exe, file], stdout=subprocess.PIPE)
-			dictionary = json.loads(jsondata.stdout.decode('utf-8'))
-			verb = dictionary['verbName']
-			if verb in irregular_verbs:
-				continue  # ignore irregular verbs
+		dictionary = load_bunamo()
+		if dictionary is None:
+			self.skipTest(f"needs {datadir} and {gramadoir_exe}, or {cache_file}")
+		verbs = [verb for verb in dictionary if verb not in skipped_verbs]
+		# conjugate every verb using all the CPUs, then compare them one at a time
+		for verb, output in zip(verbs, reimnigh.réimnigh_bulc(verbs, próisis=None if len(verbs) > 100 else 1)):
+			forms = dictionary[verb]
 			with self.subTest(verb=verb):
-				output = reimnigh.réimnigh(verb)
 				for tense in output:
 					for p, person in enumerate(tense['pearsana']):
 						for f, form in enumerate(person):
-							entries = [e for e in dictionary['forms'] if
-								e['tense'] == tensemap.get(tense['ainm']) and
-								e['person'] == personmap[p] and
-								e['shape'] == shapemap[f] and
-								e['polarity'] == polmap[f]]
-							if not entries:
+							key = f"{tensemap.get(tense['ainm'])}/{personmap[p]}/{shapemap[f]}/{polmap[f]}"
+							expected = forms.get(key)
+							if expected is None:
 								continue  # some verbs in BuNaMo dataset seem to be missing past tense autonomous forms?
 							# réimnigh outputs first person singular as one line, so we need to fix it a little
 							if form.endswith('sí/sé'):
 								form = form[:-3]
-							# There may be multiple entries for a given form, e.g. brisimid/briseann muid
-							# This will only validate against the first one
-							expected = entries[0]['value']
-							self.assertEqual(expected, form, f"{verb}: expected form '{expected}', actual output: '{form}' ({tensemap.get(tense['ainm'])}, {personmap[p]}, {shapemap[f]}, {polmap[f]})")
+							self.assertEqual(expected, form, f"{verb}: expected form '{expected}', actual output: '{form}' ({key.replace('/', ', ')})")
+
+
+class RialachaTests(unittest.TestCase):
+	def test_rules_shared(self):
+		self.assertIs(reimnigh.cén_réimniú("bris"), reimnigh.cén_réimniú("glan"))
+		self.assertIs(reimnigh.faigh_rialacha(), reimnigh.faigh_rialacha())
+
+	def test_rules_frozen(self):
+		réimniú = reimnigh.cén_réimniú("bris")
+		with self.assertRaises(AttributeError):
+			réimniú.a_chaite.dearfach.mír = 'ní'
+		with self.assertRaises(AttributeError):
+			réimniú.a_chaite.céad_phearsa.uatha.mumhan = None
+		with self.assertRaises(TypeError):
+			réimniú.aimsirí[reimnigh.FoghaAimsire.chaite] = None
+
+	# every class of this module that the rules and the forms they give are made of is part of their fingerprint
+	def test_fingerprint_code(self):
+		aicmí = set()
+		le_déanamh = [reimnigh.faigh_rialacha(), reimnigh.faigh_neamhrialta(), reimnigh.tábla_fréamhacha,
+		              reimnigh.réimnigh_cill("bris", reimnigh.FoghaAimsire.chaite, reimnigh.FoghaPearsan.céad_uatha,
+		                                     reimnigh.FoghaFoirme.dhearfach)]
+		while le_déanamh:
+			luach = le_déanamh.pop()
+			if type(luach).__module__ == 'reimnigh':
+				aicmí.add(type(luach).__name__)
+			if isinstance(luach, reimnigh.Reoiteach):
+				le_déanamh.extend(vars(luach).values())
+			elif isinstance(luach, Mapping):
+				le_déanamh.extend(luach.values())
+			elif isinstance(luach, (tuple, list, frozenset)):
+				le_déanamh.extend(luach)
+		self.assertIn('LeaganRoinnte', aicmí)
+		self.assertLessEqual(aicmí, set(reimnigh._ainmneacha_cóid()))
+
+	def test_endings(self):
+		deireadh = reimnigh.déan_deireadh("[ó](eo)idh")
+		self.assertEqual(("óidh", "eoidh"), (deireadh[False], deireadh[True]))
+		self.assertEqual(("o", "e"), deireadh.tús)
+		self.assertIs(deireadh, reimnigh.cén_réimniú("imir").a_fháist.deireadh(False))
+		deireadh = reimnigh.déan_deireadh("t(e)ar")
+		self.assertEqual(("tar", "tear"), deireadh[:2])
+		self.assertTrue(deireadh.t and deireadh.f_nó_t)
+		self.assertEqual(("", ""), reimnigh.déan_deireadh("").tús)
+
+
+class RialachaReoiteTests(unittest.TestCase):
+	def setUp(self):
+		self.fillteán = tempfile.TemporaryDirectory()
+		self.cosán = os.path.join(self.fillteán.name, "rialacha")
+
+	def tearDown(self):
+		self.fillteán.cleanup()
+
+	def test_same_rules(self):
+		self.assertEqual(self.cosán, reimnigh.tóg_rialacha_reoite(self.cosán))
+		rialacha, neamhrialta = reimnigh._léigh_rialacha_reoite(self.cosán)
+		self.assertEqual(reimnigh._mar_théacs(reimnigh.faigh_rialacha()), reimnigh._mar_théacs(rialacha))
+		self.assertEqual(reimnigh._mar_théacs(reimnigh.faigh_neamhrialta()), reimnigh._mar_théacs(neamhrialta))
+		for briathar, bunúsach in reimnigh.faigh_neamhrialta().items():
+			self.assertEqual(bunúsach._téacs, neamhrialta[briathar]._téacs)
+			self.assertEqual([l and l.míreanna for l in bunúsach._roinnte], [l and l.míreanna for l in neamhrialta[briathar]._roinnte])
+			self.assertIs(rialacha[reimnigh.cén_aicme(briathar)], neamhrialta[briathar]._réimniú)
+		# and still frozen
+		with self.assertRaises(AttributeError):
+			rialacha[1].a_chaite.dearfach.mír = 'ní'
+		with self.assertRaises(TypeError):
+			rialacha[1].aimsirí[reimnigh.FoghaAimsire.chaite] = None
+		with self.assertRaises(AttributeError):
+			neamhrialta["feic"].briathar = "bris"
+
+	def test_rejected(self):
+		reimnigh.tóg_rialacha_reoite(self.cosán)
+		with mock.patch.object(reimnigh, '_eochair_rialacha_reoite', return_value=b"sean"):
+			self.assertIsNone(reimnigh._léigh_rialacha_reoite(self.cosán))
+		with open(self.cosán, 'r+b') as comhad:
+			comhad.truncate(1000)
+		self.assertIsNone(reimnigh._léigh_rialacha_reoite(self.cosán))
+		# nothing but the rules can be loaded from it
+		with open(self.cosán, 'wb') as comhad:
+			comhad.write(reimnigh._eochair_rialacha_reoite() + pickle.dumps((os.system, {})))
+		self.assertIsNone(reimnigh._léigh_rialacha_reoite(self.cosán))
+		self.assertIsNone(reimnigh._léigh_rialacha_reoite(os.path.join(self.fillteán.name, "níl")))
+
+	# written by the script and read by the module, which have their own copies of every class
+	def test_script(self):
+		toradh = subprocess.run([sys.executable, "-X", f"pycache_prefix={self.fillteán.name}", "reimnigh.py", "--tóg-rialacha"],
+		                        stdout=subprocess.PIPE, check=True, encoding='utf-8')
+		with mock.patch.object(sys, 'pycache_prefix', self.fillteán.name):
+			cosán = reimnigh.cosán_rialacha_reoite()
+		self.assertEqual(cosán, toradh.stdout.strip())
+		rialacha, neamhrialta = reimnigh._léigh_rialacha_reoite(cosán)
+		self.assertIs(reimnigh.Réimniú, type(rialacha[1]))
+		self.assertIs(reimnigh.FoghaAimsire.chaite, next(iter(rialacha[1].aimsirí)))
+		self.assertEqual("chonaic mé", neamhrialta["feic"].réimnigh_cill("feic", reimnigh.FoghaAimsire.chaite,
+		                 reimnigh.FoghaPearsan.céad_uatha, reimnigh.FoghaFoirme.dhearfach, False, False))
+
+
+# cén_aicme() and anailísigh() as they were before they used decision tables, to check the tables against
+def sean_cén_aicme(briathar: str) -> float:
+	if reimnigh.comhair_siollaí(briathar) > 1 and reimnigh.críochnaigh_le(briathar, ['igh', 'ir', 'il', 'in', 'is', 'ing']) \
+			and not reimnigh.deireadh_fada(briathar) and not briathar.endswith('uigh')\
+			and not re.match(r".+[eou]ir$", briathar) and not re.match(r".+[^a]ghair$", briathar):
+		return 2
+	elif briathar.endswith('dhaill') or briathar.endswith('nill'):
+		return 2
+	elif reimnigh.críochnaigh_le(briathar, ['igh', 'ígh']) \
+			and not reimnigh.deireadh_fada(briathar):
+		return 1.5
+	return 1
+
+
+def sean_anailísigh(briathar: str, uimhir: int) -> reimnigh.Anailís:
+	if reimnigh.críochnaigh_le(briathar, ['igh', 'ígh']):
+		fréamh = re.sub(r"^((?:.+[^a])|.)a?[ií]gh$", r"\1", briathar)
+		caol = briathar[-4] not in "aáoóuú"
+		riail = 'igh'
+	elif briathar.endswith("áil") and len(briathar) > 4 and not briathar.endswith("dháil"):
+		fréamh = re.sub(r"(á)i(l)$", r"\1\2", briathar)
+		caol = False
+		riail = 'áil'
+	elif re.match(r".+pe?áin$", briathar):
+		fréamh = re.sub(r"(á)i(n)$", r"\1\2", briathar)
+		caol = False
+		riail = 'áin'
+	elif re.match(r".+ai[cd]$", briathar):
+		fréamh = re.sub(r"ai([cd])$", r"a\1", briathar)
+		caol = False
+		riail = 'aic'
+	elif briathar.endswith('aill') and reimnigh.comhair_siollaí(briathar) > 1:
+		fréamh = re.sub(r"aill$", uimhir == 1 and 'all' or 'l', briathar)
+		caol = False
+		riail = 'aill'
+	elif briathar.endswith('ill') and uimhir == 2:
+		fréamh = re.sub(r"n?ill$", 'l', briathar)
+		caol = True
+		riail = 'ill'
+	elif reimnigh.comhair_siollaí(briathar) > 1 and not reimnigh.deireadh_fada(briathar) \
+			and not re.match(r".+[eou]ir$", briathar) and not re.match(r".+[^a]ghair$", briathar):
+		fréamh = re.sub(r"^(.+[^aá])[a]?i(?:([lrns])|(gh))$", r"\1\2", briathar)
+		if briathar.endswith('igh'):
+			caol = briathar[-4] not in "aáoóuú"
+		elif re.match(r".*[^á]i[lrns]$", briathar):
+			caol = briathar[-3] not in "aáoóuú"
+		else:
+			caol = reimnigh.guta_deireanach(briathar) in "eéií"
+		riail = 'coimriú'
+	else:
+		fréamh = briathar
+		caol = reimnigh.guta_deireanach(briathar) in "eéií"
+		riail = 'gan_athrú'
+
+	return reimnigh.Anailís(briathar, fréamh, caol, uimhir,
+	                        deireadh_áil=briathar.endswith('áil'),
+	                        deireadh_iaigh=briathar.endswith('iaigh'),
+	                        deireadh_igh_fada=briathar.endswith('igh') and reimnigh.deireadh_fada(briathar),
+	                        deireadh_uaigh=briathar.endswith('uaigh'),
+	                        riail=riail)
+
+
+# what a function gives for a verb, or the type of exception it raises for strings that aren't verbs
+def toradh_nó_earráid(gníomh, *argóintí):
+	try:
+		return gníomh(*argóintí)
+	except Exception as e:
+		return type(e)
+
+
+class AnailísTests(unittest.TestCase):
+	def test_stems(self):
+		self.assertEqual(("beann", False), reimnigh.anailísigh("beannaigh", 2)[1:3])
+		self.assertEqual(("sábhál", False), reimnigh.anailísigh("sábháil", 1)[1:3])
+		self.assertEqual(("eitl", True), reimnigh.anailísigh("eitil", 2)[1:3])
+		self.assertEqual(("bris", True), reimnigh.anailísigh("bris", 1)[1:3])
+
+	def test_endings(self):
+		self.assertEqual(2, reimnigh.cén_aicme("foghail"))
+		self.assertEqual(1, reimnigh.cén_aicme("foghair"))  # .+[^a]ghair
+		self.assertEqual(2, reimnigh.cén_aicme("taghair"))
+		self.assertEqual(1, reimnigh.cén_aicme("tógáil"))
+		self.assertEqual("áil", reimnigh.anailísigh("tógáil", 1).riail)
+		self.assertEqual("gan_athrú", reimnigh.anailísigh("ordháil", 1).riail)
+		self.assertEqual("gan_athrú", reimnigh.anailísigh("páin", 1).riail)  # needs a letter before it
+		self.assertEqual({'+[^a]ghair', '[^á]ir', 'ir'}, reimnigh.próifíl("foghair").deirí)
+
+	# the decision tables should give exactly what the old cascade of tests did, for the verbs in briathra.txt
+	# and for every ending the tables look at after a range of beginnings
+	def test_same_as_cascade(self):
+		with open("briathra.txt", encoding='utf-8') as comhad:
+			briathra = set(reimnigh.léigh_briathra(comhad))
+		tosaithe = ["", "b", "a", "ó", "br", "ba", "bea", "éa", "ord", "fogh", "cá", "tóg", "sábh", "ceann", "oscai",
+		            "imi", "dí", "bua", "foghlu", "tarr", "ath", "scrí"]
+		deirí = ["igh", "ígh", "aigh", "iaigh", "uaigh", "uigh", "éigh", "áil", "ail", "dháil", "páin", "peáin", "áin",
+		         "aic", "aid", "ic", "aill", "dhaill", "nill", "ill", "il", "ir", "in", "is", "ing", "eir", "oir", "uir",
+		         "ghair", "aghair", "áir", "éis", "ál", "s", "g", "ó", "eo", "ú"]
+		briathra.update(tús + deireadh for tús in tosaithe for deireadh in deirí)
+		briathra.discard("")
+		for briathar in sorted(briathra):
+			aicme = toradh_nó_earráid(sean_cén_aicme, briathar)
+			with self.subTest(briathar=briathar):
+				self.assertEqual(aicme, toradh_nó_earráid(reimnigh.cén_aicme, briathar))
+				for uimhir in (1, 2):
+					self.assertEqual(toradh_nó_earráid(sean_anailísigh, briathar, uimhir),
+					                 toradh_nó_earráid(reimnigh.anailísigh, briathar, uimhir))
+
+	def test_cached(self):
+		reimnigh.anailísigh.cache_clear()
+		reimnigh.réimnigh("ceannaigh")
+		reimnigh.réimnigh("ceannaigh")
+		eolas = reimnigh.anailísigh.cache_info()
+		self.assertEqual(1, eolas.misses)
+		self.assertEqual(1, eolas.hits)
+
+
+class CorpasTests(unittest.TestCase):
+	# the verbs the benchmarks use should include every conjugation
+	def test_every_class(self):
+		with open("briathra.txt", encoding='utf-8') as comhad:
+			aicmí = {reimnigh.cén_aicme(b) for b in reimnigh.léigh_briathra(comhad)}
+		self.assertEqual(set(reimnigh.faigh_rialacha()), aicmí)
+
+
+class IonstraimTests(unittest.TestCase):
+	def tearDown(self):
+		reimnigh.stop_ionstraim()
+
+	def test_off_by_default(self):
+		self.assertIsNone(reimnigh.ionstraim)
+		reimnigh.réimnigh("bris")
+		self.assertIsNone(reimnigh.ionstraim)
+
+	# every way of finding a stem should be used by some verb in briathra.txt
+	def test_every_stem_rule(self):
+		ionstr = reimnigh.tosaigh_ionstraim()
+		with open("briathra.txt", encoding='utf-8') as comhad:
+			briathra = list(reimnigh.léigh_briathra(comhad))
+		list(reimnigh.réimnigh_iomlán(briathra))
+		rialacha = reimnigh.stop_ionstraim().mar_json()['rialacha']
+		self.assertEqual({'igh', 'áil', 'áin', 'aic', 'aill', 'ill', 'coimriú', 'gan_athrú'}, set(rialacha['fréamh']))
+		# irregular verbs are looked up rather than having their stem found
+		self.assertEqual(len([b for b in briathra if b not in reimnigh.briathra_neamhrialta]), sum(rialacha['fréamh'].values()))
+		self.assertIn('réimniú', ionstr.céimeanna)
+
+	def test_prometheus(self):
+		ionstr = reimnigh.tosaigh_ionstraim()
+		reimnigh.réimnigh("oscail", [reimnigh.FoghaAimsire.chaite])
+		téacs = ionstr.mar_prometheus()
+		self.assertIn('reimnigh_rule_total{kind="fréamh",rule="coimriú"} 1\n', téacs)
+		self.assertIn("reimnigh_rule_total{kind=\"claochlú\",rule=\"d'\"} ", téacs)
+
+
+class IomlánTests(unittest.TestCase):
+	def test_same_as_single(self):
+		briathra = ["bris", "beannaigh", "sábháil", "ceannaigh", "oscail", "glan", "éirigh"]
+		aimsirí = [reimnigh.FoghaAimsire.fháistineach, reimnigh.FoghaAimsire.chaite]
+		toradh = list(reimnigh.réimnigh_iomlán(iter(briathra), aimsirí, mumhan=True, méid_baisce=3))
+		self.assertEqual([reimnigh.réimnigh(b, aimsirí, mumhan=True) for b in briathra], toradh)
+
+
+class BulcTests(unittest.TestCase):
+	def test_same_as_serial(self):
+		briathra = ["bris", "beannaigh", "sábháil", "ceannaigh", "oscail", "glan", "éirigh"] * 5
+		toradh = list(reimnigh.réimnigh_bulc(briathra, mumhan=True, próisis=2, méid_smutáin=4))
+		self.assertEqual(list(reimnigh.réimnigh_iomlán(briathra, mumhan=True)), toradh)
+
+	# reading from a pipe, each verb's results should be written as soon as the verb is read, not after the next one
+	def test_stream(self):
+		with subprocess.Popen([sys.executable, "reimnigh.py", "--jobs", "2", "--format", "jsonl"], stdin=subprocess.PIPE,
+		                      stdout=subprocess.PIPE, encoding='utf-8') as próiseas:
+			try:
+				próiseas.stdin.write("bris\n")
+				próiseas.stdin.flush()
+				réidh, _, _ = select.select([próiseas.stdout], [], [], 30)
+				self.assertTrue(réidh, "nothing written for a verb while stdin was still open")
+				self.assertEqual("bris", json.loads(próiseas.stdout.readline())['verb'])
+			finally:
+				próiseas.stdin.close()
+		self.assertEqual(0, próiseas.returncode)
+
+
+class SnáitheannaTests(unittest.TestCase):
+	def setUp(self):
+		with open("briathra.txt", encoding='utf-8') as comhad:
+			self.briathra = list(reimnigh.léigh_briathra(comhad))
+
+	def test_same_as_serial(self):
+		briathra = self.briathra
+		for roghanna in {'mumhan': True}, {'aibhsigh': True}, {'canúintí': True}:
+			with self.subTest(**roghanna):
+				self.assertEqual(list(reimnigh.réimnigh_iomlán(briathra, **roghanna)),
+				                 list(reimnigh.réimnigh_snáitheanna(briathra, snáitheanna=4, méid_smutáin=7, **roghanna)))
+
+	# many threads conjugating at once from the moment the rules are first needed, switching between them
+	# as often as possible, should get exactly what one thread does
+	def test_stress(self):
+		líon = 8
+		A, P, F = reimnigh.FoghaAimsire, reimnigh.FoghaPearsan, reimnigh.FoghaFoirme
+		briathra = self.briathra[::5] + list(reimnigh.briathra_neamhrialta)
+		serial = {b: (reimnigh.réimnigh(b, mumhan=True), reimnigh.réimnigh_canúintí(b, aibhsigh=True),
+		              reimnigh.réimnigh_cill(b, A.fháistineach, P.tríú_iorla, F.dhiúltach)) for b in briathra}
+		paraidím = reimnigh.Paraidím("beannaigh")
+		bacainn = Barrier(líon)
+
+		def obair(i):
+			bacainn.wait()
+			rialacha = reimnigh.faigh_rialacha()
+			torthaí = {b: (reimnigh.réimnigh(b, mumhan=True), reimnigh.réimnigh_canúintí(b, aibhsigh=True),
+			               reimnigh.réimnigh_cill(b, A.fháistineach, P.tríú_iorla, F.dhiúltach))
+			           for b in briathra[i:] + briathra[:i]}
+			return rialacha, torthaí, [paraidím[a, p, F.dhearfach] for a in A for p in P]
+
+		eatramh = sys.getswitchinterval()
+		sys.setswitchinterval(1e-5)
+		try:
+			with mock.patch.object(reimnigh, '_rialacha', None), mock.patch.object(reimnigh, '_neamhrialta', None):
+				with ThreadPoolExecutor(líon) as linn:
+					torthaí = list(linn.map(obair, range(líon)))
+		finally:
+			sys.setswitchinterval(eatramh)
+		for rialacha, toradh, foirmeacha in torthaí:
+			self.assertIs(torthaí[0][0], rialacha)
+			self.assertEqual(serial, toradh)
+			self.assertEqual([reimnigh.réimnigh_cill("beannaigh", a, p, F.dhearfach) for a in A for p in P], foirmeacha)
+
+	def test_forms_frozen(self):
+		leagan = reimnigh.réimnigh_cill("feic", reimnigh.FoghaAimsire.chaite, reimnigh.FoghaPearsan.céad_uatha,
+		                                reimnigh.FoghaFoirme.dhearfach, aibhsigh=True)
+		with self.assertRaises(AttributeError):
+			leagan.míreanna = ()
+		with self.assertRaises(AttributeError):
+			leagan.eile = 1
+
+
+class CanúintíTests(unittest.TestCase):
+	# both dialects at once should be the same as each one on its own, for verbs of every kind
+	def test_same_as_each_dialect(self):
+		with open("briathra.txt", encoding='utf-8') as comhad:
+			briathra = list(reimnigh.léigh_briathra(comhad))
+		for briathar, toradh in zip(briathra, reimnigh.réimnigh_iomlán(briathra, canúintí=True)):
+			with self.subTest(briathar=briathar):
+				for canúint, mumhan in ('caighdeánach', False), ('mumhan', True):
+					self.assertEqual(reimnigh.réimnigh(briathar, mumhan=mumhan),
+					                 [{'ainm': a['ainm'], 'pearsana': [[getattr(l, canúint) for l in ró] for ró in a['pearsana']]}
+					                  for a in toradh])
+				for a in toradh:
+					for ró in a['pearsana']:
+						for l in ró:
+							self.assertEqual(l.caighdeánach != l.mumhan, l.difriúil)
+
+	def test_records(self):
+		from io import StringIO
+		A, P = reimnigh.FoghaAimsire, reimnigh.FoghaPearsan
+		toradh = reimnigh.réimnigh_canúintí("eitil", [A.chaite], [P.céad_uatha, P.tríú_uatha])
+		self.assertEqual(reimnigh.LeaganCanúna("d'eitil mé", "d'eitlíos", True), toradh[0]['pearsana'][0][0])
+		self.assertEqual(reimnigh.LeaganCanúna("níor eitil sí/sé", "níor eitil sí/sé", False), toradh[0]['pearsana'][1][1])
+		plean = reimnigh.cén_réimniú("eitil").pleanáil_canúintí([A.chaite], [P.céad_uatha, P.tríú_uatha], reimnigh.FoghaFoirme)
+		aschur = StringIO()
+		reimnigh.scríobh_jsonl_canúintí(reimnigh.taifid_canúintí("eitil", toradh, plean), aschur)
+		self.assertEqual({"verb": "eitil", "tense": "chaite", "person": "céad_uatha", "polarity": "dhearfach",
+		                  "form": "d'eitil mé", "form_munster": "d'eitlíos", "differs": True},
+		                 json.loads(aschur.getvalue().splitlines()[0]))
+
+
+class NeamhrialtaTests(unittest.TestCase):
+	def test_forms(self):
+		A, P, F = reimnigh.FoghaAimsire, reimnigh.FoghaPearsan, reimnigh.FoghaFoirme
+		cill = reimnigh.réimnigh_cill
+		self.assertEqual("chonaic mé", cill("feic", A.chaite, P.céad_uatha, F.dhearfach))
+		self.assertEqual("ní fhacamar", cill("feic", A.chaite, P.céad_iorla, F.dhiúltach))
+		self.assertEqual("an bhfacthas", cill("feic", A.chaite, P.briathar_saor, F.cheisteach))
+		self.assertEqual("do chonac", cill("feic", A.chaite, P.céad_uatha, F.dhearfach, mumhan=True))
+		self.assertEqual("chím", cill("feic", A.láithreach, P.céad_uatha, F.dhearfach, mumhan=True))
+		self.assertEqual("níl siad", cill("bí", A.láithreach, P.tríú_iorla, F.dhiúltach))
+		self.assertEqual("an bhfuil tú", cill("bí", A.láithreach, P.dara_uatha, F.cheisteach))
+		self.assertEqual("ní bhfaighidh mé", cill("faigh", A.fháistineach, P.céad_uatha, F.dhiúltach))
+		self.assertEqual("ní déarfaidh sí/sé", cill("abair", A.fháistineach, P.tríú_uatha, F.dhiúltach))
+		self.assertEqual("ná habair", cill("abair", A.ordaitheach, P.dara_uatha, F.dhiúltach))
+		self.assertEqual("níor tháinig sibh", cill("tar", A.chaite, P.dara_iorla, F.dhiúltach))
+		self.assertEqual("níor tugadh", cill("tabhair", A.chaite, P.briathar_saor, F.dhiúltach))
+		self.assertEqual("itheadh", cill("ith", A.chaite, P.briathar_saor, F.dhearfach))
+		self.assertEqual("go n-ithe mé", cill("ith", A.foshuiteach, P.céad_uatha, F.dhearfach))
+		self.assertIsNone(cill("téigh", A.foshuiteach, P.céad_uatha, F.cheisteach))
+
+	def test_looked_up_first(self):
+		feic = reimnigh.cén_réimniú("feic")
+		self.assertIsInstance(feic, reimnigh.BriatharNeamhrialta)
+		self.assertIs(feic, reimnigh.cén_réimniú("feic"))
+		self.assertNotIsInstance(reimnigh.cén_réimniú("feicim"), reimnigh.BriatharNeamhrialta)
+		leagan = reimnigh.réimnigh_cill("feic", reimnigh.FoghaAimsire.chaite, reimnigh.FoghaPearsan.céad_uatha,
+		                                reimnigh.FoghaFoirme.dhiúltach, aibhsigh=True)
+		self.assertEqual({'mír': "ní", 'réimír': "", 'céad_litir': "f", 'séimhiú': "h", 'fréamh': "aca", 'deireadh': "",
+		                  'forainm': "mé"}, {cineál: leagan[tús:críoch] for cineál, tús, críoch in leagan.míreanna})
+
+	# every way of conjugating gives the same forms from the table
+	def test_same_everywhere(self):
+		briathra = list(reimnigh.briathra_neamhrialta) + ["bris"]
+		aimsirí = [reimnigh.FoghaAimsire.chaite, reimnigh.FoghaAimsire.láithreach]
+		for mumhan in False, True:
+			self.assertEqual([reimnigh.réimnigh(b, aimsirí, mumhan=mumhan) for b in briathra],
+			                 list(reimnigh.réimnigh_iomlán(briathra, aimsirí, mumhan=mumhan, méid_baisce=5)))
+		for briathar, toradh in zip(briathra, reimnigh.réimnigh_iomlán(briathra, canúintí=True, aibhsigh=True)):
+			self.assertEqual(reimnigh.réimnigh_canúintí(briathar, aibhsigh=True), toradh)
+			self.assertEqual(reimnigh.réimnigh(briathar, mumhan=True), [
+				{'ainm': a['ainm'], 'pearsana': [[l.mumhan for l in ró] for ró in a['pearsana']]} for a in toradh])
+		paraidím = reimnigh.Paraidím("téigh")
+		self.assertEqual("rachaidh mé", paraidím[reimnigh.FoghaAimsire.fháistineach, reimnigh.FoghaPearsan.céad_uatha,
+		                                         reimnigh.FoghaFoirme.dhearfach])
+
+	def test_every_form(self):
+		for briathar in reimnigh.briathra_neamhrialta:
+			for uimhir in range(reimnigh.líon_ceall):
+				a, p, f, mumhan = reimnigh.cill(uimhir)
+				leagan = reimnigh.réimnigh_cill(briathar, a, p, f, mumhan)
+				with self.subTest(briathar=briathar, a=a, p=p, f=f, mumhan=mumhan):
+					# the same forms are there as for regular verbs
+					self.assertEqual(reimnigh.réimnigh_cill("bris", a, p, f, mumhan) is None, leagan is None)
+					if leagan is not None:
+						self.assertNotIn("+", leagan)
+
+
+class TaifeadTests(unittest.TestCase):
+	def test_jsonl(self):
+		from io import StringIO
+		aimsirí = [reimnigh.FoghaAimsire.foshuiteach]
+		pearsana = [reimnigh.FoghaPearsan.céad_uatha]
+		plean = reimnigh.cén_réimniú("bris").pleanáil(aimsirí, pearsana, reimnigh.FoghaFoirme, False)
+		toradh = reimnigh.réimnigh("bris", aimsirí, pearsana)
+		aschur = StringIO()
+		reimnigh.scríobh_jsonl(reimnigh.taifid("bris", toradh, plean, False), aschur)
+		línte = [json.loads(líne) for líne in aschur.getvalue().splitlines()]
+		# there's no interrogative subjunctive
+		self.assertEqual(["dhearfach", "dhiúltach"], [líne['polarity'] for líne in línte])
+		self.assertEqual({"verb": "bris", "tense": "foshuiteach", "person": "céad_uatha", "polarity": "dhiúltach",
+		                  "dialect": "caighdeánach", "form": "nár bhrise mé"}, línte[1])
+
+
+class RindreáilTests(unittest.TestCase):
+	def test_parts(self):
+		leagan = reimnigh.réimnigh_cill("bris", reimnigh.FoghaAimsire.fháistineach, reimnigh.FoghaPearsan.tríú_iorla,
+		                                reimnigh.FoghaFoirme.dhiúltach, aibhsigh=True)
+		self.assertEqual("ní bhrisfidh siad", leagan)
+		self.assertEqual({'mír': "ní", 'réimír': "", 'céad_litir': "b", 'séimhiú': "h", 'fréamh': "ris", 'deireadh': "fidh",
+		                  'forainm': "siad"}, {cineál: leagan[tús:críoch] for cineál, tús, críoch in leagan.míreanna})
+		self.assertEqual("ní b<span class=\"séimhiú\">h</span>ris<span class=\"deireadh\">fidh</span> "
+		                 "<span class=\"forainm\">siad</span>", reimnigh.rindreáil_html(leagan))
+		self.assertEqual("ní bhrisfidh siad", reimnigh.neamhaibhsigh(reimnigh.rindreáil_ansi(leagan)))
+		self.assertEqual("ní bhrisfidh siad", reimnigh.rindreáil_téacs(leagan))
+
+
+class CillTests(unittest.TestCase):
+	def test_single_form(self):
+		A, P, F = reimnigh.FoghaAimsire, reimnigh.FoghaPearsan, reimnigh.FoghaFoirme
+		self.assertEqual("d'eitil mé", reimnigh.réimnigh_cill("eitil", A.chaite, P.céad_uatha, F.dhearfach))
+		self.assertEqual("d'eitlíos", reimnigh.réimnigh_cill("eitil", A.chaite, P.céad_uatha, F.dhearfach, mumhan=True))
+		self.assertIsNone(reimnigh.réimnigh_cill("eitil", A.foshuiteach, P.céad_uatha, F.cheisteach))
+
+	def test_lazy_paradigm(self):
+		A, P, F = reimnigh.FoghaAimsire, reimnigh.FoghaPearsan, reimnigh.FoghaFoirme
+		paraidím = reimnigh.Paraidím("beannaigh")
+		self.assertEqual({}, paraidím._cealla)
+		self.assertEqual("an mbeannóidh siad", paraidím[A.fháistineach, P.tríú_iorla, F.cheisteach])
+		self.assertEqual(1, len(paraidím._cealla))
+		self.assertIs(paraidím[A.fháistineach, P.tríú_iorla, F.cheisteach], paraidím[A.fháistineach, P.tríú_iorla, F.cheisteach])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+from os import path
+import tempfile
+import unittest
+from unittest import mock
+import reimnigh
+from reimnigh import FoghaAimsire
+from taisce import Taisce
+
+
+class TaisceTests(unittest.TestCase):
+	def setUp(self):
+		self.fillteán = tempfile.TemporaryDirectory()
+		self.cosán = path.join(self.fillteán.name, "taisce.sqlite")
+
+	def tearDown(self):
+		self.fillteán.cleanup()
+
+	def test_same_as_reimnigh(self):
+		briathra = ["bris", "beannaigh", "bris", "imir"]
+		with Taisce(self.cosán) as taisce:
+			for _ in range(2):
+				self.assertEqual(list(reimnigh.réimnigh_bulc(briathra, próisis=1)),
+				                 list(taisce.réimnigh_bulc(briathra, próisis=1, méid_baisce=3)))
+			self.assertEqual(reimnigh.réimnigh("glan", [FoghaAimsire.chaite], mumhan=True),
+			                 taisce.réimnigh("glan", [FoghaAimsire.chaite], mumhan=True))
+			leagan = taisce.réimnigh("glan", aibhsigh=True)[0]['pearsana'][0][0]
+			self.assertEqual(reimnigh.réimnigh("glan", aibhsigh=True)[0]['pearsana'][0][0].míreanna, leagan.míreanna)
+			# the second lot of verbs were all found, bar "bris" being asked for twice in the first batch
+			self.assertEqual({'aimsithe': 5, 'caillte': 5, 'díbeartha': 0},
+			                 {k: v for k, v in taisce.staitisticí().items() if k in ('aimsithe', 'caillte', 'díbeartha')})
+
+		with Taisce(self.cosán) as taisce:
+			taisce.réimnigh("bris")
+			staitisticí = taisce.staitisticí()
+		self.assertEqual({'aimsithe': 6, 'caillte': 5, 'díbeartha': 0}, staitisticí['iomlán'])
+		self.assertEqual(5, staitisticí['torthaí'])
+
+	def test_rules_changed(self):
+		with Taisce(self.cosán) as taisce:
+			taisce.réimnigh("bris")
+			with mock.patch.object(reimnigh, 'méarlorg_rialacha', return_value="eile"):
+				taisce.réimnigh("bris")
+			self.assertEqual(2, taisce.caillte)
+
+	def test_eviction(self):
+		with Taisce(self.cosán, uasmhéid=10) as taisce:
+			briathra = [f"bris{'a' * i}" for i in range(11)]
+			list(taisce.réimnigh_bulc(briathra[:5], próisis=1))
+			list(taisce.réimnigh_bulc(briathra[5:], próisis=1))
+			self.assertEqual(9, taisce.staitisticí()['torthaí'])
+			self.assertEqual(2, taisce.díbeartha)
+			# the least recently used went first
+			list(taisce.réimnigh_bulc(briathra[5:], próisis=1))
+			self.assertEqual(11, taisce.caillte)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# © 2020 Caoimhe Ní Chaoimh
+# CC BY-NC-SA 4.0
+
+# Load generator for freastalai.py
+# Keeps a number of connections busy sending requests and reports throughput and latency percentiles.
+#
+#   python freastalai.py --port 8080 &
+#   python ualach.py --port 8080 --naisc 16 --iarratais 2000
+
+import asyncio
+from time import perf_counter
+from urllib.parse import urlencode
+from tagarmharc import briathra, peircintíl
+
+
+# send requests one after another on a single keep-alive connection, recording how long each one took
+async def nasc(óstach: str, port: int, iarratais: list, amanna: list):
+	léitheoir, scríbhneoir = await asyncio.open_connection(óstach, port)
+	try:
+		for iarratas in iarratais:
+			tús = perf_counter()
+			scríbhneoir.write(f"GET /reimnigh?{urlencode(iarratas, doseq=True)} HTTP/1.1\r\nHost: {óstach}\r\n\r\n"
+			                  .encode('latin-1'))
+			await scríbhneoir.drain()
+			stádas = await léitheoir.readline()
+			fad = 0
+			while True:
+				líne = await léitheoir.readline()
+				if líne in (b"\r\n", b""):
+					break
+				if líne.lower().startswith(b"content-length:"):
+					fad = int(líne.split(b":")[1])
+			await léitheoir.readexactly(fad)
+			if not stádas.startswith(b"HTTP/1.1 200"):
+				raise RuntimeError(f"{iarratas}: {stádas.decode('latin-1').strip()}")
+			amanna.append(perf_counter() - tús)
+	finally:
+		scríbhneoir.close()
+
+
+async def rith(óstach: str, port: int, naisc: int, líon: int, iomlán: bool):
+	iarratais = []
+	for i in range(líon):
+		iarratas = {'briathar': briathra[i % len(briathra)], 'mumhan': i // len(briathra) % 2}
+		if not iomlán:
+			iarratas.update(aimsir='láithreach', pearsa='céad_iorla', foirm='cheisteach')
+		iarratais.append(iarratas)
+
+	amanna = []
+	tús = perf_counter()
+	await asyncio.gather(*(nasc(óstach, port, iarratais[i::naisc], amanna) for i in range(naisc)))
+	am = perf_counter() - tús
+
+	amanna.sort()
+	print(f"{len(amanna)} requests over {naisc} connections in {am:.2f} s: {len(amanna) / am:.0f} requests/s")
+	print("latency " + ", ".join(f"p{p}: {peircintíl(amanna, p) * 1000:.2f} ms" for p in (50, 90, 99))
+	      + f", max: {amanna[-1] * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+	from argparse import ArgumentParser
+
+	parser = ArgumentParser()
+	parser.add_argument('--óstach', default='127.0.0.1')
+	parser.add_argument('--port', type=int, default=8080)
+	parser.add_argument('--naisc', type=int, default=8, help='líon na naisc ag an am céanna')
+	parser.add_argument('--iarratais', type=int, default=1000, help='líon na n-iarratas ar fad')
+	parser.add_argument('--iomlán', action='store_true', help='iarrtar gach foirm de gach briathar seachas foirm amháin')
+	args = parser.parse_args()
+
+	asyncio.run(rith(args.óstach, args.port, args.naisc, args.iarratais, args.iomlán))